@@ -0,0 +1,231 @@
+"""
+Batch verification for bulk claim ingestion.
+
+Compared with calling run_pipeline once per item:
+- identical and near-identical inputs are verified once (normalize_text +
+  hybrid_similarity), both on the raw text and again after extraction
+- extraction and AI analysis are packed into multi-claim Gemini prompts of
+  up to BATCH_LLM_CHUNK claims each
+- source fetches for every claim go through the shared tool and page
+  caches, so a fact-checker homepage is downloaded once for the whole batch
+"""
+
+import asyncio
+import logging
+import os
+import time
+from typing import Dict, List, Optional
+
+from app.agents.extractor_agent import extract_claims
+from app.agents.research_agent import analyze_batch_with_gemini
+from app.agents.verification_agent import (
+    gather_sources, combine_search_results, select_evidence, build_verification_results, verification_error
+)
+from app.agents.pipeline import complete_claim, build_response
+from app.models import CLAIM_MIN_LENGTH, CLAIM_MAX_LENGTH
+from app.utils.preprocess import clean_text, normalize_text
+from app.utils.similarity import hybrid_similarity, jaccard_matrix, number_tokens
+from app.utils.verdict_cache import verdict_cache, VERDICT_CACHE_ENABLED
+
+logger = logging.getLogger(__name__)
+
+BATCH_LLM_CHUNK = int(os.getenv("BATCH_LLM_CHUNK", "10"))
+BATCH_CONCURRENCY = int(os.getenv("BATCH_CONCURRENCY", "8"))
+BATCH_DEDUPE_SIMILARITY = float(os.getenv("BATCH_DEDUPE_SIMILARITY", "0.9"))
+
+
+def group_duplicates(texts: List[str], threshold: float = BATCH_DEDUPE_SIMILARITY) -> List[int]:
+    """
+    Groups identical or near-identical texts.
+
+    Args:
+        texts: Texts to group
+        threshold: Minimum hybrid_similarity for two texts to be duplicates
+
+    Returns:
+        For each text, the index of the first text in its group
+
+    Near-duplicates must also mention the same numbers: "5 people died" and
+    "50 people died" are different claims however similar the wording.
+    """
+    keys = [normalize_text(text) for text in texts]
+    unique = list(dict.fromkeys(keys))
+    # hybrid >= threshold needs jaccard >= (threshold - 0.7) / 0.3, so one
+    # matrix product rules out most pairs before any SequenceMatcher run
+    jaccard = jaccard_matrix(unique, unique)
+    min_jaccard = (threshold - 0.7) / 0.3
+
+    representatives = []  # (index, unique position, normalized text, numbers)
+    seen = {}
+    owners = []
+
+    for idx, key in enumerate(keys):
+        if key not in seen:
+            position = len(seen)
+            numbers = number_tokens(key)
+            seen[key] = next(
+                (
+                    rep_idx for rep_idx, rep_position, rep_key, rep_numbers in representatives
+                    if rep_numbers == numbers
+                    and jaccard[position, rep_position] >= min_jaccard - 1e-6
+                    and hybrid_similarity(key, rep_key) >= threshold
+                ),
+                idx
+            )
+            if seen[key] == idx:
+                representatives.append((idx, position, key, numbers))
+        owners.append(seen[key])
+
+    return owners
+
+
+def claim_error(claim: str) -> Optional[str]:
+    """Why a batch item cannot be verified (the /verify length limits), or None."""
+    if len(claim.strip()) < CLAIM_MIN_LENGTH:
+        return f"Claim must be at least {CLAIM_MIN_LENGTH} characters long"
+    if len(claim) > CLAIM_MAX_LENGTH:
+        return f"Claim must be at most {CLAIM_MAX_LENGTH} characters long"
+    return None
+
+
+def _chunks(items: list, size: int) -> List[list]:
+    return [items[start:start + size] for start in range(0, len(items), max(1, size))]
+
+
+async def _extract_all(claims: List[str], indices: List[int]) -> Dict[int, str]:
+    chunks = _chunks(indices, BATCH_LLM_CHUNK)
+    outputs = await asyncio.gather(*(extract_claims([claims[idx] for idx in chunk]) for chunk in chunks))
+    return {idx: extracted for chunk, output in zip(chunks, outputs) for idx, extracted in zip(chunk, output)}
+
+
+async def _verify_all(extracted: Dict[int, str], indices: List[int]) -> Dict[int, dict]:
+    """Fetches sources per claim, then analyzes the claims in multi-claim prompts."""
+    slots = asyncio.Semaphore(BATCH_CONCURRENCY)
+
+    async def evidence(idx: int):
+        async with slots:
+            cleaned_claim = clean_text(extracted[idx])
+            source_results = await gather_sources(cleaned_claim)
+            search = combine_search_results(source_results)
+            return cleaned_claim, source_results, search, select_evidence(cleaned_claim, search)
+
+    gathered = await asyncio.gather(*(evidence(idx) for idx in indices), return_exceptions=True)
+
+    verification = {}
+    ready = []
+    for idx, outcome in zip(indices, gathered):
+        if isinstance(outcome, Exception):
+            verification[idx] = verification_error(extracted[idx], outcome)
+        else:
+            ready.append((idx, outcome))
+
+    chunks = _chunks(ready, BATCH_LLM_CHUNK)
+    analyses = await asyncio.gather(*(
+        analyze_batch_with_gemini([(cleaned_claim, evidence) for _, (cleaned_claim, _, _, evidence) in chunk])
+        for chunk in chunks
+    ))
+    for chunk, chunk_analyses in zip(chunks, analyses):
+        for (idx, (cleaned_claim, source_results, search, evidence)), ai_analysis in zip(chunk, chunk_analyses):
+            verification[idx] = build_verification_results(
+                extracted[idx], cleaned_claim, source_results, search, ai_analysis, evidence
+            )
+
+    return verification
+
+
+async def run_batch(claims: List[str]) -> dict:
+    """
+    Verifies many claims at once.
+
+    Args:
+        claims: Raw user inputs
+
+    Returns:
+        Dictionary with per-item results (in input order) and dedupe counts.
+        Each item has "index", "response" (VerifyResponse or None), "error",
+        "status_code", "cache_hit" and "duplicate_of" (index of the item whose
+        verification was reused, if any). Items outside the claim length
+        limits get a 422 error of their own; the rest are still verified
+    """
+    started = time.perf_counter()
+
+    invalid = {idx: error for idx, claim in enumerate(claims) if (error := claim_error(claim))}
+    valid = [idx for idx in range(len(claims)) if idx not in invalid]
+
+    # Dedupe raw inputs, then extract each distinct input once
+    input_owner = {
+        idx: valid[owner_pos]
+        for idx, owner_pos in zip(valid, group_duplicates([claims[idx] for idx in valid]) if valid else [])
+    }
+    unique_inputs = sorted(set(input_owner.values()))
+    extracted = await _extract_all(claims, unique_inputs)
+
+    # Different wordings often extract to the same claim: dedupe again
+    with_claim = [idx for idx in unique_inputs if extracted[idx] and extracted[idx].strip()]
+    claim_owner = {}
+    for idx, owner_pos in zip(with_claim, group_duplicates([extracted[idx] for idx in with_claim])):
+        claim_owner[idx] = with_claim[owner_pos]
+    unique_claims = sorted(set(claim_owner.values()))
+    logger.info(f"📦 Batch: {len(claims)} items, {len(unique_inputs)} distinct inputs, {len(unique_claims)} distinct claims")
+
+    # Verdict cache first, full verification for the rest
+    outcomes: Dict[int, dict] = {}
+    misses = []
+    for idx in unique_claims:
+        cached = await verdict_cache.get(extracted[idx]) if VERDICT_CACHE_ENABLED else None
+        if cached is not None:
+            outcomes[idx] = {
+                "verdict_data": cached["verdict_data"],
+                "explanation_data": cached["explanation_data"],
+                "cache_hit": True
+            }
+        else:
+            misses.append(idx)
+
+    verification = await _verify_all(extracted, misses)
+
+    slots = asyncio.Semaphore(BATCH_CONCURRENCY)
+
+    async def finish(idx: int):
+        async with slots:
+            return await complete_claim(claims[idx], extracted[idx], verification[idx], started)
+
+    finished = await asyncio.gather(*(finish(idx) for idx in misses), return_exceptions=True)
+    for idx, outcome in zip(misses, finished):
+        if isinstance(outcome, Exception):
+            logger.error(f"❌ Batch item failed: {str(outcome)}")
+            outcomes[idx] = {"error": f"Verification failed: {str(outcome)}", "status_code": 500}
+        else:
+            verdict_data, explanation_data = outcome
+            outcomes[idx] = {"verdict_data": verdict_data, "explanation_data": explanation_data, "cache_hit": False}
+
+    # Fan results back out to every item
+    results = []
+    for idx, claim in enumerate(claims):
+        input_rep = input_owner.get(idx)
+        claim_rep: Optional[int] = claim_owner.get(input_rep)
+        item = {"index": idx, "response": None, "error": None, "status_code": 200, "cache_hit": False, "duplicate_of": None}
+
+        if idx in invalid:
+            item.update(error=invalid[idx], status_code=422)
+        elif claim_rep is None:
+            item.update(error="No verifiable claim found in input", status_code=422)
+        else:
+            outcome = outcomes[claim_rep]
+            if claim_rep != idx:
+                item["duplicate_of"] = claim_rep
+            if "error" in outcome:
+                item.update(error=outcome["error"], status_code=outcome["status_code"])
+            else:
+                item["cache_hit"] = outcome["cache_hit"]
+                item["response"] = build_response(
+                    claim, extracted[input_rep], outcome["verdict_data"], outcome["explanation_data"]
+                )
+        results.append(item)
+
+    return {
+        "results": results,
+        "total": len(claims),
+        "unique_inputs": len(unique_inputs),
+        "unique_claims": len(unique_claims)
+    }
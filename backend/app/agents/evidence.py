@@ -0,0 +1,206 @@
+"""
+Evidence ranking.
+
+verify_claim merges the Indian fact-checkers, Google, DuckDuckGo and
+NewsAPI results in source order, and the analysis prompt only has room for
+a few of them: PromptBuilder (app.utils.prompt_builder) adds results in
+order while the token budget allows and splits the snippet budget by
+"evidence_score". rank_evidence decides which results and in what order:
+
+- URLs are canonicalized (scheme, "www."/"m." and AMP variants, tracking
+  parameters, fragments, trailing slashes) and repeats of a page are dropped
+- results whose title and snippet overlap an already chosen result by
+  EVIDENCE_DUPLICATE_SIMILARITY or more (syndicated copies, the same story
+  found by two engines) are collapsed
+- the rest are scored on relevance to the claim (share of the claim's
+  words present plus character-trigram cosine) and source credibility
+  (the tools' "credibility" tag, or the publishing domain), and the top
+  EVIDENCE_TOP_K are passed to the LLM
+- results below EVIDENCE_MIN_RELEVANCE are dropped, but never all of them:
+  word overlap cannot see a Hindi debunk of an English claim, so when
+  nothing clears the floor the best high-credibility result (or, without
+  one, the best result) is kept rather than sending the LLM no evidence
+"""
+
+import os
+from collections import defaultdict
+from typing import List, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+from app.utils.similarity import SimilarityCorpus, jaccard_matrix
+
+EVIDENCE_RANKING_ENABLED = os.getenv("EVIDENCE_RANKING_ENABLED", "true").lower() == "true"
+EVIDENCE_TOP_K = int(os.getenv("EVIDENCE_TOP_K", "5"))
+EVIDENCE_DUPLICATE_SIMILARITY = float(os.getenv("EVIDENCE_DUPLICATE_SIMILARITY", "0.8"))
+EVIDENCE_MIN_RELEVANCE = float(os.getenv("EVIDENCE_MIN_RELEVANCE", "0.1"))
+
+# Share of the score taken by relevance; the rest is credibility
+RELEVANCE_WEIGHT = 0.7
+
+CREDIBILITY_SCORES = {"high": 1.0, "medium": 0.6, "low": 0.2}
+UNKNOWN_CREDIBILITY = 0.3
+
+# Publishing domain -> credibility, for results the tools do not tag
+DOMAIN_CREDIBILITY = {
+    "factcheck.pib.gov.in": "high",
+    "altnews.in": "high",
+    "boomlive.in": "high",
+    "vishvasnews.com": "high",
+    "factly.in": "high",
+    "newschecker.in": "high",
+    "indiatoday.in": "medium",
+    "thequint.com": "medium",
+    "reuters.com": "high",
+    "apnews.com": "high",
+    "afp.com": "high",
+    "snopes.com": "high",
+    "politifact.com": "high",
+    "fullfact.org": "high",
+    "who.int": "high",
+    "bbc.com": "medium",
+    "bbc.co.uk": "medium",
+    "thehindu.com": "medium",
+    "indianexpress.com": "medium",
+    "hindustantimes.com": "medium",
+    "ndtv.com": "medium",
+    "timesofindia.indiatimes.com": "medium",
+    "livemint.com": "medium",
+    "scroll.in": "medium",
+}
+
+# Government domains (any subdomain)
+OFFICIAL_SUFFIXES = (".gov.in", ".nic.in", ".gov")
+
+_TRACKING_PARAMS = {"fbclid", "gclid", "igshid", "ref", "ref_src", "amp"}
+
+_stats = defaultdict(int)
+
+
+def canonical_url(url: str) -> str:
+    """
+    Canonical form of a result URL for duplicate detection.
+
+    Args:
+        url: URL as returned by a search tool
+
+    Returns:
+        "host/path?query": scheme dropped, lowercase host without "www."/"m.",
+        path without AMP suffixes or trailing slash, tracking parameters and
+        fragment removed (the URL unchanged if it cannot be parsed)
+    """
+    url = (url or "").strip()
+    try:
+        parts = urlsplit(url if "//" in url else f"//{url}")
+    except ValueError:
+        return url
+    host = parts.netloc.lower()
+    for prefix in ("www.", "m.", "amp."):
+        if host.startswith(prefix):
+            host = host[len(prefix):]
+    path = parts.path
+    for suffix in ("/amp", "/amp/", ".amp"):
+        if path.endswith(suffix):
+            path = path[:-len(suffix)]
+    path = path.rstrip("/")
+    query = urlencode(sorted(
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith("utm_") and key.lower() not in _TRACKING_PARAMS
+    ))
+    return f"{host}{path}?{query}" if query else f"{host}{path}"
+
+
+def source_credibility(result: dict) -> float:
+    """Credibility score in [0, 1] from the result's "credibility" tag or its domain."""
+    tag = result.get("credibility")
+    if tag in CREDIBILITY_SCORES:
+        return CREDIBILITY_SCORES[tag]
+
+    host = canonical_url(result.get("url", "")).split("/", 1)[0].split(":", 1)[0]
+    if host.endswith(OFFICIAL_SUFFIXES):
+        return CREDIBILITY_SCORES["high"]
+    while host:
+        if host in DOMAIN_CREDIBILITY:
+            return CREDIBILITY_SCORES[DOMAIN_CREDIBILITY[host]]
+        host = host.partition(".")[2]
+    return UNKNOWN_CREDIBILITY
+
+
+def rank_evidence(claim: str, results: list, k: Optional[int] = None) -> List[dict]:
+    """
+    Deduplicates search results and keeps the most relevant, credible ones.
+
+    Args:
+        claim: Cleaned claim
+        results: Combined search results (combine_search_results)
+        k: Maximum results kept (EVIDENCE_TOP_K by default)
+
+    Returns:
+        Up to k results, best first, each a copy of the original with
+        "relevance" and "evidence_score" added; at least one when results
+        is not empty and k > 0
+    """
+    k = EVIDENCE_TOP_K if k is None else k
+    _stats["rankings"] += 1
+    _stats["results_in"] += len(results)
+
+    # Repeats of the same page: keep the most credible copy (earliest on ties)
+    by_url = {}
+    for position, result in enumerate(results):
+        key = canonical_url(result.get("url", "")) or f"#{position}"
+        credibility = source_credibility(result)
+        if key not in by_url or credibility > by_url[key][1]:
+            by_url[key] = (result, credibility)
+    _stats["url_duplicates"] += len(results) - len(by_url)
+    if not by_url:
+        return []
+
+    unique = list(by_url.values())
+    texts = [f"{result.get('title', '')} {result.get('snippet', '')}" for result, _ in unique]
+    corpus = SimilarityCorpus(texts)
+    relevance = 0.5 * corpus.coverage(claim) + 0.5 * corpus.cosine(claim)
+    overlap = jaccard_matrix(texts, texts)
+
+    order = sorted(
+        range(len(unique)),
+        key=lambda i: -(RELEVANCE_WEIGHT * relevance[i] + (1 - RELEVANCE_WEIGHT) * unique[i][1])
+    )
+    chosen = []
+    for i in order:
+        if len(chosen) == k:
+            break
+        if relevance[i] < EVIDENCE_MIN_RELEVANCE:
+            _stats["irrelevant"] += 1
+            continue
+        if any(overlap[i, j] >= EVIDENCE_DUPLICATE_SIMILARITY for j in chosen):
+            _stats["near_duplicates"] += 1
+            continue
+        chosen.append(i)
+
+    if not chosen and k > 0:
+        # Nothing relevant by word overlap: keep the best result, preferring a credible one
+        credible = [i for i in order if unique[i][1] >= CREDIBILITY_SCORES["high"]]
+        chosen = [(credible or order)[0]]
+        _stats["relevance_fallbacks"] += 1
+
+    ranked = []
+    for i in chosen:
+        result, credibility = unique[i]
+        score = RELEVANCE_WEIGHT * relevance[i] + (1 - RELEVANCE_WEIGHT) * credibility
+        ranked.append(dict(result, relevance=round(float(relevance[i]), 3), evidence_score=round(float(score), 3)))
+    _stats["results_out"] += len(ranked)
+    return ranked
+
+
+def evidence_stats() -> dict:
+    rankings = _stats["rankings"]
+    return {
+        "enabled": EVIDENCE_RANKING_ENABLED,
+        "top_k": EVIDENCE_TOP_K,
+        "rankings": rankings,
+        "avg_results_in": round(_stats["results_in"] / rankings, 1) if rankings else 0.0,
+        "avg_results_out": round(_stats["results_out"] / rankings, 1) if rankings else 0.0,
+        "url_duplicates": _stats["url_duplicates"],
+        "near_duplicates": _stats["near_duplicates"],
+        "irrelevant": _stats["irrelevant"],
+        "relevance_fallbacks": _stats["relevance_fallbacks"]
+    }
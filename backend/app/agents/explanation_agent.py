@@ -1,11 +1,127 @@
-import google.generativeai as genai
-import os
-from dotenv import load_dotenv
 from app.models.response_model import Source, EvidencePoint, VerdictType
+from app.utils.llm_client import generate_text
+from app.utils.prompt_builder import PromptBuilder, PromptItem, truncate_to_tokens
 import json
+from typing import List
+import logging
+
+logger = logging.getLogger(__name__)
+
+_EXPLANATION_FORMAT = """IMPORTANT: Return ONLY valid JSON, no markdown formatting, no code blocks. Format:
+{
+  "real_news_summary": "...",
+  "detailed_explanation": "...",
+  "evidence_points": [
+    {"point": "...", "source": "..."},
+    {"point": "...", "source": "..."}
+  ]
+}
+
+The claim, verdict and verification context follow."""
+
+# Static instruction prefix per verdict (sent first, identical across calls)
+EXPLANATION_INSTRUCTIONS = {
+    VerdictType.FALSE: f"""Task: Generate a comprehensive explanation for why this claim is FALSE.
+
+Provide a JSON response with:
+1. "real_news_summary": A short (2-3 sentences) explanation of what the ACTUAL truth is
+2. "detailed_explanation": A detailed explanation (3-4 sentences) of why the claim is false
+3. "evidence_points": List of 2-3 key evidence points (each as {{"point": "...", "source": "..."}})
+
+Be clear, factual, and helpful. Focus on educating the user.
+
+{_EXPLANATION_FORMAT}""",
+    VerdictType.TRUE: f"""Task: Generate a comprehensive explanation for why this claim is TRUE.
+
+Provide a JSON response with:
+1. "real_news_summary": A short (2-3 sentences) summary confirming the claim and providing context
+2. "detailed_explanation": A detailed explanation (3-4 sentences) with additional context
+3. "evidence_points": List of 2-3 key evidence points (each as {{"point": "...", "source": "..."}})
+
+Be clear, factual, and provide helpful context.
+
+{_EXPLANATION_FORMAT}""",
+    VerdictType.MISLEADING: f"""Task: Generate a comprehensive explanation for why this claim is MISLEADING.
+
+Provide a JSON response with:
+1. "real_news_summary": A short (2-3 sentences) explanation of what is true and what is exaggerated/false
+2. "detailed_explanation": A detailed explanation (3-4 sentences) breaking down the misleading aspects
+3. "evidence_points": List of 2-3 key evidence points (each as {{"point": "...", "source": "..."}})
+
+Be clear about what's true vs. misleading.
+
+{_EXPLANATION_FORMAT}""",
+    VerdictType.UNVERIFIED: f"""Task: Generate a response explaining that we couldn't verify this claim.
+
+Provide a JSON response with:
+1. "real_news_summary": A short explanation of why we couldn't verify this
+2. "detailed_explanation": What the user should do (check credible sources, wait for more information)
+3. "evidence_points": List of 1-2 suggestions (each as {{"point": "...", "source": "..."}})
+
+Be helpful and guide the user.
+
+{_EXPLANATION_FORMAT}""",
+}
+
+# Longest AI analysis summary quoted in the explanation prompt
+_ANALYSIS_TOKENS = 200
+
+def collect_sources(verification_results: dict) -> List[Source]:
+    """Top fact-check and Google results, as response sources."""
+    sources = []
+    
+    # Add fact-check sources
+    for claim in verification_results.get("fact_check_api", {}).get("claims", [])[:3]:
+        sources.append(Source(
+            title=claim.get("claimReview", "Fact Check"),
+            url=claim.get("url", ""),
+            publisher=claim.get("publisher", "Unknown")
+        ))
+    
+    # Add Google search sources
+    for result in verification_results.get("google_search", {}).get("results", [])[:3]:
+        sources.append(Source(
+            title=result.get("title", "Search Result"),
+            url=result.get("url", ""),
+            publisher=result.get("displayLink", "Unknown")
+        ))
+    
+    return sources
+
+
+def build_explanation(explanation_data: dict, verification_results: dict, verdict_data: dict) -> dict:
+    """
+    Turns the model's explanation JSON into the explanation stage output.
+    
+    Args:
+        explanation_data: Parsed JSON with real_news_summary, detailed_explanation, evidence_points
+        verification_results: Results from verification agent
+        verdict_data: Verdict and confidence from verdict agent
+    
+    Returns:
+        Dictionary with explanation, evidence, and sources
+    """
+    # Convert evidence points to proper format
+    evidence_points = [
+        EvidencePoint(
+            point=ep.get("point", ""),
+            source=ep.get("source")
+        )
+        for ep in explanation_data.get("evidence_points", [])
+    ]
+    
+    # Build agent reasoning
+    reasoning_parts = verdict_data.get("reasoning", [])
+    agent_reasoning = " | ".join(reasoning_parts) if reasoning_parts else "AI-powered verification with multiple sources"
+    
+    return {
+        "real_news_summary": explanation_data.get("real_news_summary", "Unable to generate summary"),
+        "detailed_explanation": explanation_data.get("detailed_explanation", "Unable to generate explanation"),
+        "evidence_points": evidence_points,
+        "sources": collect_sources(verification_results),
+        "agent_reasoning": agent_reasoning
+    }
 
-load_dotenv()
-genai.configure(api_key=os.getenv("GEMINI_API_KEY"))
 
 async def generate_explanation(
     original_claim: str,
@@ -26,8 +142,6 @@ async def generate_explanation(
         Dictionary with explanation, evidence, and sources
     """
     try:
-        model = genai.GenerativeModel('gemini-3.1-flash-lite')
-        
         # Prepare context from verification results
         fact_check_claims = verification_results.get("fact_check_api", {}).get("claims", [])
         google_results = verification_results.get("google_search", {}).get("results", [])
@@ -36,97 +150,43 @@ async def generate_explanation(
         verdict = verdict_data.get("verdict")
         confidence = verdict_data.get("confidence_score")
         
-        # Build context string
-        context = f"""
-CLAIM TO VERIFY: {extracted_claim}
+        # Static instructions first, then the verdict context within the prompt budget
+        builder = PromptBuilder("explanation", EXPLANATION_INSTRUCTIONS.get(verdict, EXPLANATION_INSTRUCTIONS[VerdictType.UNVERIFIED]))
+        builder.add(f"""CLAIM TO VERIFY: {extracted_claim}
 
 VERDICT: {verdict}
 CONFIDENCE: {confidence}
 
 AI ANALYSIS:
-{ai_analysis.get('analysis', 'N/A')}
-
-KEY FINDINGS:
-"""
-        
-        for finding in ai_analysis.get("key_findings", []):
-            context += f"- {finding}\n"
-        
-        context += "\nVERIFICATION SOURCES:\n"
-        
-        if fact_check_claims:
-            context += "\nFact Check API Results:\n"
-            for i, claim in enumerate(fact_check_claims[:3], 1):
-                context += f"{i}. {claim.get('claimReview', 'N/A')} - Rating: {claim.get('rating', 'N/A')}\n"
-                context += f"   Publisher: {claim.get('publisher', 'N/A')}\n"
-        
-        if google_results:
-            context += "\nGoogle Search Results:\n"
-            for i, result in enumerate(google_results[:3], 1):
-                context += f"{i}. {result.get('title', 'N/A')}\n"
-                context += f"   {result.get('snippet', 'N/A')}\n"
-        
-        # Generate explanation based on verdict type
-        if verdict == VerdictType.FALSE:
-            prompt = f"""{context}
-
-Task: Generate a comprehensive explanation for why this claim is FALSE.
-
-Provide a JSON response with:
-1. "real_news_summary": A short (2-3 sentences) explanation of what the ACTUAL truth is
-2. "detailed_explanation": A detailed explanation (3-4 sentences) of why the claim is false
-3. "evidence_points": List of 2-3 key evidence points (each as {{"point": "...", "source": "..."}})
-
-Be clear, factual, and helpful. Focus on educating the user."""
-
-        elif verdict == VerdictType.TRUE:
-            prompt = f"""{context}
-
-Task: Generate a comprehensive explanation for why this claim is TRUE.
-
-Provide a JSON response with:
-1. "real_news_summary": A short (2-3 sentences) summary confirming the claim and providing context
-2. "detailed_explanation": A detailed explanation (3-4 sentences) with additional context
-3. "evidence_points": List of 2-3 key evidence points (each as {{"point": "...", "source": "..."}})
-
-Be clear, factual, and provide helpful context."""
-
-        elif verdict == VerdictType.MISLEADING:
-            prompt = f"""{context}
-
-Task: Generate a comprehensive explanation for why this claim is MISLEADING.
-
-Provide a JSON response with:
-1. "real_news_summary": A short (2-3 sentences) explanation of what is true and what is exaggerated/false
-2. "detailed_explanation": A detailed explanation (3-4 sentences) breaking down the misleading aspects
-3. "evidence_points": List of 2-3 key evidence points (each as {{"point": "...", "source": "..."}})
-
-Be clear about what's true vs. misleading."""
-
-        else:  # UNVERIFIED
-            prompt = f"""{context}
-
-Task: Generate a response explaining that we couldn't verify this claim.
-
-Provide a JSON response with:
-1. "real_news_summary": A short explanation of why we couldn't verify this
-2. "detailed_explanation": What the user should do (check credible sources, wait for more information)
-3. "evidence_points": List of 1-2 suggestions (each as {{"point": "...", "source": "..."}})
-
-Be helpful and guide the user."""
-        
-        prompt += """\n\nIMPORTANT: Return ONLY valid JSON, no markdown formatting, no code blocks. Format:
-{
-  "real_news_summary": "...",
-  "detailed_explanation": "...",
-  "evidence_points": [
-    {"point": "...", "source": "..."},
-    {"point": "...", "source": "..."}
-  ]
-}"""
+{truncate_to_tokens(ai_analysis.get('analysis', 'N/A'), _ANALYSIS_TOKENS)}""")
+        builder.add_items(
+            "KEY FINDINGS:",
+            [PromptItem(text="- {snippet}", snippet=str(finding)) for finding in ai_analysis.get("key_findings", [])]
+        )
+        builder.add_items(
+            "VERIFICATION SOURCES:\n\nFact Check API Results:",
+            [
+                PromptItem(
+                    text=(
+                        f"{i}. {claim.get('claimReview', 'N/A')} - Rating: {claim.get('rating', 'N/A')}\n"
+                        f"   Publisher: {claim.get('publisher', 'N/A')}"
+                    )
+                )
+                for i, claim in enumerate(fact_check_claims, 1)
+            ],
+            max_items=3
+        )
+        builder.add_items(
+            "Google Search Results:",
+            [
+                PromptItem(text=f"{i}. {result.get('title', 'N/A')}\n   {{snippet}}", snippet=result.get('snippet') or 'N/A')
+                for i, result in enumerate(google_results, 1)
+            ],
+            max_items=3
+        )
+        prompt = builder.build()
         
-        response = model.generate_content(prompt)
-        response_text = response.text.strip()
+        response_text = await generate_text(prompt, label="explanation")
         
         # Clean up response (remove markdown code blocks if present)
         response_text = response_text.replace("```json", "").replace("```", "").strip()
@@ -134,48 +194,10 @@ Be helpful and guide the user."""
         # Parse JSON response
         explanation_data = json.loads(response_text)
         
-        # Extract sources from verification results
-        sources = []
-        
-        # Add fact-check sources
-        for claim in fact_check_claims[:3]:
-            sources.append(Source(
-                title=claim.get("claimReview", "Fact Check"),
-                url=claim.get("url", ""),
-                publisher=claim.get("publisher", "Unknown")
-            ))
-        
-        # Add Google search sources
-        for result in google_results[:3]:
-            sources.append(Source(
-                title=result.get("title", "Search Result"),
-                url=result.get("url", ""),
-                publisher=result.get("displayLink", "Unknown")
-            ))
-        
-        # Convert evidence points to proper format
-        evidence_points = [
-            EvidencePoint(
-                point=ep.get("point", ""),
-                source=ep.get("source")
-            )
-            for ep in explanation_data.get("evidence_points", [])
-        ]
-        
-        # Build agent reasoning
-        reasoning_parts = verdict_data.get("reasoning", [])
-        agent_reasoning = " | ".join(reasoning_parts) if reasoning_parts else "AI-powered verification with multiple sources"
-        
-        return {
-            "real_news_summary": explanation_data.get("real_news_summary", "Unable to generate summary"),
-            "detailed_explanation": explanation_data.get("detailed_explanation", "Unable to generate explanation"),
-            "evidence_points": evidence_points,
-            "sources": sources,
-            "agent_reasoning": agent_reasoning
-        }
+        return build_explanation(explanation_data, verification_results, verdict_data)
         
     except Exception as e:
-        print(f"Error in explanation generation: {str(e)}")
+        logger.error(f"Error in explanation generation: {str(e)}")
         
         # Fallback response
         return {
@@ -185,5 +207,6 @@ Be helpful and guide the user."""
                 EvidencePoint(point="Multiple sources were consulted", source="Verification System")
             ],
             "sources": [],
-            "agent_reasoning": "Automated AI verification"
+            "agent_reasoning": "Automated AI verification",
+            "fallback": True
         }
@@ -1,11 +1,10 @@
-import google.generativeai as genai
-import os
-from dotenv import load_dotenv
+import asyncio
+import json
+from typing import List
+from app.utils.llm_client import generate_text
+import logging
 
-load_dotenv()
-
-# Configure Gemini
-genai.configure(api_key=os.getenv("GEMINI_API_KEY"))
+logger = logging.getLogger(__name__)
 
 async def extract_claim(user_input: str) -> str:
     """
@@ -18,8 +17,6 @@ async def extract_claim(user_input: str) -> str:
         A clean, factual statement that can be verified
     """
     try:
-        model = genai.GenerativeModel('gemini-3.1-flash-lite')
-        
         prompt = f"""You are a claim extraction expert. Your job is to convert user input into a clear, verifiable factual claim.
 
 User Input: "{user_input}"
@@ -38,8 +35,7 @@ Rules:
 
 Return ONLY the extracted claim, nothing else."""
 
-        response = model.generate_content(prompt)
-        extracted_claim = response.text.strip()
+        extracted_claim = await generate_text(prompt, label="extract")
         
         # Clean up any quotes or extra formatting
         extracted_claim = extracted_claim.strip('"\'')
@@ -48,5 +44,56 @@ Return ONLY the extracted claim, nothing else."""
         
     except Exception as e:
         # Fallback: return original input if extraction fails
-        print(f"Error in claim extraction: {str(e)}")
+        logger.error(f"Error in claim extraction: {str(e)}")
         return user_input.strip()
+
+
+async def extract_claims(user_inputs: List[str]) -> List[str]:
+    """
+    Extracts claims from several inputs with one Gemini prompt.
+    
+    Falls back to extract_claim per input when the batch answer cannot be
+    parsed or does not cover every input.
+    
+    Args:
+        user_inputs: Raw texts from users
+    
+    Returns:
+        Extracted claims in input order ("" when an input has no verifiable claim)
+    """
+    if len(user_inputs) == 1:
+        return [await extract_claim(user_inputs[0])]
+    
+    numbered = "\n".join(f'{idx}. "{text}"' for idx, text in enumerate(user_inputs, 1))
+    prompt = f"""You are a claim extraction expert. Your job is to convert each user input below into a clear, verifiable factual claim.
+
+User Inputs:
+{numbered}
+
+Task, for EACH input separately:
+1. Extract the core factual claim from this input
+2. Rewrite it as a clear, specific statement
+3. Remove opinions, questions, or emotional language
+4. Make it suitable for fact-checking
+
+Rules:
+- Keep each claim concise (1-2 sentences max)
+- Make it specific and verifiable
+- Remove any bias or loaded language
+- If an input is a question, convert it to a statement
+- If an input has no verifiable claim, use an empty string
+
+Return ONLY a JSON array of strings with exactly {len(user_inputs)} items, one per input, in the same order."""
+    
+    try:
+        response_text = (await generate_text(prompt, label="extract_batch")).strip()
+        if response_text.startswith("```"):
+            response_text = response_text.strip("`").removeprefix("json").strip()
+        claims = json.loads(response_text)
+        if isinstance(claims, list) and len(claims) == len(user_inputs):
+            return [str(claim).strip().strip('"\'') for claim in claims]
+        logger.warning(f"Batch extraction returned {len(claims) if isinstance(claims, list) else 'no'} claims for {len(user_inputs)} inputs")
+    except Exception as e:
+        logger.error(f"Error in batch claim extraction: {str(e)}")
+    
+    return list(await asyncio.gather(*(extract_claim(text) for text in user_inputs)))
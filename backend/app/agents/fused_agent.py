@@ -0,0 +1,132 @@
+"""
+Fused analysis + explanation.
+
+The default path makes two Gemini calls after the sources come back:
+analyze_with_gemini (verdict, confidence, reasoning) and then
+generate_explanation (summary, explanation, evidence points), both sending
+much the same evidence. With FUSED_ANALYSIS enabled, one schema-constrained
+call returns all of it. determine_verdict still applies its fact-checker
+adjustments afterwards; if that changes the verdict, the pipeline falls
+back to generate_explanation for the final verdict.
+"""
+
+import json
+import os
+
+from app.agents.research_agent import analyze_with_gemini, strip_code_fences, analysis_result
+from app.utils.llm_client import generate_text
+from app.utils.prompt_builder import PromptBuilder, PromptItem, source_items
+import logging
+
+logger = logging.getLogger(__name__)
+
+FUSED_ANALYSIS = os.getenv("FUSED_ANALYSIS", "false").lower() == "true"
+
+FUSED_RESPONSE_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "verdict": {"type": "string", "enum": ["TRUE", "FALSE", "MISLEADING", "UNVERIFIED"]},
+        "confidence": {"type": "number"},
+        "reasoning": {"type": "array", "items": {"type": "string"}},
+        "key_findings": {"type": "array", "items": {"type": "string"}},
+        "evidence_summary": {"type": "string"},
+        "real_news_summary": {"type": "string"},
+        "detailed_explanation": {"type": "string"},
+        "evidence_points": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "point": {"type": "string"},
+                    "source": {"type": "string"}
+                },
+                "required": ["point"]
+            }
+        }
+    },
+    "required": [
+        "verdict", "confidence", "reasoning", "key_findings", "evidence_summary",
+        "real_news_summary", "detailed_explanation", "evidence_points"
+    ]
+}
+
+
+FUSED_INSTRUCTIONS = """You are an expert fact-checker analyzing information to verify a claim and explain the result to the public.
+
+Your task:
+1. Carefully analyze all the results below the claim
+2. Look for patterns of debunking, confirmation, or mixed evidence
+3. Consider the credibility of sources (news sites, fact-checkers, scientific publications)
+4. Determine if the claim is TRUE, FALSE, MISLEADING, or UNVERIFIED
+5. Explain the verdict to the user
+
+Fields:
+- verdict, confidence (0.0 to 1.0), reasoning (2-3 points), key_findings, evidence_summary (brief)
+- real_news_summary: 2-3 sentences. FALSE: what the actual truth is. TRUE: confirm the claim with context. MISLEADING: what is true and what is exaggerated or false. UNVERIFIED: why it could not be verified
+- detailed_explanation: 3-4 sentences explaining the verdict (for UNVERIFIED, what the user should do)
+- evidence_points: 2-3 key evidence points, each {"point": "...", "source": "..."}
+
+Guidelines:
+- TRUE: Multiple reliable sources confirm the claim with strong evidence (confidence > 0.7)
+- FALSE: Multiple reliable sources debunk the claim with clear evidence (confidence > 0.7)
+- MISLEADING: Mixed evidence, partially true, taken out of context (confidence 0.4-0.7)
+- UNVERIFIED: Insufficient evidence or conflicting sources (confidence < 0.4)
+
+Be objective, evidence-based, clear and helpful. Return ONLY the JSON."""
+
+
+def fact_check_items(fact_check_claims: list) -> list:
+    """Fact Check API claims as prompt items."""
+    return [
+        PromptItem(
+            text=(
+                f"{idx}. {claim.get('claimReview', 'N/A')} - Rating: {claim.get('rating', 'N/A')}\n"
+                f"   Publisher: {claim.get('publisher', 'N/A')}"
+            )
+        )
+        for idx, claim in enumerate(fact_check_claims, 1)
+    ]
+
+
+async def analyze_and_explain(claim: str, search_results: list, fact_check_claims: list) -> dict:
+    """
+    Analyzes the evidence and writes the explanation in one Gemini call.
+
+    Args:
+        claim: The claim to verify
+        search_results: Combined search results
+        fact_check_claims: Claims from the Fact Check API
+
+    Returns:
+        Analysis dict (same shape as analyze_with_gemini) with an extra
+        "explanation" key holding real_news_summary, detailed_explanation
+        and evidence_points. Falls back to analyze_with_gemini alone if the
+        fused call fails.
+    """
+    if not search_results:
+        # No evidence to share between the two calls: keep the knowledge-only prompt
+        return await analyze_with_gemini(claim, search_results)
+
+    prompt = (
+        PromptBuilder("fused", FUSED_INSTRUCTIONS)
+        .add(f'CLAIM TO VERIFY: "{claim}"')
+        .add_items("FACT CHECK API RESULTS:", fact_check_items(fact_check_claims), max_items=3)
+        .add_items("SEARCH RESULTS FROM THE WEB:", source_items(search_results))
+        .build()
+    )
+
+    try:
+        response_text = await generate_text(prompt, response_schema=FUSED_RESPONSE_SCHEMA, label="fused")
+        fused = json.loads(strip_code_fences(response_text))
+
+        result = analysis_result(fused, len(search_results))
+        result["explanation"] = {
+            "real_news_summary": fused.get("real_news_summary", ""),
+            "detailed_explanation": fused.get("detailed_explanation", ""),
+            "evidence_points": fused.get("evidence_points", [])
+        }
+        return result
+
+    except Exception as e:
+        logger.warning(f"Fused analysis error, falling back to separate calls: {str(e)}")
+        return await analyze_with_gemini(claim, search_results)
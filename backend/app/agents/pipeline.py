@@ -0,0 +1,256 @@
+"""
+End-to-end verification pipeline shared by the API and the Telegram bot.
+
+extract_claim -> verify_claim -> determine_verdict -> generate_explanation,
+with the verdict cache in front of the post-extraction stages. With
+SPECULATIVE_FETCH, source fetches start on the raw input alongside
+extraction (see app.agents.speculation); with FUSED_ANALYSIS, analysis
+and explanation share one Gemini call (see app.agents.fused_agent); with
+EARLY_EXIT_ENABLED, a matching authoritative fact-check short-circuits the
+remaining sources and both Gemini calls (see app.agents.early_exit).
+
+Identical requests arriving while one is running share its execution (see
+app.utils.singleflight): whole runs without stage callbacks are coalesced
+on the normalized input, and verification on the normalized extracted
+claim, so a burst of the same claim costs one set of source and Gemini
+calls rather than one per request until the verdict cache is filled.
+"""
+
+import logging
+import time
+from functools import partial
+from typing import Awaitable, Callable, Optional
+
+from app.agents.extractor_agent import extract_claim
+from app.agents.verification_agent import verify_claim
+from app.agents.verdict_agent import determine_verdict
+from app.agents.explanation_agent import generate_explanation, build_explanation
+from app.agents.fused_agent import FUSED_ANALYSIS
+from app.agents.early_exit import EARLY_EXIT_ENABLED
+from app.agents.speculation import Speculation, SPECULATIVE_FETCH
+from app.models import VerifyResponse
+from app.metrics import span, count_cache_lookup
+from app.utils.verdict_cache import verdict_cache, VERDICT_CACHE_ENABLED
+from app.utils.similarity import normalize_for_similarity
+from app.utils.singleflight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+# Called with (stage, payload) after each stage completes
+StageCallback = Callable[[str, dict], Awaitable[None]]
+
+# Runs without stage callbacks, keyed on the normalized raw input
+_pipeline_flight = SingleFlight("pipeline")
+# verify_claim calls, keyed on the normalized extracted claim
+_verify_flight = SingleFlight("verify_claim")
+
+
+class NoClaimFoundError(ValueError):
+    """Raised when the extractor returns no verifiable claim."""
+
+
+def describe_error(error: Exception) -> tuple:
+    """Maps a pipeline failure to (HTTP status, helpful message)."""
+    error_message = str(error)
+
+    # Provide helpful error messages
+    if isinstance(error, NoClaimFoundError):
+        return 422, error_message
+    elif "GEMINI_API_KEY" in error_message or "API key" in error_message:
+        return 500, "API key configuration error. Please check your GEMINI_API_KEY in .env file."
+    elif "timeout" in error_message.lower() or "timed out" in error_message.lower():
+        return 504, "Request timed out. The verification took too long. Please try again."
+    else:
+        return 500, f"Verification failed: {error_message}"
+
+
+def _is_cacheable(verification_results: dict, explanation_data: dict) -> bool:
+    """Only cache runs where every stage produced a real answer (no error fallbacks)."""
+    if verification_results.get("error") or verification_results.get("ai_analysis", {}).get("error"):
+        return False
+    return not explanation_data.get("fallback", False)
+
+
+async def _no_emit(stage: str, payload: dict):
+    pass
+
+
+async def complete_claim(
+    claim: str,
+    extracted_claim: str,
+    verification_results: dict,
+    started: float,
+    emit: StageCallback = _no_emit
+) -> tuple:
+    """
+    Runs the verdict and explanation stages and stores the result in the verdict cache.
+
+    Args:
+        claim: Raw user input
+        extracted_claim: Claim returned by the extractor
+        verification_results: Output of verify_claim
+        started: perf_counter() when verification started (for cache savings)
+        emit: Stage callback
+
+    Returns:
+        Tuple of (verdict_data, explanation_data)
+    """
+    # Step 3: Determine verdict based on verification results
+    logger.info("🔍 Step 3: Determining verdict...")
+    with span("verdict"):
+        verdict_data = determine_verdict(verification_results)
+    logger.info(f"✅ Verdict: {verdict_data['verdict']} (Confidence: {verdict_data['confidence_score']:.2%})")
+    await emit("verdict", verdict_data)
+
+    # Step 4: Generate human-friendly explanation
+    ai_analysis = verification_results.get("ai_analysis", {})
+    fused_explanation = ai_analysis.get("explanation")
+    if fused_explanation and verdict_data["verdict"] == ai_analysis.get("verdict_suggestion"):
+        # Written by the fused call for this same verdict
+        explanation_data = build_explanation(fused_explanation, verification_results, verdict_data)
+    else:
+        logger.info("🔍 Step 4: Generating explanation...")
+        with span("explanation"):
+            explanation_data = await generate_explanation(
+                original_claim=claim,
+                extracted_claim=extracted_claim,
+                verification_results=verification_results,
+                verdict_data=verdict_data
+            )
+    logger.info("✅ Explanation generated")
+    await emit("explanation", explanation_data)
+
+    if VERDICT_CACHE_ENABLED and _is_cacheable(verification_results, explanation_data):
+        await verdict_cache.set(
+            extracted_claim,
+            {
+                "verdict_data": verdict_data,
+                "explanation_data": explanation_data,
+                "verification_summary": verification_results.get("verification_summary", {})
+            },
+            compute_seconds=time.perf_counter() - started
+        )
+
+    return verdict_data, explanation_data
+
+
+def build_response(claim: str, extracted_claim: str, verdict_data: dict, explanation_data: dict) -> VerifyResponse:
+    """Combines verdict and explanation into the API response model."""
+    return VerifyResponse(
+        original_claim=claim,
+        extracted_claim=extracted_claim,
+        verdict=verdict_data["verdict"],
+        confidence_score=verdict_data["confidence_score"],
+        real_news_summary=explanation_data["real_news_summary"],
+        detailed_explanation=explanation_data["detailed_explanation"],
+        evidence_points=explanation_data["evidence_points"],
+        sources=explanation_data["sources"],
+        agent_reasoning=explanation_data.get("agent_reasoning")
+    )
+
+
+async def run_pipeline(claim: str, on_stage: Optional[StageCallback] = None) -> dict:
+    """
+    Runs the full verification pipeline for a user claim.
+
+    Without on_stage, a run for the same normalized input already in flight
+    is joined instead of repeated (the result, including any error, is
+    shared). With on_stage the run is the caller's own, but verification
+    is still shared with a concurrent run of the same extracted claim, in
+    which case no "source" events are sent.
+
+    Args:
+        claim: Raw user input
+        on_stage: Optional coroutine called as stages finish
+            ("extracted", "source" once per verification tool, "verification",
+            "verdict", "explanation")
+
+    Returns:
+        Dictionary with the VerifyResponse, the verification summary and
+        whether the verdict came from the cache
+    """
+    if on_stage is not None:
+        return await _run_pipeline(claim, on_stage)
+
+    result = await _pipeline_flight.do(normalize_for_similarity(claim), partial(_run_pipeline, claim))
+    if result["response"].original_claim != claim:
+        # Joined a run started for a differently formatted copy of this input
+        result = dict(result, response=result["response"].model_copy(update={"original_claim": claim}))
+    return result
+
+
+async def _run_pipeline(claim: str, on_stage: Optional[StageCallback] = None) -> dict:
+    async def emit(stage: str, payload: dict):
+        if on_stage is not None:
+            await on_stage(stage, payload)
+
+    speculation = Speculation(claim) if SPECULATIVE_FETCH else None
+    try:
+        # Step 1: Extract clean factual claim
+        logger.info("🔍 Step 1: Extracting claim...")
+        with span("extract"):
+            extracted_claim = await extract_claim(claim)
+        if not extracted_claim or not extracted_claim.strip():
+            raise NoClaimFoundError("No verifiable claim found in input")
+        logger.info(f"✅ Extracted: {extracted_claim}")
+        await emit("extracted", {"extracted_claim": extracted_claim})
+
+        if VERDICT_CACHE_ENABLED:
+            with span("verdict_cache"):
+                cached = await verdict_cache.get(extracted_claim)
+            count_cache_lookup("verdict", cached is not None)
+        else:
+            cached = None
+    except BaseException:
+        if speculation is not None:
+            speculation.discard()
+        raise
+
+    if cached is not None:
+        logger.info("⚡ Verdict cache hit")
+        if speculation is not None:
+            speculation.discard()
+        verdict_data = cached["verdict_data"]
+        explanation_data = cached["explanation_data"]
+        verification_summary = cached["verification_summary"]
+        await emit("verdict", verdict_data)
+        await emit("explanation", explanation_data)
+    else:
+        started = time.perf_counter()
+
+        # Step 2: Verify the claim using multiple tools
+        logger.info("🔍 Step 2: Verifying with Indian fact-checkers + AI...")
+        verify_key = normalize_for_similarity(extracted_claim)
+        if speculation is not None and _verify_flight.running(verify_key):
+            # Joining a verification in flight: its sources are already being fetched
+            speculation.discard()
+            speculation = None
+        prefetched = speculation.resolve(extracted_claim) if speculation is not None else None
+
+        async def on_source(name: str, result: dict):
+            if speculation is not None:
+                speculation.source_done(name)
+            await emit("source", {"source": name, "result": result})
+
+        with span("verification"):
+            verification_results = await _verify_flight.do(verify_key, partial(
+                verify_claim, extracted_claim, on_source=on_source, prefetched=prefetched, fused=FUSED_ANALYSIS,
+                early_exit=EARLY_EXIT_ENABLED
+            ))
+        if speculation is not None:
+            speculation.finish()
+        verification_summary = verification_results.get("verification_summary", {})
+        logger.info(f"✅ Verification complete (sources checked: {verification_summary.get('total_sources', 0)})")
+        await emit("verification", verification_results)
+
+        verdict_data, explanation_data = await complete_claim(
+            claim, extracted_claim, verification_results, started, emit
+        )
+
+    response = build_response(claim, extracted_claim, verdict_data, explanation_data)
+
+    return {
+        "response": response,
+        "verification_summary": verification_summary,
+        "cache_hit": cached is not None
+    }
@@ -1,34 +1,16 @@
-import google.generativeai as genai
-import os
-from dotenv import load_dotenv
+import asyncio
+import json
+from typing import List, Tuple
+from app.utils.llm_client import generate_text, estimate_tokens
+from app.utils.prompt_builder import PromptBuilder, source_items, static_tokens, PROMPT_TOKEN_BUDGET
+import logging
 
-load_dotenv()
+logger = logging.getLogger(__name__)
 
-# Configure Gemini
-genai.configure(api_key=os.getenv("GEMINI_API_KEY"))
+# Static instruction prefixes (sent first, identical across calls)
+FALLBACK_INSTRUCTIONS = """You are an expert fact-checker with access to your training data (up to your knowledge cutoff).
 
-async def analyze_with_gemini(claim: str, search_results: list) -> dict:
-    """
-    Uses Gemini AI to analyze search results and make intelligent verdict.
-    
-    Args:
-        claim: The claim to verify
-        search_results: List of search results from Google
-    
-    Returns:
-        Dictionary with AI analysis including verdict and evidence
-    """
-    try:
-        # If no search results, use Gemini's knowledge directly
-        if not search_results or len(search_results) == 0:
-            print(f"No search results available. Using Gemini's built-in knowledge for: {claim}")
-            
-            # Fallback: Ask Gemini directly based on its training data
-            fallback_prompt = f"""You are an expert fact-checker with access to your training data (up to your knowledge cutoff).
-
-CLAIM TO VERIFY: "{claim}"
-
-Since no web search results are available, use your training knowledge to analyze this claim.
+No web search results are available for the claim below, so use your training knowledge to analyze it.
 
 Your task:
 1. Based on your training data, determine if this claim is generally TRUE, FALSE, MISLEADING, or UNVERIFIED
@@ -36,14 +18,14 @@ Your task:
 3. Be honest about limitations if the claim is too recent or obscure
 
 Provide your analysis in this exact JSON format:
-{{
+{
     "verdict": "TRUE" or "FALSE" or "MISLEADING" or "UNVERIFIED",
     "confidence": 0.0 to 1.0,
     "reasoning": ["point 1", "point 2", "point 3"],
     "key_findings": ["finding 1", "finding 2"],
     "evidence_summary": "Brief summary based on your knowledge",
     "caveat": "Note that this is based on training data, not current web search"
-}}
+}
 
 Guidelines:
 - TRUE: You're confident this is accurate based on established facts (confidence > 0.6)
@@ -53,21 +35,108 @@ Guidelines:
 
 Return ONLY the JSON, no additional text."""
 
+ANALYSIS_INSTRUCTIONS = """You are an expert fact-checker analyzing information to verify a claim.
+
+Your task:
+1. Carefully analyze all the search results below the claim
+2. Look for patterns of debunking, confirmation, or mixed evidence
+3. Consider the credibility of sources (news sites, fact-checkers, scientific publications)
+4. Determine if the claim is TRUE, FALSE, MISLEADING, or UNVERIFIED
+
+Provide your analysis in this exact JSON format:
+{
+    "verdict": "TRUE" or "FALSE" or "MISLEADING" or "UNVERIFIED",
+    "confidence": 0.0 to 1.0,
+    "reasoning": ["point 1", "point 2", "point 3"],
+    "key_findings": ["finding 1", "finding 2"],
+    "evidence_summary": "Brief summary of evidence"
+}
+
+Guidelines:
+- TRUE: Multiple reliable sources confirm the claim with strong evidence (confidence > 0.7)
+- FALSE: Multiple reliable sources debunk the claim with clear evidence (confidence > 0.7)
+- MISLEADING: Mixed evidence, partially true, taken out of context (confidence 0.4-0.7)
+- UNVERIFIED: Insufficient evidence or conflicting sources (confidence < 0.4)
+
+Be objective and evidence-based. Return ONLY the JSON, no additional text."""
+
+BATCH_ANALYSIS_INSTRUCTIONS = """You are an expert fact-checker analyzing information to verify several independent claims.
+
+Your task, for EACH claim below separately:
+1. Analyze only the search results listed under that claim
+2. Look for patterns of debunking, confirmation, or mixed evidence
+3. Consider the credibility of sources (news sites, fact-checkers, scientific publications)
+4. Determine if the claim is TRUE, FALSE, MISLEADING, or UNVERIFIED
+
+Provide your analysis as a JSON array with exactly one object per claim, in this exact format:
+[
+    {
+        "id": claim number,
+        "verdict": "TRUE" or "FALSE" or "MISLEADING" or "UNVERIFIED",
+        "confidence": 0.0 to 1.0,
+        "reasoning": ["point 1", "point 2", "point 3"],
+        "key_findings": ["finding 1", "finding 2"],
+        "evidence_summary": "Brief summary of evidence"
+    }
+]
+
+Guidelines:
+- TRUE: Multiple reliable sources confirm the claim with strong evidence (confidence > 0.7)
+- FALSE: Multiple reliable sources debunk the claim with clear evidence (confidence > 0.7)
+- MISLEADING: Mixed evidence, partially true, taken out of context (confidence 0.4-0.7)
+- UNVERIFIED: Insufficient evidence or conflicting sources (confidence < 0.4)
+
+Be objective and evidence-based. Return ONLY the JSON array, no additional text."""
+
+
+def strip_code_fences(response_text: str) -> str:
+    # Remove markdown code blocks if present
+    if response_text.startswith("```json"):
+        response_text = response_text[7:]
+    if response_text.startswith("```"):
+        response_text = response_text[3:]
+    if response_text.endswith("```"):
+        response_text = response_text[:-3]
+    return response_text.strip()
+
+
+def analysis_result(analysis: dict, sources_analyzed: int) -> dict:
+    return {
+        "analysis": analysis.get("evidence_summary", ""),
+        "verdict_suggestion": analysis.get("verdict", "UNVERIFIED"),
+        "confidence": float(analysis.get("confidence", 0.0)),
+        "reasoning": analysis.get("reasoning", []),
+        "key_findings": analysis.get("key_findings", []),
+        "sources_analyzed": sources_analyzed
+    }
+
+async def analyze_with_gemini(claim: str, search_results: list) -> dict:
+    """
+    Uses Gemini AI to analyze search results and make intelligent verdict.
+    
+    Args:
+        claim: The claim to verify
+        search_results: List of search results from Google
+    
+    Returns:
+        Dictionary with AI analysis including verdict and evidence
+    """
+    try:
+        # If no search results, use Gemini's knowledge directly
+        if not search_results or len(search_results) == 0:
+            logger.info(f"No search results available. Using Gemini's built-in knowledge for: {claim[:100]}")
+            
+            # Fallback: Ask Gemini directly based on its training data
+            fallback_prompt = (
+                PromptBuilder("analysis", FALLBACK_INSTRUCTIONS)
+                .add(f'CLAIM TO VERIFY: "{claim}"')
+                .build()
+            )
+
             try:
-                model = genai.GenerativeModel('gemini-3.1-flash-lite')
-                response = model.generate_content(fallback_prompt)
-                response_text = response.text.strip()
-                
-                # Remove markdown code blocks if present
-                if response_text.startswith("```json"):
-                    response_text = response_text[7:]
-                if response_text.startswith("```"):
-                    response_text = response_text[3:]
-                if response_text.endswith("```"):
-                    response_text = response_text[:-3]
+                response_text = await generate_text(fallback_prompt, label="analysis")
                 
-                import json
-                analysis = json.loads(response_text.strip())
+                analysis = json.loads(strip_code_fences(response_text))
                 
                 return {
                     "analysis": analysis.get("evidence_summary", "Based on AI knowledge"),
@@ -80,103 +149,109 @@ Return ONLY the JSON, no additional text."""
                     "caveat": "Analysis based on AI training data (no live web search)"
                 }
             except Exception as fallback_error:
-                print(f"Fallback analysis error: {str(fallback_error)}")
+                logger.error(f"Fallback analysis error: {str(fallback_error)}")
                 return {
                     "analysis": "No search results available and fallback failed",
                     "verdict_suggestion": "UNVERIFIED",
                     "confidence": 0.0,
                     "reasoning": ["Unable to verify - no web search results available"],
-                    "sources_analyzed": 0
+                    "sources_analyzed": 0,
+                    "error": str(fallback_error)
                 }
         
-        # Prepare context from search results
-        context_parts = []
-        for idx, result in enumerate(search_results[:5], 1):
-            context_parts.append(
-                f"Source {idx}:\n"
-                f"Title: {result.get('title', 'N/A')}\n"
-                f"Snippet: {result.get('snippet', 'N/A')}\n"
-                f"URL: {result.get('url', 'N/A')}\n"
-            )
-        
-        context = "\n".join(context_parts)
-        
-        # Create prompt for Gemini
-        prompt = f"""You are an expert fact-checker analyzing information to verify a claim.
-
-CLAIM TO VERIFY: "{claim}"
-
-SEARCH RESULTS FROM THE WEB:
-{context}
-
-Your task:
-1. Carefully analyze all the search results above
-2. Look for patterns of debunking, confirmation, or mixed evidence
-3. Consider the credibility of sources (news sites, fact-checkers, scientific publications)
-4. Determine if the claim is TRUE, FALSE, MISLEADING, or UNVERIFIED
-
-Provide your analysis in this exact JSON format:
-{{
-    "verdict": "TRUE" or "FALSE" or "MISLEADING" or "UNVERIFIED",
-    "confidence": 0.0 to 1.0,
-    "reasoning": ["point 1", "point 2", "point 3"],
-    "key_findings": ["finding 1", "finding 2"],
-    "evidence_summary": "Brief summary of evidence"
-}}
-
-Guidelines:
-- TRUE: Multiple reliable sources confirm the claim with strong evidence (confidence > 0.7)
-- FALSE: Multiple reliable sources debunk the claim with clear evidence (confidence > 0.7)
-- MISLEADING: Mixed evidence, partially true, taken out of context (confidence 0.4-0.7)
-- UNVERIFIED: Insufficient evidence or conflicting sources (confidence < 0.4)
-
-Be objective and evidence-based. Return ONLY the JSON, no additional text."""
+        # Static instructions first, then the claim and as much evidence as the budget allows
+        prompt = (
+            PromptBuilder("analysis", ANALYSIS_INSTRUCTIONS)
+            .add(f'CLAIM TO VERIFY: "{claim}"')
+            .add_items("SEARCH RESULTS FROM THE WEB:", source_items(search_results))
+            .build()
+        )
 
         # Call Gemini
-        model = genai.GenerativeModel('gemini-3.1-flash-lite')
-        response = model.generate_content(prompt)
+        response_text = await generate_text(prompt, label="analysis")
         
         # Parse JSON response
-        import json
-        response_text = response.text.strip()
-        
-        # Remove markdown code blocks if present
-        if response_text.startswith("```json"):
-            response_text = response_text[7:]
-        if response_text.startswith("```"):
-            response_text = response_text[3:]
-        if response_text.endswith("```"):
-            response_text = response_text[:-3]
+        analysis = json.loads(strip_code_fences(response_text))
         
-        analysis = json.loads(response_text.strip())
-        
-        return {
-            "analysis": analysis.get("evidence_summary", ""),
-            "verdict_suggestion": analysis.get("verdict", "UNVERIFIED"),
-            "confidence": float(analysis.get("confidence", 0.0)),
-            "reasoning": analysis.get("reasoning", []),
-            "key_findings": analysis.get("key_findings", []),
-            "sources_analyzed": len(search_results)
-        }
+        return analysis_result(analysis, len(search_results))
         
     except json.JSONDecodeError as e:
-        print(f"JSON parsing error in research agent: {str(e)}")
-        print(f"Response was: {response_text if 'response_text' in locals() else 'N/A'}")
+        logger.warning(f"JSON parsing error in research agent: {str(e)}")
+        logger.debug("Unparseable analysis response", extra={"response": response_text[:500] if 'response_text' in locals() else None})
         return {
             "analysis": "Error parsing AI response",
             "verdict_suggestion": "UNVERIFIED",
             "confidence": 0.0,
             "reasoning": ["Unable to analyze results properly"],
             "key_findings": [],
-            "sources_analyzed": len(search_results)
+            "sources_analyzed": len(search_results),
+            "error": str(e)
         }
     except Exception as e:
-        print(f"Error in research agent: {str(e)}")
+        logger.error(f"Error in research agent: {str(e)}")
         return {
             "analysis": f"Error: {str(e)}",
             "verdict_suggestion": "UNVERIFIED",
             "confidence": 0.0,
             "reasoning": [f"Analysis error: {str(e)}"],
             "key_findings": [],
-            "sources_analyzed": 0
+            "sources_analyzed": 0,
+            "error": str(e)
         }
+
+
+async def analyze_batch_with_gemini(items: List[Tuple[str, list]]) -> List[dict]:
+    """
+    Analyzes several claims with one Gemini prompt.
+    
+    Claims without search results, and any claim missing from the model's
+    answer, fall back to analyze_with_gemini individually.
+    
+    Args:
+        items: List of (claim, search_results) pairs
+    
+    Returns:
+        List of analysis dicts (same shape as analyze_with_gemini), in input order
+    """
+    results = [None] * len(items)
+    batched = [idx for idx, (_, search_results) in enumerate(items) if search_results]
+    
+    if len(batched) > 1:
+        # Each claim gets one single-claim budget for its search results
+        per_claim = PROMPT_TOKEN_BUDGET - static_tokens(ANALYSIS_INSTRUCTIONS)
+        builder = PromptBuilder(
+            "analysis_batch",
+            BATCH_ANALYSIS_INSTRUCTIONS,
+            budget=static_tokens(BATCH_ANALYSIS_INSTRUCTIONS) + per_claim * len(batched)
+        )
+        for number, idx in enumerate(batched, 1):
+            claim, search_results = items[idx]
+            claim_line = f"CLAIM {number}: \"{claim}\""
+            if number > 1:
+                builder.add("---")
+            builder.add(claim_line)
+            builder.add_items(
+                f"SEARCH RESULTS FOR CLAIM {number}:",
+                source_items(search_results),
+                max_tokens=per_claim - estimate_tokens(claim_line)
+            )
+        prompt = builder.build()
+        
+        try:
+            response_text = await generate_text(prompt, label="analysis_batch")
+            analyses = json.loads(strip_code_fences(response_text))
+            for analysis in analyses:
+                number = int(analysis.get("id", 0))
+                if 1 <= number <= len(batched):
+                    idx = batched[number - 1]
+                    results[idx] = analysis_result(analysis, len(items[idx][1]))
+        except Exception as e:
+            logger.warning(f"Batch analysis error, analyzing claims individually: {str(e)}")
+    
+    # Anything the batch prompt did not cover goes through the single-claim path
+    missing = [idx for idx, result in enumerate(results) if result is None]
+    singles = await asyncio.gather(*(analyze_with_gemini(*items[idx]) for idx in missing))
+    for idx, result in zip(missing, singles):
+        results[idx] = result
+    
+    return results
@@ -0,0 +1,141 @@
+"""
+Speculative source fetching.
+
+With SPECULATIVE_FETCH enabled, the pipeline starts every verification
+tool on clean_text(raw input) while Gemini is still extracting the claim.
+Once the extracted claim is known, each source's speculative query is
+compared with the query the extracted claim would produce:
+
+- close enough: the speculative task (finished or still running) is reused
+- changed materially: the speculative task is cancelled and the source is
+  queried again with the extracted claim
+
+How close is close enough depends on the source. Keyword search engines
+tolerate rewording, while NewsAPI requires every word to match (the query
+is the claim joined with AND) and the Fact Check API matches on the whole
+claim text.
+"""
+
+import asyncio
+import os
+import time
+from collections import defaultdict
+from functools import partial
+from typing import Dict
+
+from app.agents.verification_agent import start_sources, SOURCE_FALLBACKS
+from app.utils.preprocess import clean_text
+from app.utils.similarity import jaccard_similarity
+
+SPECULATIVE_FETCH = os.getenv("SPECULATIVE_FETCH", "false").lower() == "true"
+
+# Minimum word-level Jaccard similarity between the speculative and the
+# extracted query for a source's speculative result to be reused
+SPECULATIVE_SOURCE_THRESHOLDS = {
+    "fact_check_api": 0.8,
+    "google_search": 0.6,
+    "indian_factcheckers": 0.6,
+    "web_scraper": 0.6,
+    "news_api": 0.9,
+}
+
+_stats = defaultdict(float)
+
+
+class Speculation:
+    """
+    Source fetches started on the raw input before extraction finishes.
+
+    Args:
+        raw_claim: The user's input, used (cleaned) as the speculative query
+    """
+
+    def __init__(self, raw_claim: str):
+        self.query = clean_text(raw_claim)
+        self.started_at = time.perf_counter()
+        self.resolved_at = None
+        self.tasks = start_sources(self.query)
+        self.reused = {}
+
+        # Seconds each source took, measured from when its query was sent
+        self.durations: Dict[str, float] = {}
+        self.last_source_at = None
+        for name, task in self.tasks.items():
+            task.add_done_callback(partial(self._speculative_done, name))
+
+        _stats["runs"] += 1
+
+    def _speculative_done(self, name: str, task: asyncio.Task):
+        if not task.cancelled():
+            self.durations[name] = time.perf_counter() - self.started_at
+
+    def discard(self):
+        """Cancels all speculative fetches (no claim, or a verdict cache hit)."""
+        for task in self.tasks.values():
+            task.cancel()
+        _stats["discarded"] += 1
+
+    def resolve(self, extracted_claim: str) -> Dict[str, asyncio.Task]:
+        """
+        Decides per source whether the speculative fetch can be reused.
+
+        Args:
+            extracted_claim: Claim returned by the extractor
+
+        Returns:
+            Dictionary of reusable tasks for verify_claim(prefetched=...)
+        """
+        self.resolved_at = time.perf_counter()
+        similarity = jaccard_similarity(self.query, clean_text(extracted_claim))
+
+        for name, task in self.tasks.items():
+            if similarity >= SPECULATIVE_SOURCE_THRESHOLDS.get(name, 1.0):
+                self.reused[name] = task
+            else:
+                task.cancel()
+
+        _stats["sources_reused"] += len(self.reused)
+        _stats["sources_requeried"] += len(self.tasks) - len(self.reused)
+        return self.reused
+
+    def source_done(self, name: str):
+        """Records when a source result became available to the pipeline."""
+        now = time.perf_counter()
+        self.last_source_at = now
+        if name not in self.reused:
+            self.durations[name] = now - self.resolved_at
+
+    def finish(self):
+        """
+        Records the latency saved versus fetching after extraction.
+
+        Without speculation every source would have started at resolve time,
+        so evidence would have been complete max(durations) later; the
+        saving is that minus how long we actually waited after extraction.
+        """
+        if self.resolved_at is None or self.last_source_at is None:
+            return
+        if len(self.durations) < len(SOURCE_FALLBACKS):
+            return
+
+        actual_wait = max(0.0, self.last_source_at - self.resolved_at)
+        saved = max(0.0, max(self.durations.values()) - actual_wait)
+        _stats["completed"] += 1
+        _stats["latency_saved_seconds"] += saved
+
+
+def speculation_stats() -> dict:
+    completed = _stats["completed"]
+    reused = _stats["sources_reused"]
+    requeried = _stats["sources_requeried"]
+    return {
+        "enabled": SPECULATIVE_FETCH,
+        "runs": int(_stats["runs"]),
+        "discarded": int(_stats["discarded"]),
+        "sources_reused": int(reused),
+        "sources_requeried": int(requeried),
+        "reuse_rate": round(reused / (reused + requeried), 4) if reused + requeried else 0.0,
+        "latency_saved_seconds": round(_stats["latency_saved_seconds"], 3),
+        "avg_latency_saved_seconds": round(_stats["latency_saved_seconds"] / completed, 3) if completed else 0.0,
+        "thresholds": SPECULATIVE_SOURCE_THRESHOLDS
+    }
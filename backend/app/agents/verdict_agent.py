@@ -1,4 +1,7 @@
 from app.models.response_model import VerdictType
+import logging
+
+logger = logging.getLogger(__name__)
 
 def determine_verdict(verification_results: dict) -> dict:
     """
@@ -79,7 +82,7 @@ def determine_verdict(verification_results: dict) -> dict:
         }
         
     except Exception as e:
-        print(f"Error in verdict determination: {str(e)}")
+        logger.error(f"Error in verdict determination: {str(e)}")
         return {
             "verdict": VerdictType.UNVERIFIED,
             "confidence_score": 0.0,
@@ -3,15 +3,274 @@ from app.tools.google_search import search_google
 from app.tools.web_scraper import scrape_news_search, scrape_news_api
 from app.tools.indian_factcheckers import search_all_indian_factcheckers
 from app.agents.research_agent import analyze_with_gemini
+from app.agents.fused_agent import analyze_and_explain
+from app.agents.early_exit import authoritative_match, fast_path_analysis, record_early_exit
+from app.agents.evidence import rank_evidence, EVIDENCE_RANKING_ENABLED
+from app.factcheck_index import get_factcheck_index
 from app.utils.preprocess import clean_text
+from app.metrics import span
+from functools import partial
+from typing import Awaitable, Callable, Dict, Iterable, Optional
 import asyncio
+import os
+import time
+import logging
 
-async def verify_claim(claim: str) -> dict:
+logger = logging.getLogger(__name__)
+
+# Seconds gather_sources waits for evidence before moving on with whatever
+# sources have returned (0 disables the budget)
+EVIDENCE_BUDGET_SECONDS = float(os.getenv("EVIDENCE_BUDGET_SECONDS", "0"))
+
+EARLY_EXIT_SKIPPED = "Skipped after authoritative match"
+
+# Called with (source name, result) as each source finishes
+SourceCallback = Callable[[str, dict], Awaitable[None]]
+
+# Source name -> (label used in logs, empty result used when the tool raises)
+SOURCE_FALLBACKS = {
+    "fact_check_api": ("Fact Check API", {"claims": []}),
+    "google_search": ("Google Search", {"results": []}),
+    "indian_factcheckers": ("Indian fact-checkers", {"results": []}),
+    "web_scraper": ("Web scraper", {"results": []}),
+    "news_api": ("NewsAPI", {"results": []}),
+}
+
+
+async def _run_source(name: str, coro) -> tuple:
+    try:
+        with span(f"sources.{name}", histogram=None):
+            return name, await coro
+    except Exception as e:
+        label, empty = SOURCE_FALLBACKS[name]
+        logger.warning(f"{label} error: {e}", extra={"source": name})
+        return name, dict(empty, error=str(e))
+
+
+def _source_tools() -> dict:
+    # Resolved at call time so the module-level tool names can be swapped out (benchmarks)
+    return {
+        "fact_check_api": search_fact_check_api,
+        "google_search": search_google,
+        "indian_factcheckers": search_all_indian_factcheckers,
+        "web_scraper": scrape_news_search,
+        "news_api": scrape_news_api,
+    }
+
+
+def start_sources(
+    cleaned_claim: str,
+    names: Optional[Iterable[str]] = None,
+    stop_when: Optional[Callable[[list], bool]] = None
+) -> Dict[str, asyncio.Task]:
+    """
+    Starts verification tools as tasks without waiting for them.
+    
+    Args:
+        cleaned_claim: Claim after clean_text
+        names: Sources to start (defaults to all of SOURCE_FALLBACKS)
+        stop_when: Early-exit check handed to the Indian fact-checkers so
+            they can stop at the first matching scraper
+    
+    Returns:
+        Dictionary of source name -> task resolving to (name, result)
+    """
+    tools = _source_tools()
+    if stop_when is not None:
+        tools["indian_factcheckers"] = partial(tools["indian_factcheckers"], stop_when=stop_when)
+    return {
+        name: asyncio.create_task(_run_source(name, tools[name](cleaned_claim)))
+        for name in (names if names is not None else SOURCE_FALLBACKS)
+    }
+
+
+async def gather_sources(
+    cleaned_claim: str,
+    on_source: Optional[SourceCallback] = None,
+    prefetched: Optional[Dict[str, asyncio.Task]] = None,
+    stop_when: Optional[Callable[[list], bool]] = None
+) -> dict:
+    """
+    Queries every verification tool in parallel.
+    
+    Args:
+        cleaned_claim: Claim after clean_text
+        on_source: Optional coroutine called with (source name, result) as
+            each source finishes
+        prefetched: Tasks from start_sources that were already started
+            (e.g. speculatively); only the remaining sources are queried
+        stop_when: Optional check run on each source's claims/results; once
+            it returns True the outstanding sources are cancelled
+    
+    Returns:
+        Dictionary of source name -> tool result (tool errors, sources still
+        running when EVIDENCE_BUDGET_SECONDS runs out and sources cancelled
+        by stop_when become empty results with an "error" key)
+    """
+    # Run verification tools in parallel (Google APIs + Indian Fact-Checkers + Web Scraper)
+    tasks = dict(prefetched or {})
+    tasks.update(start_sources(cleaned_claim, [name for name in SOURCE_FALLBACKS if name not in tasks], stop_when))
+    
+    # Collect results as each source finishes, until the evidence budget runs out
+    deadline = time.monotonic() + EVIDENCE_BUDGET_SECONDS if EVIDENCE_BUDGET_SECONDS > 0 else None
+    source_results = {}
+    pending = set(tasks.values())
+    stopped = False
+    try:
+        while pending and not stopped:
+            timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+            done, pending = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+            if not done:
+                break
+            for task in done:
+                name, result = task.result()
+                source_results[name] = result
+                if on_source is not None:
+                    await on_source(name, result)
+                if stop_when is not None and stop_when(result.get("claims", []) + result.get("results", [])):
+                    stopped = True
+    finally:
+        for task in tasks.values():
+            task.cancel()
+    
+    for name in tasks:
+        if name not in source_results:
+            label, empty = SOURCE_FALLBACKS[name]
+            if stopped:
+                source_results[name] = dict(empty, error=EARLY_EXIT_SKIPPED)
+            else:
+                logger.info(f"{label} missed the {EVIDENCE_BUDGET_SECONDS:.1f}s evidence budget")
+                source_results[name] = dict(empty, error="Evidence budget exceeded")
+    
+    return source_results
+
+
+async def _known_factchecks(cleaned_claim: str) -> list:
+    """Nearest harvested fact-checks to the claim (empty when the index is disabled)."""
+    index = get_factcheck_index()
+    if index is None:
+        return []
+    try:
+        return await index.similar(cleaned_claim)
+    except Exception as e:
+        logger.warning(f"Fact-check index error: {str(e)}")
+        return []
+
+
+def combine_search_results(source_results: dict) -> list:
+    """Flattens the search-style sources into one list, Indian fact-checkers first."""
+    indian_results = source_results["indian_factcheckers"]
+    google_results = source_results["google_search"]
+    scraper_results = source_results["web_scraper"]
+    news_results = source_results["news_api"]
+    
+    # Combine all search results (Indian Fact-Checkers + Google + Scraper + NewsAPI)
+    all_search_results = []
+    all_search_results.extend(indian_results.get("results", []))  # Prioritize Indian sources
+    all_search_results.extend(google_results.get("results", []))
+    all_search_results.extend(scraper_results.get("results", []))
+    all_search_results.extend(news_results.get("results", []))
+    
+    logger.debug("🇮🇳 Total search results: %d", len(all_search_results), extra={
+        "indian": len(indian_results.get("results", [])),
+        "google": len(google_results.get("results", [])),
+        "scraper": len(scraper_results.get("results", [])),
+        "news_api": len(news_results.get("results", []))
+    })
+    
+    return all_search_results
+
+
+def select_evidence(cleaned_claim: str, all_search_results: list) -> list:
+    """Results sent to the LLM: ranked and deduplicated, or all of them with EVIDENCE_RANKING_ENABLED off."""
+    if not EVIDENCE_RANKING_ENABLED:
+        return all_search_results
+    evidence = rank_evidence(cleaned_claim, all_search_results)
+    logger.debug("Evidence: kept %d of %d results", len(evidence), len(all_search_results))
+    return evidence
+
+
+def build_verification_results(
+    claim: str,
+    cleaned_claim: str,
+    source_results: dict,
+    all_search_results: list,
+    ai_analysis: dict,
+    evidence: Optional[list] = None
+) -> dict:
+    """Compiles source results, the evidence sent to the LLM and the AI analysis into the verification result dict."""
+    fact_check_results = source_results["fact_check_api"]
+    indian_results = source_results["indian_factcheckers"]
+    google_results = source_results["google_search"]
+    scraper_results = source_results["web_scraper"]
+    news_results = source_results["news_api"]
+    
+    return {
+        "claim": claim,
+        "cleaned_claim": cleaned_claim,
+        "fact_check_api": fact_check_results,
+        "indian_factcheckers": indian_results,
+        "google_search": google_results,
+        "web_scraper": scraper_results,
+        "news_api": news_results,
+        "evidence": evidence or [],
+        "ai_analysis": ai_analysis,
+        "verification_summary": {
+            "fact_check_found": len(fact_check_results.get("claims", [])) > 0,
+            "indian_results_count": len(indian_results.get("results", [])),
+            "google_results_count": len(google_results.get("results", [])),
+            "scraper_results_count": len(scraper_results.get("results", [])),
+            "news_results_count": len(news_results.get("results", [])),
+            "evidence_count": len(evidence or []),
+            "ai_confidence": ai_analysis.get("confidence", 0.0),
+            "total_sources": len(all_search_results) + len(fact_check_results.get("claims", []))
+        }
+    }
+
+
+def verification_error(claim: str, error: Exception) -> dict:
+    """Result returned when verification fails outright."""
+    logger.error(f"Error in verification agent: {str(error)}")
+    return {
+        "claim": claim,
+        "error": str(error),
+        "fact_check_api": {"claims": []},
+        "google_search": {"results": []},
+        "ai_analysis": {
+            "verdict_suggestion": "UNVERIFIED",
+            "confidence": 0.0,
+            "reasoning": [f"Error: {str(error)}"]
+        },
+        "verification_summary": {
+            "fact_check_found": False,
+            "google_results_count": 0,
+            "ai_confidence": 0.0,
+            "total_sources": 0
+        }
+    }
+
+
+async def verify_claim(
+    claim: str,
+    on_source: Optional[SourceCallback] = None,
+    prefetched: Optional[Dict[str, asyncio.Task]] = None,
+    fused: bool = False,
+    early_exit: bool = False
+) -> dict:
     """
     Verifies a claim using multiple sources and AI analysis.
     
     Args:
         claim: The extracted factual claim to verify
+        on_source: Optional coroutine called with (source name, result) as
+            each source finishes, before the AI analysis runs
+        prefetched: Source tasks already started by start_sources
+        fused: Write the explanation in the same Gemini call as the analysis
+            (it is returned under ai_analysis["explanation"])
+        early_exit: Stop at the first authoritative fact-check matching the
+            claim (checking the harvested fact-checks before any source is
+            queried) and build the analysis from it without Gemini (see
+            app.agents.early_exit)
     
     Returns:
         Dictionary containing verification results from all sources
@@ -20,95 +279,53 @@ async def verify_claim(claim: str) -> dict:
         # Clean the claim
         cleaned_claim = clean_text(claim)
         
-        # Run verification tools in parallel (Google APIs + Indian Fact-Checkers + Web Scraper)
-        fact_check_task = search_fact_check_api(cleaned_claim)
-        google_search_task = search_google(cleaned_claim)
-        indian_factcheckers_task = search_all_indian_factcheckers(cleaned_claim)
-        web_scraper_task = scrape_news_search(cleaned_claim)
-        news_api_task = scrape_news_api(cleaned_claim)
-        
-        # Wait for all results
-        fact_check_results, google_results, indian_results, scraper_results, news_results = await asyncio.gather(
-            fact_check_task,
-            google_search_task,
-            indian_factcheckers_task,
-            web_scraper_task,
-            news_api_task,
-            return_exceptions=True
-        )
-        
-        # Handle exceptions
-        if isinstance(fact_check_results, Exception):
-            print(f"Fact Check API error: {fact_check_results}")
-            fact_check_results = {"claims": [], "error": str(fact_check_results)}
-            
-        if isinstance(google_results, Exception):
-            print(f"Google Search error: {google_results}")
-            google_results = {"results": [], "error": str(google_results)}
-        
-        if isinstance(indian_results, Exception):
-            print(f"Indian fact-checkers error: {indian_results}")
-            indian_results = {"results": [], "error": str(indian_results)}
+        # Known fact-checks first: a match needs no network call at all
+        if early_exit:
+            with span("known_factchecks"):
+                known = await _known_factchecks(cleaned_claim)
+        else:
+            known = []
+        match = authoritative_match(cleaned_claim, known) if known else None
         
-        if isinstance(scraper_results, Exception):
-            print(f"Web scraper error: {scraper_results}")
-            scraper_results = {"results": [], "error": str(scraper_results)}
-            
-        if isinstance(news_results, Exception):
-            print(f"NewsAPI error: {news_results}")
-            news_results = {"results": [], "error": str(news_results)}
-        
-        # Combine all search results (Indian Fact-Checkers + Google + Scraper + NewsAPI)
-        all_search_results = []
-        all_search_results.extend(indian_results.get("results", []))  # Prioritize Indian sources
-        all_search_results.extend(google_results.get("results", []))
-        all_search_results.extend(scraper_results.get("results", []))
-        all_search_results.extend(news_results.get("results", []))
+        if match:
+            for task in (prefetched or {}).values():
+                task.cancel()
+            source_results = {name: dict(empty, error=EARLY_EXIT_SKIPPED) for name, (_, empty) in SOURCE_FALLBACKS.items()}
+            source_results["indian_factcheckers"] = {
+                "results": [item for item in known if item["url"] == match["url"]],
+                "from_index": True
+            }
+            if on_source is not None:
+                await on_source("indian_factcheckers", source_results["indian_factcheckers"])
+        else:
+            stop_when = partial(authoritative_match, cleaned_claim) if early_exit else None
+            with span("sources"):
+                source_results = await gather_sources(cleaned_claim, on_source=on_source, prefetched=prefetched, stop_when=stop_when)
+        all_search_results = combine_search_results(source_results)
         
-        print(f"🇮🇳 Total search results: {len(all_search_results)} (Indian: {len(indian_results.get('results', []))}, Google: {len(google_results.get('results', []))}, Scraper: {len(scraper_results.get('results', []))}, NewsAPI: {len(news_results.get('results', []))})")
+        if early_exit and not match:
+            fact_check_claims = source_results["fact_check_api"].get("claims", [])
+            match = authoritative_match(cleaned_claim, fact_check_claims + all_search_results)
         
-        # Use Gemini AI to analyze all search results
-        ai_analysis = await analyze_with_gemini(cleaned_claim, all_search_results)
+        # Use Gemini AI to analyze the best of the search results
+        if match:
+            skipped = [name for name, result in source_results.items() if result.get("error") == EARLY_EXIT_SKIPPED]
+            logger.info(f"Authoritative match from {match['publisher']} ({match['similarity']:.0%}), skipped: {', '.join(skipped) or 'none'}")
+            record_early_exit(len(skipped))
+            evidence = None
+            ai_analysis = fast_path_analysis(match, len(all_search_results))
+        else:
+            with span("evidence_ranking"):
+                evidence = select_evidence(cleaned_claim, all_search_results)
+            with span("analysis"):
+                if fused:
+                    fact_check_claims = source_results["fact_check_api"].get("claims", [])
+                    ai_analysis = await analyze_and_explain(cleaned_claim, evidence, fact_check_claims)
+                else:
+                    ai_analysis = await analyze_with_gemini(cleaned_claim, evidence)
         
         # Compile verification results
-        verification_results = {
-            "claim": claim,
-            "cleaned_claim": cleaned_claim,
-            "fact_check_api": fact_check_results,
-            "indian_factcheckers": indian_results,
-            "google_search": google_results,
-            "web_scraper": scraper_results,
-            "news_api": news_results,
-            "ai_analysis": ai_analysis,
-            "verification_summary": {
-                "fact_check_found": len(fact_check_results.get("claims", [])) > 0,
-                "indian_results_count": len(indian_results.get("results", [])),
-                "google_results_count": len(google_results.get("results", [])),
-                "scraper_results_count": len(scraper_results.get("results", [])),
-                "news_results_count": len(news_results.get("results", [])),
-                "ai_confidence": ai_analysis.get("confidence", 0.0),
-                "total_sources": len(all_search_results) + len(fact_check_results.get("claims", []))
-            }
-        }
-        
-        return verification_results
+        return build_verification_results(claim, cleaned_claim, source_results, all_search_results, ai_analysis, evidence)
         
     except Exception as e:
-        print(f"Error in verification agent: {str(e)}")
-        return {
-            "claim": claim,
-            "error": str(e),
-            "fact_check_api": {"claims": []},
-            "google_search": {"results": []},
-            "ai_analysis": {
-                "verdict_suggestion": "UNVERIFIED",
-                "confidence": 0.0,
-                "reasoning": [f"Error: {str(e)}"]
-            },
-            "verification_summary": {
-                "fact_check_found": False,
-                "google_results_count": 0,
-                "ai_confidence": 0.0,
-                "total_sources": 0
-            }
-        }
+        return verification_error(claim, e)
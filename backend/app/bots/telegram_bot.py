@@ -7,10 +7,18 @@ import os
 import asyncio
 from telegram import Update
 from telegram.ext import Application, CommandHandler, MessageHandler, filters, ContextTypes
-from app.agents.extractor_agent import extract_claim
-from app.agents.verification_agent import verify_claim
-from app.agents.verdict_agent import determine_verdict
-from app.agents.explanation_agent import generate_explanation
+from app.agents.pipeline import run_pipeline, describe_error, NoClaimFoundError
+from app.utils.llm_governor import llm_lane
+from app.tools.http_session import close_session
+from app.cache import close_cache
+from app.tools.parse_pool import shutdown_parse_pool
+from app.factcheck_index import close_factcheck_index
+from app.utils.logging_config import configure_logging, shutdown_logging, set_request_id
+from app.utils.traffic_capture import capture_request, close_traffic_recorder
+from app.metrics import collect_timings, span
+import logging
+
+logger = logging.getLogger(__name__)
 
 # Get bot token from environment
 BOT_TOKEN = os.getenv("TELEGRAM_BOT_TOKEN")
@@ -119,6 +127,7 @@ async def verify_message(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """
     user_text = update.message.text
     user_name = update.effective_user.first_name
+    set_request_id(f"tg-{update.update_id}")
     
     # Send initial "processing" message
     processing_msg = await update.message.reply_text(
@@ -126,47 +135,57 @@ async def verify_message(update: Update, context: ContextTypes.DEFAULT_TYPE):
         parse_mode='Markdown'
     )
     
+    async def on_stage(stage: str, payload: dict):
+        if stage == "extracted":
+            # Step 2: Verify with all sources
+            await processing_msg.edit_text(
+                f"🔍 **Step 2/4:** Verifying with Indian fact-checkers...\n\n"
+                f"_Claim: {payload['extracted_claim']}_",
+                parse_mode='Markdown'
+            )
+        elif stage == "verification":
+            # Step 3: Determine verdict
+            await processing_msg.edit_text(
+                "🔍 **Step 3/4:** AI analyzing all sources...",
+                parse_mode='Markdown'
+            )
+        elif stage == "verdict":
+            # Step 4: Generate explanation
+            await processing_msg.edit_text(
+                "🔍 **Step 4/4:** Generating detailed explanation...",
+                parse_mode='Markdown'
+            )
+    
     try:
         # Step 1: Extract claims
         await processing_msg.edit_text(
             "🔍 **Step 1/4:** Extracting claims with AI...",
             parse_mode='Markdown'
         )
-        claim = await extract_claim(user_text)
         
-        if not claim or len(claim.strip()) == 0:
+        try:
+            with collect_timings() as timings, llm_lane("telegram"):
+                with span("total", histogram=None):
+                    result = await run_pipeline(user_text, on_stage=on_stage)
+            capture_request("telegram", user_text, 200, timings, result)
+        except NoClaimFoundError:
+            capture_request("telegram", user_text, 422, timings)
             await processing_msg.edit_text(
                 "❌ No verifiable claims found in your text.\n\n"
                 "Try sending a more specific statement or claim!",
                 parse_mode='Markdown'
             )
             return
+        except Exception as e:
+            capture_request("telegram", user_text, describe_error(e)[0], timings)
+            raise
         
-        # Step 2: Verify with all sources
-        await processing_msg.edit_text(
-            f"🔍 **Step 2/4:** Verifying with Indian fact-checkers...\n\n"
-            f"_Claim: {claim}_",
-            parse_mode='Markdown'
-        )
-        verification_results = await verify_claim(claim)
-        
-        # Step 3: Determine verdict
-        await processing_msg.edit_text(
-            "🔍 **Step 3/4:** AI analyzing all sources...",
-            parse_mode='Markdown'
-        )
-        verdict_data = determine_verdict(verification_results)
-        
-        # Step 4: Generate explanation
-        await processing_msg.edit_text(
-            "🔍 **Step 4/4:** Generating detailed explanation...",
-            parse_mode='Markdown'
-        )
-        explanation = await generate_explanation(user_text, claim, verification_results, verdict_data)
+        response = result["response"]
+        claim = response.extracted_claim
         
         # Build result message
-        verdict = verdict_data.get("verdict", "UNVERIFIED")
-        confidence = verdict_data.get("confidence", 0.0)
+        verdict = response.verdict.value
+        confidence = response.confidence_score
         
         # Verdict emoji
         verdict_emoji = {
@@ -177,12 +196,12 @@ async def verify_message(update: Update, context: ContextTypes.DEFAULT_TYPE):
         }.get(verdict, "❓")
         
         # Count sources
-        indian_count = verification_results.get("verification_summary", {}).get("indian_results_count", 0)
-        total_sources = verification_results.get("verification_summary", {}).get("total_sources", 0)
+        indian_count = result["verification_summary"].get("indian_results_count", 0)
+        total_sources = result["verification_summary"].get("total_sources", 0)
         
         # Get explanation text
-        real_news = explanation.get("real_news_summary", "")
-        detailed = explanation.get("detailed_explanation", "")
+        real_news = response.real_news_summary
+        detailed = response.detailed_explanation
         
         result_message = f"""
 {verdict_emoji} **Verdict: {verdict}**
@@ -210,29 +229,42 @@ _Verified by FactCheckit AI_
     except Exception as e:
         error_message = f"❌ Error processing your request:\n\n`{str(e)}`\n\nPlease try again later."
         await processing_msg.edit_text(error_message, parse_mode='Markdown')
-        print(f"Telegram bot error: {str(e)}")
+        logger.error(f"Telegram bot error: {str(e)}")
 
 
 async def error_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """
     Handle errors
     """
-    print(f"Update {update} caused error {context.error}")
+    logger.error(f"Update caused error: {context.error}", extra={"update_id": getattr(update, "update_id", None)})
+
+
+async def post_shutdown(application: Application):
+    """
+    Release the shared HTTP connection pool, cache and fact-check index and flush queued logs when the bot stops
+    (the API process harvests the index; the bot only reads it)
+    """
+    await close_session()
+    await close_cache()
+    shutdown_parse_pool()
+    close_factcheck_index()
+    close_traffic_recorder()
+    shutdown_logging()
 
 
 def run_bot():
     """
     Run the Telegram bot
     """
+    configure_logging()
     if not BOT_TOKEN:
-        print("❌ TELEGRAM_BOT_TOKEN not found in environment variables!")
-        print("Please set TELEGRAM_BOT_TOKEN in your .env file")
+        logger.error("❌ TELEGRAM_BOT_TOKEN not found in environment variables! Please set TELEGRAM_BOT_TOKEN in your .env file")
         return
     
-    print("🤖 Starting FactCheckit Telegram Bot...")
+    logger.info("🤖 Starting FactCheckit Telegram Bot...")
     
     # Create application
-    application = Application.builder().token(BOT_TOKEN).build()
+    application = Application.builder().token(BOT_TOKEN).post_shutdown(post_shutdown).build()
     
     # Add handlers
     application.add_handler(CommandHandler("start", start_command))
@@ -242,7 +274,7 @@ def run_bot():
     application.add_error_handler(error_handler)
     
     # Run bot
-    print("✅ Bot is running! Press Ctrl+C to stop.")
+    logger.info("✅ Bot is running! Press Ctrl+C to stop.")
     application.run_polling(allowed_updates=Update.ALL_TYPES)
 
 
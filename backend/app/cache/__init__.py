@@ -0,0 +1,119 @@
+"""
+Shared cache for pipeline results.
+
+The backend is chosen with CACHE_BACKEND:
+- memory: in-process LRU (default, per worker)
+- sqlite: on-disk file shared by every process on the host (CACHE_SQLITE_PATH)
+- redis: any Redis-protocol server shared across hosts (CACHE_REDIS_URL)
+
+Keys are namespaced: "tool:<source>:..." for per-tool responses,
+"llm:..." for Gemini outputs and "verdict:..." for final verdicts.
+"""
+
+import functools
+import os
+from typing import Optional
+
+from dotenv import load_dotenv
+
+from app.cache.base import CacheBackend, make_key
+from app.cache.memory import MemoryBackend
+from app.cache.sqlite import SQLiteBackend
+from app.cache.redis import RedisBackend
+from app.metrics import count_cache_lookup
+from app.utils.singleflight import SingleFlight
+
+load_dotenv()
+
+CACHE_BACKEND = os.getenv("CACHE_BACKEND", "memory").lower()
+CACHE_MAX_ENTRIES = int(os.getenv("CACHE_MAX_ENTRIES", "10000"))
+CACHE_SQLITE_PATH = os.getenv("CACHE_SQLITE_PATH", "cache.sqlite3")
+CACHE_REDIS_URL = os.getenv("CACHE_REDIS_URL", "redis://localhost:6379/0")
+CACHE_REDIS_TIMEOUT = float(os.getenv("CACHE_REDIS_TIMEOUT", "2"))
+
+# Per-namespace TTLs in seconds
+CACHE_TOOL_TTL = float(os.getenv("CACHE_TOOL_TTL", "900"))
+CACHE_LLM_TTL = float(os.getenv("CACHE_LLM_TTL", "3600"))
+CACHE_VERDICT_TTL = float(os.getenv("CACHE_VERDICT_TTL", "3600"))
+
+_cache: Optional[CacheBackend] = None
+
+
+def create_backend(kind: str = CACHE_BACKEND) -> CacheBackend:
+    """
+    Builds a cache backend from configuration.
+
+    Args:
+        kind: "memory", "sqlite" or "redis"
+    """
+    if kind == "memory":
+        return MemoryBackend(max_entries=CACHE_MAX_ENTRIES)
+    if kind == "sqlite":
+        return SQLiteBackend(path=CACHE_SQLITE_PATH)
+    if kind == "redis":
+        return RedisBackend(url=CACHE_REDIS_URL, timeout=CACHE_REDIS_TIMEOUT)
+    raise ValueError(f"Unknown CACHE_BACKEND: {kind}")
+
+
+def get_cache() -> CacheBackend:
+    """Returns the process-wide cache backend, creating it on first use."""
+    global _cache
+    if _cache is None:
+        _cache = create_backend()
+    return _cache
+
+
+def set_cache(backend: Optional[CacheBackend]) -> None:
+    """Replaces the process-wide cache backend (None resets to configuration)."""
+    global _cache
+    _cache = backend
+
+
+async def close_cache() -> None:
+    global _cache
+    if _cache is not None:
+        await _cache.close()
+    _cache = None
+
+
+def cached_tool(source: str, ttl: float = CACHE_TOOL_TTL):
+    """
+    Caches a tool's response per (source, claim) in the shared backend.
+
+    Responses carrying an "error" key are not cached, so transient failures
+    are retried on the next request. Concurrent misses for the same key
+    share one call to the tool (see app.utils.singleflight).
+
+    Args:
+        source: Tool name used in the key namespace
+        ttl: Seconds to keep a response
+    """
+    flight = SingleFlight(f"tool.{source}")
+
+    def decorator(func):
+        async def fetch_and_store(key: str, claim: str) -> dict:
+            result = await func(claim)
+            if isinstance(result, dict) and not result.get("error"):
+                await get_cache().set(key, result, ttl)
+            return result
+
+        @functools.wraps(func)
+        async def wrapper(claim: str) -> dict:
+            key = make_key(f"tool:{source}", claim)
+            cached = await get_cache().get(key)
+            count_cache_lookup(f"tool:{source}", cached is not None)
+            if cached is not None:
+                return cached
+
+            return await flight.do(key, functools.partial(fetch_and_store, key, claim))
+
+        return wrapper
+
+    return decorator
+
+
+__all__ = [
+    "CacheBackend", "MemoryBackend", "SQLiteBackend", "RedisBackend",
+    "make_key", "cached_tool", "create_backend", "get_cache", "set_cache", "close_cache",
+    "CACHE_TOOL_TTL", "CACHE_LLM_TTL", "CACHE_VERDICT_TTL"
+]
@@ -0,0 +1,140 @@
+"""
+Cache backend interface shared by the memory, SQLite and Redis backends.
+
+Values are stored as JSON so every backend (and every process sharing a
+backend) sees the same representation. Pydantic models and enums are
+serialized to plain data on the way in.
+"""
+
+import hashlib
+import json
+import logging
+from enum import Enum
+from typing import Any, Optional
+
+from pydantic import BaseModel
+
+logger = logging.getLogger(__name__)
+
+
+def _json_default(value: Any):
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (set, tuple)):
+        return list(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not cacheable")
+
+
+def make_key(namespace: str, *parts: str) -> str:
+    """
+    Builds a namespaced cache key, hashing the variable parts.
+
+    Example: make_key("tool:altnews", claim) -> "tool:altnews:3f2a..."
+    """
+    digest = hashlib.sha256("\x1f".join(parts).encode("utf-8")).hexdigest()
+    return f"{namespace}:{digest}"
+
+
+def encode_value(value: Any) -> str:
+    return json.dumps(value, default=_json_default, ensure_ascii=False)
+
+
+def decode_value(raw: str) -> Any:
+    return json.loads(raw)
+
+
+class CacheBackend:
+    """
+    Base class for cache backends.
+
+    Subclasses implement `_get`, `_set`, `_delete` and `_clear` on encoded
+    strings. The public methods handle encoding, counters, and swallow
+    backend errors so a broken cache degrades to a miss instead of failing
+    the request.
+    """
+
+    name = "base"
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.sets = 0
+        self.errors = 0
+
+    async def _get(self, key: str) -> Optional[str]:
+        raise NotImplementedError
+
+    async def _set(self, key: str, raw: str, ttl: Optional[float]) -> None:
+        raise NotImplementedError
+
+    async def _delete(self, key: str) -> None:
+        raise NotImplementedError
+
+    async def _clear(self) -> None:
+        raise NotImplementedError
+
+    async def get(self, key: str) -> Optional[Any]:
+        """
+        Fetches a value.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Decoded value, or None on a miss or backend error
+        """
+        try:
+            raw = await self._get(key)
+        except Exception as e:
+            self.errors += 1
+            logger.warning(f"Cache get failed ({self.name}): {e}")
+            return None
+
+        if raw is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return decode_value(raw)
+
+    async def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Stores a value.
+
+        Args:
+            key: Cache key
+            value: JSON-serializable value (pydantic models and enums allowed)
+            ttl: Seconds until expiry, or None to keep until evicted
+        """
+        try:
+            await self._set(key, encode_value(value), ttl)
+            self.sets += 1
+        except Exception as e:
+            self.errors += 1
+            logger.warning(f"Cache set failed ({self.name}): {e}")
+
+    async def delete(self, key: str) -> None:
+        try:
+            await self._delete(key)
+        except Exception as e:
+            self.errors += 1
+            logger.warning(f"Cache delete failed ({self.name}): {e}")
+
+    async def clear(self) -> None:
+        await self._clear()
+
+    async def close(self) -> None:
+        pass
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "backend": self.name,
+            "hits": self.hits,
+            "misses": self.misses,
+            "sets": self.sets,
+            "errors": self.errors,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0
+        }
@@ -0,0 +1,59 @@
+import time
+from collections import OrderedDict
+from typing import Optional
+
+from app.cache.base import CacheBackend
+
+
+class MemoryBackend(CacheBackend):
+    """
+    In-process LRU cache with per-entry TTL.
+
+    Args:
+        max_entries: Entries kept before the least recently used is evicted
+    """
+
+    name = "memory"
+
+    def __init__(self, max_entries: int = 10000):
+        super().__init__()
+        self.max_entries = max_entries
+        self.evictions = 0
+        self._entries = OrderedDict()  # key -> (expires_at or None, raw)
+
+    async def _get(self, key: str) -> Optional[str]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, raw = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return raw
+
+    async def _set(self, key: str, raw: str, ttl: Optional[float]) -> None:
+        expires_at = time.monotonic() + ttl if ttl else None
+        self._entries[key] = (expires_at, raw)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    async def _delete(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+    async def _clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> dict:
+        stats = super().stats()
+        stats.update({
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "evictions": self.evictions
+        })
+        return stats
@@ -0,0 +1,207 @@
+"""
+Redis-protocol cache backend.
+
+Speaks RESP2 directly over asyncio streams, so it works with Redis, Valkey,
+KeyDB or any local fake that implements GET/SET/DEL without adding a client
+library dependency.
+"""
+
+import asyncio
+from typing import List, Optional
+from urllib.parse import urlparse
+
+from app.cache.base import CacheBackend
+
+
+class RedisError(Exception):
+    """Error reply returned by the server."""
+
+
+def _encode_command(*args) -> bytes:
+    parts = [f"*{len(args)}\r\n".encode()]
+    for arg in args:
+        data = arg if isinstance(arg, bytes) else str(arg).encode()
+        parts.append(f"${len(data)}\r\n".encode())
+        parts.append(data + b"\r\n")
+    return b"".join(parts)
+
+
+async def _read_reply(reader: asyncio.StreamReader):
+    line = await reader.readline()
+    if not line:
+        raise ConnectionError("Connection closed by server")
+
+    kind, payload = line[:1], line[1:-2]
+    if kind == b"+":
+        return payload.decode()
+    if kind == b"-":
+        raise RedisError(payload.decode())
+    if kind == b":":
+        return int(payload)
+    if kind == b"$":
+        length = int(payload)
+        if length == -1:
+            return None
+        data = await reader.readexactly(length + 2)
+        return data[:-2]
+    if kind == b"*":
+        count = int(payload)
+        if count == -1:
+            return None
+        return [await _read_reply(reader) for _ in range(count)]
+    raise RedisError(f"Unknown reply type: {line!r}")
+
+
+class _Connection:
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+
+    async def execute(self, *args):
+        self.writer.write(_encode_command(*args))
+        await self.writer.drain()
+        return await _read_reply(self.reader)
+
+    def close(self):
+        self.writer.close()
+
+
+class RedisBackend(CacheBackend):
+    """
+    Cache stored in a Redis-compatible server.
+
+    Connecting (including AUTH/SELECT), waiting for a pooled connection and
+    each command are bounded by `timeout`, so an unreachable or stalled
+    server degrades to cache misses instead of hanging requests. A
+    connection interrupted mid-command (timeout, error or cancellation) is
+    closed rather than returned to the pool, and its pool slot is released.
+
+    Args:
+        url: redis://[:password@]host[:port][/db]
+        pool_size: Maximum open connections
+        key_prefix: Prefix applied to every key
+        timeout: Seconds allowed to connect, to wait for a connection and per command
+    """
+
+    name = "redis"
+
+    def __init__(
+        self,
+        url: str = "redis://localhost:6379/0",
+        pool_size: int = 4,
+        key_prefix: str = "factcheckit:",
+        timeout: float = 2.0
+    ):
+        super().__init__()
+        parsed = urlparse(url)
+        self.url = url
+        self.host = parsed.hostname or "localhost"
+        self.port = parsed.port or 6379
+        self.password = parsed.password
+        self.db = int(parsed.path.lstrip("/") or 0)
+        self.pool_size = pool_size
+        self.key_prefix = key_prefix
+        self.timeout = timeout
+
+        self._idle: List[_Connection] = []
+        self._open = 0
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def _connect(self) -> _Connection:
+        reader, writer = await asyncio.open_connection(self.host, self.port)
+        connection = _Connection(reader, writer)
+        try:
+            if self.password:
+                await connection.execute("AUTH", self.password)
+            if self.db:
+                await connection.execute("SELECT", self.db)
+        except BaseException:
+            connection.close()
+            raise
+        return connection
+
+    def _reset_if_new_loop(self):
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._idle = []
+            self._open = 0
+            self._slots = asyncio.Semaphore(self.pool_size)
+            self._loop = loop
+
+    async def _acquire(self) -> _Connection:
+        self._reset_if_new_loop()
+        # A slot is held from here until _release, whatever happens in between
+        await asyncio.wait_for(self._slots.acquire(), self.timeout)
+        if self._idle:
+            return self._idle.pop()
+
+        self._open += 1
+        try:
+            return await asyncio.wait_for(self._connect(), self.timeout)
+        except BaseException:
+            self._open -= 1
+            self._slots.release()
+            raise
+
+    def _release(self, connection: _Connection, broken: bool = False):
+        if broken:
+            connection.close()
+            self._open -= 1
+        else:
+            self._idle.append(connection)
+        self._slots.release()
+
+    async def execute(self, *args):
+        """Runs one command on a pooled connection."""
+        connection = await self._acquire()
+        try:
+            reply = await asyncio.wait_for(connection.execute(*args), self.timeout)
+        except RedisError:
+            self._release(connection)
+            raise
+        except BaseException:
+            # The reply may still be in flight: the connection cannot be reused
+            self._release(connection, broken=True)
+            raise
+        self._release(connection)
+        return reply
+
+    async def _get(self, key: str) -> Optional[str]:
+        reply = await self.execute("GET", self.key_prefix + key)
+        return reply.decode() if reply is not None else None
+
+    async def _set(self, key: str, raw: str, ttl: Optional[float]) -> None:
+        if ttl:
+            await self.execute("SET", self.key_prefix + key, raw.encode(), "PX", int(ttl * 1000))
+        else:
+            await self.execute("SET", self.key_prefix + key, raw.encode())
+
+    async def _delete(self, key: str) -> None:
+        await self.execute("DEL", self.key_prefix + key)
+
+    async def _clear(self) -> None:
+        # Only remove our own keys; the server may be shared
+        cursor = b"0"
+        while True:
+            cursor, keys = await self.execute("SCAN", cursor, "MATCH", self.key_prefix + "*", "COUNT", 500)
+            if keys:
+                await self.execute("DEL", *keys)
+            if cursor in (b"0", "0"):
+                break
+
+    async def close(self) -> None:
+        for connection in self._idle:
+            connection.close()
+        self._idle = []
+        self._open = 0
+
+    def stats(self) -> dict:
+        stats = super().stats()
+        stats.update({
+            "host": self.host,
+            "port": self.port,
+            "db": self.db,
+            "open_connections": self._open
+        })
+        return stats
@@ -0,0 +1,98 @@
+import asyncio
+import sqlite3
+import threading
+import time
+from typing import Optional
+
+from app.cache.base import CacheBackend
+
+
+class SQLiteBackend(CacheBackend):
+    """
+    On-disk cache shared by every process that points at the same file.
+
+    Uses WAL mode so several uvicorn workers and the Telegram bot can read
+    concurrently. Queries run on a worker thread to keep the event loop free.
+
+    Args:
+        path: Database file path
+        purge_every: Expired rows are deleted after this many writes
+    """
+
+    name = "sqlite"
+
+    def __init__(self, path: str = "cache.sqlite3", purge_every: int = 500):
+        super().__init__()
+        self.path = path
+        self.purge_every = purge_every
+        self._writes = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=5.0)
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL)"
+            )
+            self._conn.commit()
+
+    def _get_sync(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM cache WHERE key = ?", (key,)
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        value, expires_at = row
+        if expires_at is not None and expires_at <= time.time():
+            return None
+        return value
+
+    def _set_sync(self, key: str, raw: str, ttl: Optional[float]) -> None:
+        expires_at = time.time() + ttl if ttl else None
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, raw, expires_at)
+            )
+            self._writes += 1
+            if self._writes % self.purge_every == 0:
+                self._conn.execute(
+                    "DELETE FROM cache WHERE expires_at IS NOT NULL AND expires_at <= ?",
+                    (time.time(),)
+                )
+            self._conn.commit()
+
+    def _delete_sync(self, key: str) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+            self._conn.commit()
+
+    def _clear_sync(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM cache")
+            self._conn.commit()
+
+    async def _get(self, key: str) -> Optional[str]:
+        return await asyncio.to_thread(self._get_sync, key)
+
+    async def _set(self, key: str, raw: str, ttl: Optional[float]) -> None:
+        await asyncio.to_thread(self._set_sync, key, raw, ttl)
+
+    async def _delete(self, key: str) -> None:
+        await asyncio.to_thread(self._delete_sync, key)
+
+    async def _clear(self) -> None:
+        await asyncio.to_thread(self._clear_sync)
+
+    async def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def stats(self) -> dict:
+        stats = super().stats()
+        stats["path"] = self.path
+        return stats
@@ -0,0 +1,61 @@
+"""
+Local full-text index of Indian fact-check articles.
+
+A background harvester (app.factcheck_index.harvester) crawls the listing
+pages of PIB, Alt News, BOOM, Factly and Vishvas News into an SQLite FTS5
+index. search_all_indian_factcheckers queries it (in milliseconds) next to
+the live search pages and merges its matches in, so articles the sites'
+own search misses still reach the analysis.
+"""
+
+import os
+from typing import Optional
+
+from dotenv import load_dotenv
+
+from app.factcheck_index.store import FactCheckIndex, search_terms
+
+load_dotenv()
+
+FACTCHECK_INDEX_ENABLED = os.getenv("FACTCHECK_INDEX_ENABLED", "true").lower() == "true"
+FACTCHECK_INDEX_PATH = os.getenv("FACTCHECK_INDEX_PATH", "factcheck_index.sqlite3")
+FACTCHECK_INDEX_MIN_MATCH = float(os.getenv("FACTCHECK_INDEX_MIN_MATCH", "0.5"))
+FACTCHECK_INDEX_MAX_RESULTS = int(os.getenv("FACTCHECK_INDEX_MAX_RESULTS", "5"))
+
+_index: Optional[FactCheckIndex] = None
+
+
+def get_factcheck_index() -> Optional[FactCheckIndex]:
+    """Returns the process-wide index (None when FACTCHECK_INDEX_ENABLED is off)."""
+    global _index
+    if _index is None and FACTCHECK_INDEX_ENABLED:
+        _index = FactCheckIndex(
+            path=FACTCHECK_INDEX_PATH,
+            min_match=FACTCHECK_INDEX_MIN_MATCH,
+            max_results=FACTCHECK_INDEX_MAX_RESULTS
+        )
+    return _index
+
+
+def set_factcheck_index(index: Optional[FactCheckIndex]):
+    """Replaces the process-wide index (benchmarks use an in-memory one)."""
+    global _index
+    _index = index
+
+
+def close_factcheck_index():
+    global _index
+    if _index is not None:
+        _index.close()
+        _index = None
+
+
+async def factcheck_index_stats() -> dict:
+    index = get_factcheck_index()
+    return await index.stats() if index is not None else {"enabled": False}
+
+
+__all__ = [
+    "FactCheckIndex", "search_terms", "get_factcheck_index", "set_factcheck_index",
+    "close_factcheck_index", "factcheck_index_stats"
+]
@@ -0,0 +1,160 @@
+"""
+Background harvester for the fact-check index.
+
+Every FACTCHECK_HARVEST_INTERVAL seconds each fact-checker's listing pages
+are fetched (through fetch_page, so unchanged pages cost a conditional
+request), parsed with the scrapers' selectors and stored. Paging stops at
+the first page with no new articles, so steady-state runs read one page
+per source.
+"""
+
+import asyncio
+import os
+import time
+from typing import Optional
+
+from app.factcheck_index import FactCheckIndex, get_factcheck_index
+from app.tools.http_cache import fetch_page
+from app.tools.endpoints import source_url
+from app.tools.indian_factcheckers import RESULT_BUILDERS, HEADERS
+from app.tools.parse_pool import parse_html
+import logging
+
+logger = logging.getLogger(__name__)
+
+FACTCHECK_HARVEST_ENABLED = os.getenv("FACTCHECK_HARVEST_ENABLED", "true").lower() == "true"
+FACTCHECK_HARVEST_INTERVAL = float(os.getenv("FACTCHECK_HARVEST_INTERVAL", "1800"))
+FACTCHECK_HARVEST_PAGES = int(os.getenv("FACTCHECK_HARVEST_PAGES", "3"))
+
+# Parser source -> listing page URL ({page} starts at 1; no placeholder means one page)
+HARVEST_LISTINGS = {
+    "pib_factcheck": source_url("pib_factcheck", "/"),
+    "altnews": source_url("altnews", "/page/{page}/"),
+    "boom": source_url("boom", "/fact-check/{page}"),
+    "factly": source_url("factly", "/category/english/page/{page}/"),
+    "vishvas": source_url("vishvas", "/english/page/{page}/"),
+}
+
+# Articles read from one listing page
+HARVEST_PAGE_LIMIT = 50
+
+
+class Harvester:
+    """
+    Periodically crawls new fact-check articles into the index.
+
+    Args:
+        index: Index to fill
+        interval: Seconds between harvests
+        pages: Maximum listing pages per source per harvest
+    """
+
+    def __init__(self, index: FactCheckIndex, interval: float = FACTCHECK_HARVEST_INTERVAL, pages: int = FACTCHECK_HARVEST_PAGES):
+        self.index = index
+        self.interval = interval
+        self.pages = pages
+        self._task: Optional[asyncio.Task] = None
+
+    async def harvest_source(self, source: str) -> int:
+        """Crawls one source's listing pages; returns the number of new articles."""
+        template = HARVEST_LISTINGS[source]
+        build = RESULT_BUILDERS[source]
+        added = 0
+        for page in range(1, self.pages + 1):
+            if page > 1 and "{page}" not in template:
+                break
+            status, html = await fetch_page(source, template.format(page=page), headers=HEADERS)
+            if status != 200:
+                logger.debug(f"Harvest {source} page {page}: status {status}")
+                break
+
+            results = [build(record) for record in await parse_html(source, html, limit=HARVEST_PAGE_LIMIT)]
+            new = await self.index.add(source, results)
+            added += new
+            if new == 0:
+                # Everything older has been harvested already
+                break
+        return added
+
+    async def harvest_once(self) -> dict:
+        """
+        Crawls every source once.
+
+        Returns:
+            Dictionary of source -> new articles (or the error message)
+        """
+        started = time.perf_counter()
+        outcomes = await asyncio.gather(
+            *(self.harvest_source(source) for source in HARVEST_LISTINGS),
+            return_exceptions=True
+        )
+        summary = {
+            source: (str(outcome) if isinstance(outcome, Exception) else outcome)
+            for source, outcome in zip(HARVEST_LISTINGS, outcomes)
+        }
+        self.index.last_harvest = {
+            "at": time.time(),
+            "seconds": round(time.perf_counter() - started, 2),
+            "new_articles": summary
+        }
+        logger.info("Fact-check harvest complete", extra={"harvested": summary})
+        return summary
+
+    async def _run(self):
+        # Embed the stored articles up front so the first request does not pay for it
+        await self.index.load_vectors()
+        while True:
+            try:
+                await self.harvest_once()
+            except Exception as e:
+                logger.error(f"Fact-check harvest error: {str(e)}")
+            await asyncio.sleep(self.interval)
+
+    def start(self):
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def close(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+_harvester: Optional[Harvester] = None
+
+
+def start_harvester() -> Optional[Harvester]:
+    """Starts the background harvester (no-op when the index or harvesting is disabled)."""
+    global _harvester
+    index = get_factcheck_index()
+    if index is None or not FACTCHECK_HARVEST_ENABLED:
+        return None
+    if _harvester is None:
+        _harvester = Harvester(index)
+    _harvester.start()
+    return _harvester
+
+
+async def close_harvester():
+    global _harvester
+    if _harvester is not None:
+        await _harvester.close()
+        _harvester = None
+
+
+if __name__ == "__main__":
+    # One-off harvest: python -m app.factcheck_index.harvester
+    async def _main():
+        from app.tools.http_session import close_session
+        from app.tools.parse_pool import shutdown_parse_pool
+        try:
+            await Harvester(get_factcheck_index()).harvest_once()
+        finally:
+            await close_session()
+            shutdown_parse_pool()
+
+    asyncio.run(_main())
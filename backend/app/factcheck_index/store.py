@@ -0,0 +1,257 @@
+import asyncio
+import re
+import sqlite3
+import threading
+import time
+from collections import deque
+from typing import List
+
+from app.utils.claim_index import ClaimVectorIndex
+
+# Words (Latin or Devanagari, so Hindi titles from Vishvas News tokenize too)
+_WORD = re.compile(r"[\w\u0900-\u097F]+")
+
+_STOPWORDS = {
+    "the", "and", "for", "are", "was", "were", "has", "have", "had", "this", "that", "with",
+    "from", "will", "not", "but", "its", "all", "can", "who", "what", "when", "where", "which",
+    "their", "they", "them", "been", "being", "into", "over", "about", "after", "than", "then",
+    "also", "only", "just", "viral", "claim", "claims", "says", "said", "fact", "check", "news"
+}
+
+# Terms sent to FTS; long forwarded messages add little beyond the first few
+_MAX_QUERY_TERMS = 16
+
+
+def search_terms(text: str) -> List[str]:
+    """Distinct lowercase content words of a text, in order of appearance."""
+    terms = []
+    for word in _WORD.findall(text.lower()):
+        if len(word) > 2 and word not in _STOPWORDS and word not in terms:
+            terms.append(word)
+    return terms
+
+
+class FactCheckIndex:
+    """
+    SQLite FTS5 index of harvested fact-check articles.
+
+    Articles live in a plain table keyed by URL; an external-content FTS5
+    table over title and snippet is kept in sync by triggers. Queries run on
+    a worker thread to keep the event loop free, like SQLiteBackend.
+
+    Article titles are also held in a ClaimVectorIndex (loaded from the
+    database on first use) for `similar`, which matches a claim against
+    every known fact-check in milliseconds before any network call.
+
+    Args:
+        path: Database file path (":memory:" for a throwaway index)
+        min_match: Fraction of the claim's search terms an article must
+            contain to count as a match
+        max_results: Articles returned per search
+    """
+
+    def __init__(self, path: str = "factcheck_index.sqlite3", min_match: float = 0.5, max_results: int = 5):
+        self.path = path
+        self.min_match = min_match
+        self.max_results = max_results
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=5.0)
+        self._search_times = deque(maxlen=1000)
+        self.searches = 0
+        self.hits = 0
+        self.last_harvest = None
+        self.vectors = ClaimVectorIndex()
+        self._vectors_loaded = False
+        self._vectors_lock = threading.Lock()
+
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript("""
+                CREATE TABLE IF NOT EXISTS articles (
+                    id INTEGER PRIMARY KEY,
+                    url TEXT NOT NULL UNIQUE,
+                    source TEXT NOT NULL,
+                    label TEXT NOT NULL,
+                    title TEXT NOT NULL,
+                    snippet TEXT NOT NULL DEFAULT '',
+                    verdict TEXT NOT NULL DEFAULT 'UNVERIFIED',
+                    credibility TEXT NOT NULL DEFAULT 'medium',
+                    published TEXT NOT NULL DEFAULT '',
+                    harvested_at REAL NOT NULL
+                );
+                CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts USING fts5(
+                    title, snippet, content='articles', content_rowid='id',
+                    tokenize='unicode61 remove_diacritics 2'
+                );
+                CREATE TRIGGER IF NOT EXISTS articles_ai AFTER INSERT ON articles BEGIN
+                    INSERT INTO articles_fts(rowid, title, snippet) VALUES (new.id, new.title, new.snippet);
+                END;
+                CREATE TRIGGER IF NOT EXISTS articles_ad AFTER DELETE ON articles BEGIN
+                    INSERT INTO articles_fts(articles_fts, rowid, title, snippet) VALUES ('delete', old.id, old.title, old.snippet);
+                END;
+            """)
+            self._conn.commit()
+
+    @staticmethod
+    def _vector_payload(result: dict) -> dict:
+        return {
+            "title": result["title"],
+            "snippet": result.get("snippet", ""),
+            "url": result["url"],
+            "source": result.get("source", ""),
+            "verdict": result.get("verdict", "UNVERIFIED"),
+            "credibility": result.get("credibility", "medium"),
+            "date": result.get("date", "")
+        }
+
+    def _load_vectors_sync(self):
+        with self._vectors_lock:
+            if self._vectors_loaded:
+                return
+            with self._lock:
+                rows = self._conn.execute(
+                    "SELECT label, title, snippet, url, verdict, credibility, published FROM articles ORDER BY id"
+                ).fetchall()
+            for label, title, snippet, url, verdict, credibility, published in rows:
+                payload = {
+                    "title": title, "snippet": snippet, "url": url, "source": label,
+                    "verdict": verdict, "credibility": credibility, "date": published
+                }
+                self.vectors.add(url, title, payload)
+            self._vectors_loaded = True
+
+    def _add_sync(self, source: str, results: List[dict]) -> int:
+        now = time.time()
+        added = []
+        with self._lock:
+            for result in results:
+                if not result.get("url") or not result.get("title"):
+                    continue
+                cursor = self._conn.execute(
+                    "INSERT INTO articles (url, source, label, title, snippet, verdict, credibility, published, harvested_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?) ON CONFLICT(url) DO NOTHING",
+                    (
+                        result["url"], source, result.get("source", source), result["title"],
+                        result.get("snippet", ""), result.get("verdict", "UNVERIFIED"),
+                        result.get("credibility", "medium"), result.get("date", ""), now
+                    )
+                )
+                if cursor.rowcount:
+                    added.append(result)
+            self._conn.commit()
+
+        with self._vectors_lock:
+            if self._vectors_loaded:
+                for result in added:
+                    self.vectors.add(result["url"], result["title"], self._vector_payload(result))
+        return len(added)
+
+    def _search_sync(self, claim: str) -> List[dict]:
+        terms = search_terms(claim)[:_MAX_QUERY_TERMS]
+        if not terms:
+            return []
+
+        query = " OR ".join(f'"{term}"' for term in terms)
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT a.label, a.title, a.snippet, a.url, a.verdict, a.credibility, a.published "
+                "FROM articles_fts JOIN articles a ON a.id = articles_fts.rowid "
+                "WHERE articles_fts MATCH ? ORDER BY bm25(articles_fts, 2.0, 1.0) LIMIT ?",
+                (query, self.max_results * 4)
+            ).fetchall()
+
+        wanted = set(terms)
+        results = []
+        for label, title, snippet, url, verdict, credibility, published in rows:
+            # OR matches anything sharing one word; keep articles covering most of the claim
+            if len(wanted.intersection(search_terms(f"{title} {snippet}"))) < self.min_match * len(wanted):
+                continue
+            results.append({
+                "title": title,
+                "snippet": snippet,
+                "url": url,
+                "source": label,
+                "verdict": verdict,
+                "credibility": credibility,
+                "date": published
+            })
+            if len(results) >= self.max_results:
+                break
+        return results
+
+    def _count_sync(self) -> dict:
+        with self._lock:
+            return dict(self._conn.execute("SELECT source, COUNT(*) FROM articles GROUP BY source").fetchall())
+
+    async def add(self, source: str, results: List[dict]) -> int:
+        """
+        Stores harvested articles (already-known URLs are skipped).
+
+        Args:
+            source: Parser source key (e.g. "altnews")
+            results: Scraper-shaped results (title, snippet, url, source, verdict, credibility, date)
+
+        Returns:
+            Number of new articles
+        """
+        return await asyncio.to_thread(self._add_sync, source, results)
+
+    async def search(self, claim: str) -> List[dict]:
+        """
+        Finds harvested articles matching a claim.
+
+        Args:
+            claim: Claim text
+
+        Returns:
+            Up to max_results scraper-shaped results, best match first
+        """
+        started = time.perf_counter()
+        results = await asyncio.to_thread(self._search_sync, claim)
+        self._search_times.append(time.perf_counter() - started)
+        self.searches += 1
+        self.hits += bool(results)
+        return results
+
+    async def load_vectors(self):
+        """Embeds every stored article (once; later additions are embedded as they arrive)."""
+        if not self._vectors_loaded:
+            await asyncio.to_thread(self._load_vectors_sync)
+
+    async def similar(self, claim: str, k: int = 5) -> List[dict]:
+        """
+        Nearest known fact-checks to a claim by embedding similarity.
+
+        Args:
+            claim: Claim text
+            k: Maximum results
+
+        Returns:
+            Scraper-shaped results with an added "similarity" (cosine) score;
+            callers confirm matches themselves (e.g. authoritative_match)
+        """
+        await self.load_vectors()
+        # Off the loop: a search scans every vector and waits on the index lock the harvester takes
+        matches = await asyncio.to_thread(self.vectors.search, claim, k)
+        return [dict(payload, similarity=round(score, 3)) for score, _, payload in matches]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    async def stats(self) -> dict:
+        """Article counts per source (counted on a worker thread), search hit rate and latency, last harvest."""
+        articles = await asyncio.to_thread(self._count_sync)
+        times = sorted(self._search_times)
+        return {
+            "path": self.path,
+            "articles": articles,
+            "searches": self.searches,
+            "hits": self.hits,
+            "hit_rate": round(self.hits / self.searches, 4) if self.searches else 0.0,
+            "p50_search_ms": round(times[len(times) // 2] * 1000, 2) if times else 0.0,
+            "p95_search_ms": round(times[min(len(times) - 1, int(0.95 * len(times)))] * 1000, 2) if times else 0.0,
+            "last_harvest": self.last_harvest,
+            "vector_index": dict(self.vectors.stats(), loaded=self._vectors_loaded)
+        }
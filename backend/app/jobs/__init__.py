@@ -0,0 +1,48 @@
+"""
+Asynchronous job mode for verification (POST /api/jobs).
+
+Jobs are queued on a local in-process broker and run by JOB_WORKERS worker
+tasks, so no external services are needed. JOB_QUEUE_MAX bounds the queue;
+submissions beyond it are rejected with 503.
+"""
+
+import os
+from typing import Optional
+
+from dotenv import load_dotenv
+
+from app.jobs.broker import InProcessBroker, BrokerFull
+from app.jobs.manager import JobManager
+
+load_dotenv()
+
+JOB_WORKERS = int(os.getenv("JOB_WORKERS", "4"))
+JOB_QUEUE_MAX = int(os.getenv("JOB_QUEUE_MAX", "1000"))
+JOB_RESULT_TTL = float(os.getenv("JOB_RESULT_TTL", "3600"))
+JOB_WEBHOOK_RETRIES = int(os.getenv("JOB_WEBHOOK_RETRIES", "3"))
+
+_manager: Optional[JobManager] = None
+
+
+def get_job_manager() -> JobManager:
+    """Returns the process-wide job manager, creating it on first use."""
+    global _manager
+    if _manager is None:
+        _manager = JobManager(
+            workers=JOB_WORKERS,
+            broker=InProcessBroker(max_size=JOB_QUEUE_MAX),
+            result_ttl=JOB_RESULT_TTL,
+            webhook_retries=JOB_WEBHOOK_RETRIES
+        )
+    return _manager
+
+
+async def close_job_manager():
+    """Stops the job workers (queued jobs are dropped)."""
+    global _manager
+    if _manager is not None:
+        await _manager.close()
+        _manager = None
+
+
+__all__ = ["JobManager", "InProcessBroker", "BrokerFull", "get_job_manager", "close_job_manager"]
@@ -0,0 +1,57 @@
+"""
+Local job broker.
+
+Holds queued job IDs in priority order inside the process, so job mode
+needs no external services. Interactive jobs are always taken before bulk
+jobs; within a priority level, jobs run in submission order.
+"""
+
+import asyncio
+import itertools
+from typing import Optional
+
+from app.models import JobPriority
+
+PRIORITY_ORDER = {
+    JobPriority.INTERACTIVE: 0,
+    JobPriority.BULK: 1,
+}
+
+
+class BrokerFull(Exception):
+    """Raised when the broker already holds its maximum number of jobs."""
+
+
+class InProcessBroker:
+    """
+    Bounded priority queue of job IDs.
+
+    Args:
+        max_size: Maximum queued jobs before `put` raises BrokerFull
+    """
+
+    def __init__(self, max_size: int = 1000):
+        self.max_size = max_size
+        self._queue: Optional[asyncio.PriorityQueue] = None
+        self._sequence = itertools.count()
+
+    def _get_queue(self) -> asyncio.PriorityQueue:
+        if self._queue is None:
+            self._queue = asyncio.PriorityQueue()
+        return self._queue
+
+    def put(self, job_id: str, priority: JobPriority):
+        queue = self._get_queue()
+        if queue.qsize() >= self.max_size:
+            raise BrokerFull(f"Job queue full ({queue.qsize()} queued)")
+        queue.put_nowait((PRIORITY_ORDER[priority], next(self._sequence), job_id))
+
+    async def get(self) -> str:
+        _, _, job_id = await self._get_queue().get()
+        return job_id
+
+    def task_done(self):
+        self._get_queue().task_done()
+
+    def depth(self) -> int:
+        return self._queue.qsize() if self._queue is not None else 0
@@ -0,0 +1,204 @@
+"""
+Job mode for verification.
+
+`submit` stores a job and returns its ID immediately; a bounded pool of
+worker tasks pulls job IDs from the broker and runs the pipeline. Clients
+poll `get` (GET /api/jobs/{job_id}) or pass a webhook URL that receives
+the final JobStatus as JSON (see app.jobs.webhooks for the address checks
+and signing). Finished jobs are kept for JOB_RESULT_TTL
+seconds.
+"""
+
+import asyncio
+import logging
+import time
+import uuid
+from collections import defaultdict
+from typing import Dict, Optional
+
+from app.agents.pipeline import run_pipeline, describe_error
+from app.cache.base import encode_value
+from app.jobs.broker import InProcessBroker
+from app.models import JobPriority, JobState, JobStatus
+from app.jobs.webhooks import post_webhook, close_webhook_session, WebhookRejected
+from app.metrics import collect_timings, span
+from app.utils.llm_governor import llm_lane
+from app.utils.logging_config import set_request_id
+
+logger = logging.getLogger(__name__)
+
+
+class JobManager:
+    """
+    Runs submitted verification jobs on a bounded worker pool.
+
+    Args:
+        workers: Jobs running at once
+        broker: Queue of job IDs (InProcessBroker)
+        result_ttl: Seconds finished jobs stay available for polling
+        webhook_retries: Delivery attempts per webhook
+    """
+
+    def __init__(self, workers: int, broker: InProcessBroker, result_ttl: float = 3600, webhook_retries: int = 3):
+        self.workers = workers
+        self.broker = broker
+        self.result_ttl = result_ttl
+        self.webhook_retries = webhook_retries
+
+        self._jobs: Dict[str, JobStatus] = {}
+        self._claims: Dict[str, str] = {}
+        self._webhooks: Dict[str, str] = {}
+        self._include_timings = set()
+        self._tasks = []
+        self._background = set()
+        self._counters = defaultdict(int)
+        self._queue_seconds = defaultdict(float)
+        self._started = defaultdict(int)
+
+    def _ensure_workers(self):
+        if not self._tasks:
+            self._tasks = [
+                asyncio.create_task(self._worker(number), name=f"job-worker-{number}")
+                for number in range(self.workers)
+            ]
+
+    def _prune(self, now: float):
+        expired = [
+            job_id for job_id, job in self._jobs.items()
+            if job.finished_at is not None and now - job.finished_at > self.result_ttl
+        ]
+        for job_id in expired:
+            del self._jobs[job_id]
+
+    def submit(
+        self,
+        claim: str,
+        priority: JobPriority = JobPriority.INTERACTIVE,
+        webhook_url: Optional[str] = None,
+        include_timings: bool = False
+    ) -> JobStatus:
+        """
+        Queues a claim for verification.
+
+        Args:
+            claim: Raw user input
+            priority: Interactive jobs run before bulk jobs
+            webhook_url: Optional URL called with the final JobStatus
+                (already checked with check_webhook_url)
+            include_timings: Attach the per-stage timing breakdown to the result
+
+        Returns:
+            The queued JobStatus
+
+        Raises:
+            BrokerFull: When the queue is at capacity
+        """
+        now = time.time()
+        self._prune(now)
+        self._ensure_workers()
+
+        job = JobStatus(job_id=uuid.uuid4().hex, status=JobState.QUEUED, priority=priority, submitted_at=now)
+        self.broker.put(job.job_id, priority)
+
+        self._jobs[job.job_id] = job
+        self._claims[job.job_id] = claim
+        if webhook_url:
+            self._webhooks[job.job_id] = webhook_url
+        if include_timings:
+            self._include_timings.add(job.job_id)
+        self._counters[f"submitted_{priority.value}"] += 1
+        return job
+
+    def get(self, job_id: str) -> Optional[JobStatus]:
+        return self._jobs.get(job_id)
+
+    async def _worker(self, number: int):
+        while True:
+            job_id = await self.broker.get()
+            try:
+                await self._run(job_id)
+            except Exception as e:
+                logger.error(f"❌ Job worker {number} failed on {job_id}: {str(e)}")
+            finally:
+                self.broker.task_done()
+
+    async def _run(self, job_id: str):
+        job = self._jobs.get(job_id)
+        claim = self._claims.pop(job_id, None)
+        if job is None or claim is None:
+            return
+
+        # Logs of this run (sources, Gemini calls) carry the job ID
+        set_request_id(job_id)
+        job.status = JobState.RUNNING
+        job.started_at = time.time()
+        self._queue_seconds[job.priority.value] += job.started_at - job.submitted_at
+        self._started[job.priority.value] += 1
+
+        lane = "interactive" if job.priority == JobPriority.INTERACTIVE else "batch"
+        include_timings = job_id in self._include_timings
+        self._include_timings.discard(job_id)
+        try:
+            with collect_timings() as timings, llm_lane(lane):
+                with span("total", histogram=None):
+                    result = await run_pipeline(claim)
+            job.result = result["response"]
+            if include_timings:
+                job.result = job.result.model_copy(update={"timings": timings})
+            job.status = JobState.SUCCEEDED
+            job.status_code = 200
+        except Exception as e:
+            job.status_code, job.error = describe_error(e)
+            job.status = JobState.FAILED
+            logger.error(f"❌ Job {job_id} failed: {job.error}")
+
+        job.finished_at = time.time()
+        self._counters[job.status.value] += 1
+
+        webhook_url = self._webhooks.pop(job_id, None)
+        if webhook_url:
+            task = asyncio.create_task(self._deliver_webhook(webhook_url, job))
+            self._background.add(task)
+            task.add_done_callback(self._background.discard)
+
+    async def _deliver_webhook(self, url: str, job: JobStatus):
+        body = encode_value(job)
+        for attempt in range(1, self.webhook_retries + 1):
+            try:
+                status = await post_webhook(url, body)
+                if status < 300:
+                    self._counters["webhooks_delivered"] += 1
+                    return
+                logger.warning(f"Webhook for job {job.job_id} returned {status} (attempt {attempt})")
+            except WebhookRejected as e:
+                logger.warning(f"Webhook for job {job.job_id} refused: {str(e)}")
+                self._counters["webhooks_refused"] += 1
+                return
+            except Exception as e:
+                logger.warning(f"Webhook for job {job.job_id} failed (attempt {attempt}): {str(e)}")
+            if attempt < self.webhook_retries:
+                await asyncio.sleep(2 ** (attempt - 1))
+        self._counters["webhooks_failed"] += 1
+
+    async def close(self):
+        for task in self._tasks + list(self._background):
+            task.cancel()
+        await asyncio.gather(*self._tasks, *self._background, return_exceptions=True)
+        self._tasks = []
+        await close_webhook_session()
+
+    def stats(self) -> dict:
+        by_state = defaultdict(int)
+        for job in self._jobs.values():
+            by_state[job.status.value] += 1
+        return {
+            "workers": self.workers,
+            "queue_depth": self.broker.depth(),
+            "queue_max": self.broker.max_size,
+            "jobs": dict(by_state),
+            "counters": dict(self._counters),
+            "avg_queue_seconds": {
+                priority: round(self._queue_seconds[priority] / count, 3)
+                for priority, count in self._started.items()
+            }
+        }
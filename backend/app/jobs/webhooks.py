@@ -0,0 +1,172 @@
+"""
+Outbound job webhooks.
+
+Webhook URLs come from unauthenticated clients, so delivery must not become
+a way to make the server call its own network (cloud metadata, Redis on
+localhost, admin panels on the LAN):
+
+- only http(s) URLs are accepted, optionally only for the hosts listed in
+  WEBHOOK_ALLOWED_HOSTS (comma-separated; ".example.com" also allows its
+  subdomains)
+- the host must resolve to public addresses only; loopback, private,
+  link-local, multicast and reserved ranges are refused. The check runs at
+  submission (422) and again on every delivery through the session's DNS
+  resolver, so a name re-pointed to an internal address after submission
+  is refused too
+- redirects are not followed
+
+With WEBHOOK_SECRET set, each delivery carries X-FactCheckit-Timestamp and
+X-FactCheckit-Signature: "sha256=" + HMAC-SHA256(secret, "<timestamp>.<body>")
+in hex, so receivers can check the body came from this server and is recent.
+"""
+
+import asyncio
+import hashlib
+import hmac
+import ipaddress
+import os
+import socket
+import time
+from typing import List, Optional
+from urllib.parse import urlsplit
+
+import aiohttp
+from aiohttp.abc import AbstractResolver, ResolveResult
+from aiohttp.resolver import DefaultResolver
+from dotenv import load_dotenv
+
+load_dotenv()
+
+WEBHOOK_ALLOWED_HOSTS = [host.strip().lower() for host in os.getenv("WEBHOOK_ALLOWED_HOSTS", "").split(",") if host.strip()]
+WEBHOOK_SECRET = os.getenv("WEBHOOK_SECRET", "")
+WEBHOOK_TIMEOUT = float(os.getenv("WEBHOOK_TIMEOUT", "10"))
+
+SIGNATURE_HEADER = "X-FactCheckit-Signature"
+TIMESTAMP_HEADER = "X-FactCheckit-Timestamp"
+
+
+class WebhookRejected(ValueError):
+    """Raised when a webhook URL is not allowed."""
+
+
+def _is_public(address: str) -> bool:
+    ip = ipaddress.ip_address(address.split("%", 1)[0])
+    if isinstance(ip, ipaddress.IPv6Address) and ip.ipv4_mapped is not None:
+        ip = ip.ipv4_mapped
+    return ip.is_global and not ip.is_multicast
+
+
+def _host_allowed(host: str) -> bool:
+    if not WEBHOOK_ALLOWED_HOSTS:
+        return True
+    return any(
+        host == allowed or (allowed.startswith(".") and (host.endswith(allowed) or host == allowed[1:]))
+        for allowed in WEBHOOK_ALLOWED_HOSTS
+    )
+
+
+class PublicResolver(AbstractResolver):
+    """DNS resolver that only returns public addresses (refuses the host otherwise)."""
+
+    def __init__(self):
+        self._resolver = DefaultResolver()
+
+    async def resolve(self, host: str, port: int = 0, family: socket.AddressFamily = socket.AF_INET) -> List[ResolveResult]:
+        addresses = await self._resolver.resolve(host, port, family)
+        blocked = [address["host"] for address in addresses if not _is_public(address["host"])]
+        if blocked:
+            raise OSError(f"Webhook host {host} resolves to a non-public address ({blocked[0]})")
+        return addresses
+
+    async def close(self) -> None:
+        await self._resolver.close()
+
+
+async def check_webhook_url(url: str) -> None:
+    """
+    Refuses URLs the server must not call.
+
+    Args:
+        url: Webhook URL given by the client
+
+    Raises:
+        WebhookRejected: Bad scheme, host not in WEBHOOK_ALLOWED_HOSTS, or a
+            host that is (or resolves to) a non-public address
+    """
+    parts = urlsplit(url)
+    host = (parts.hostname or "").lower()
+    if parts.scheme not in ("http", "https") or not host:
+        raise WebhookRejected("webhook_url must be an http(s) URL with a host")
+    if parts.username or parts.password:
+        raise WebhookRejected("webhook_url must not contain credentials")
+    if not _host_allowed(host):
+        raise WebhookRejected(f"webhook_url host {host} is not in WEBHOOK_ALLOWED_HOSTS")
+
+    try:
+        addresses = [str(ipaddress.ip_address(host))]
+    except ValueError:
+        try:
+            infos = await asyncio.get_running_loop().getaddrinfo(host, parts.port or 443, type=socket.SOCK_STREAM)
+        except (OSError, UnicodeError) as e:
+            raise WebhookRejected(f"webhook_url host {host} does not resolve: {e}")
+        addresses = [info[4][0] for info in infos]
+    if not addresses or not all(_is_public(address) for address in addresses):
+        raise WebhookRejected(f"webhook_url host {host} is not a public address")
+
+
+def sign_body(body: bytes, timestamp: Optional[int] = None) -> dict:
+    """Signature headers for a delivery (empty without WEBHOOK_SECRET)."""
+    if not WEBHOOK_SECRET:
+        return {}
+    timestamp = str(timestamp if timestamp is not None else int(time.time()))
+    digest = hmac.new(WEBHOOK_SECRET.encode(), timestamp.encode() + b"." + body, hashlib.sha256).hexdigest()
+    return {TIMESTAMP_HEADER: timestamp, SIGNATURE_HEADER: f"sha256={digest}"}
+
+
+_session: Optional[aiohttp.ClientSession] = None
+_session_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def get_webhook_session() -> aiohttp.ClientSession:
+    """
+    Session used for webhooks only, resolving through PublicResolver.
+
+    Kept apart from the tools' shared session so its DNS cache and resolver
+    never serve webhook hosts. Must be called from inside a coroutine.
+    """
+    global _session, _session_loop
+
+    loop = asyncio.get_running_loop()
+    if _session is None or _session.closed or _session_loop is not loop:
+        connector = aiohttp.TCPConnector(resolver=PublicResolver(), use_dns_cache=False, limit=20)
+        _session = aiohttp.ClientSession(connector=connector, timeout=aiohttp.ClientTimeout(total=WEBHOOK_TIMEOUT))
+        _session_loop = loop
+    return _session
+
+
+async def close_webhook_session() -> None:
+    global _session, _session_loop
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
+    _session_loop = None
+
+
+async def post_webhook(url: str, body: bytes) -> int:
+    """
+    Delivers one webhook (signed, no redirects).
+
+    Args:
+        url: Webhook URL, checked with check_webhook_url
+        body: JSON body
+
+    Returns:
+        HTTP status of the receiver's response
+
+    Raises:
+        WebhookRejected: When the URL is no longer allowed
+    """
+    await check_webhook_url(url)
+    headers = {"Content-Type": "application/json", **sign_body(body)}
+    async with get_webhook_session().post(url, data=body, headers=headers, allow_redirects=False) as response:
+        return response.status
@@ -1,17 +1,44 @@
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from app.routers import verify
+from app.routers import verify, stats, jobs, metrics
+from app.metrics import HTTP_SECONDS, METRICS_ENABLED
+from app.tools.http_session import close_session
+from app.cache import close_cache
+from app.tools.parse_pool import shutdown_parse_pool
+from app.jobs import close_job_manager
+from app.factcheck_index import close_factcheck_index
+from app.factcheck_index.harvester import start_harvester, close_harvester
+from app.utils.logging_config import configure_logging, shutdown_logging, request_context
+from app.utils.traffic_capture import close_traffic_recorder
 import os
+import time
 from dotenv import load_dotenv
 
 load_dotenv()
+configure_logging()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application startup/shutdown: starts the fact-check harvester, releases the shared HTTP pool and cache connections on exit"""
+    start_harvester()
+    yield
+    await close_harvester()
+    await close_job_manager()
+    await close_session()
+    await close_cache()
+    shutdown_parse_pool()
+    close_factcheck_index()
+    close_traffic_recorder()
+    shutdown_logging()
 
 app = FastAPI(
     title="FactCheckit API",
     description="🇮🇳 AI-powered Crisis News & Claim Verification Tool",
     version="2.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    lifespan=lifespan
 )
 
 # CORS configuration for Next.js frontend
@@ -30,8 +57,36 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+@app.middleware("http")
+async def record_request_latency(request: Request, call_next):
+    """Observes request latency per matched route (time to response headers for streams)"""
+    started = time.perf_counter()
+    status = 500
+    try:
+        response = await call_next(request)
+        status = response.status_code
+        return response
+    finally:
+        # Route templates, not raw paths, so job IDs do not create new series
+        route = request.scope.get("route")
+        if METRICS_ENABLED and route is not None:
+            HTTP_SECONDS.observe(
+                time.perf_counter() - started, method=request.method, route=route.path, status=str(status)
+            )
+
+@app.middleware("http")
+async def assign_request_id(request: Request, call_next):
+    """Tags every log record of a request with its ID (the caller's X-Request-ID if sent)"""
+    with request_context(request.headers.get("x-request-id")) as request_id:
+        response = await call_next(request)
+    response.headers["X-Request-ID"] = request_id
+    return response
+
 # Include routers
 app.include_router(verify.router, prefix="/api", tags=["verification"])
+app.include_router(jobs.router, prefix="/api", tags=["jobs"])
+app.include_router(stats.router, prefix="/api", tags=["stats"])
+app.include_router(metrics.router, tags=["metrics"])
 
 @app.get("/")
 async def root():
@@ -55,6 +110,11 @@ async def root():
         },
         "endpoints": {
             "verify": "/api/verify",
+            "verify_stream": "/api/verify/stream",
+            "verify_batch": "/api/verify/batch",
+            "jobs": "/api/jobs",
+            "stats": "/api/stats",
+            "metrics": "/metrics",
             "docs": "/docs",
             "health": "/health"
         }
@@ -0,0 +1,138 @@
+"""
+Latency and outcome metrics for the verification pipeline.
+
+Stages are timed with `span(...)`:
+- pipeline stages (extract, verdict cache lookup, sources, analysis,
+  verdict, explanation) feed factcheck_stage_duration_seconds
+- each of the nine source tools (through `@resilient`) feeds
+  factcheck_source_duration_seconds plus per-outcome request counters and
+  result counts
+- Gemini calls feed factcheck_llm_duration_seconds per call site
+
+Cache lookups (tool responses, Gemini outputs, verdicts) are counted per
+cache and result. Everything is exported in the Prometheus text format at
+GET /metrics.
+
+For debugging, `collect_timings()` also gathers every span finished inside
+it (including spans in tasks started within it) into a per-request
+breakdown; /api/verify returns it when the request sets
+include_timings.
+"""
+
+import os
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, Optional
+
+from app.metrics.registry import Counter, Histogram, MetricsRegistry, DEFAULT_BUCKETS
+
+METRICS_ENABLED = os.getenv("METRICS_ENABLED", "true").lower() == "true"
+
+registry = MetricsRegistry()
+
+STAGE_SECONDS = registry.histogram(
+    "factcheck_stage_duration_seconds", "Pipeline stage latency", ("stage",)
+)
+SOURCE_SECONDS = registry.histogram(
+    "factcheck_source_duration_seconds", "Source tool latency (uncached calls)", ("source",)
+)
+SOURCE_REQUESTS = registry.counter(
+    "factcheck_source_requests_total", "Source tool calls by outcome (ok, error, timeout, skipped)", ("source", "outcome")
+)
+SOURCE_RESULTS = registry.counter(
+    "factcheck_source_results_total", "Results returned by source tools", ("source",)
+)
+LLM_SECONDS = registry.histogram(
+    "factcheck_llm_duration_seconds", "Gemini call latency per call site, including governor queueing", ("label",)
+)
+CACHE_LOOKUPS = registry.counter(
+    "factcheck_cache_lookups_total", "Cache lookups by cache and result (hit, miss)", ("cache", "result")
+)
+HTTP_SECONDS = registry.histogram(
+    "factcheck_http_request_duration_seconds", "API request latency by route", ("method", "route", "status")
+)
+
+_timings: ContextVar[Optional[Dict[str, float]]] = ContextVar("request_timings", default=None)
+
+
+def record_timing(name: str, seconds: float):
+    """Adds a duration to the current request's breakdown (no-op outside collect_timings)."""
+    timings = _timings.get()
+    if timings is not None:
+        timings[name] = round(timings.get(name, 0.0) + seconds * 1000, 1)
+
+
+@contextmanager
+def collect_timings() -> Iterator[Dict[str, float]]:
+    """
+    Collects the spans finished in this context into a dict of name -> milliseconds.
+
+    Tasks created inside the block share the dict, so parallel source
+    fetches show up too. Repeated spans with the same name are summed.
+    """
+    timings: Dict[str, float] = {}
+    token = _timings.set(timings)
+    try:
+        yield timings
+    finally:
+        _timings.reset(token)
+
+
+@contextmanager
+def span(name: str, histogram: Optional[Histogram] = STAGE_SECONDS, **labels):
+    """
+    Times a block.
+
+    Args:
+        name: Name in the per-request breakdown (and the "stage" label of
+            STAGE_SECONDS when no labels are given)
+        histogram: Histogram to observe (None: breakdown only)
+        labels: Histogram labels (defaults to stage=name)
+    """
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - started
+        if METRICS_ENABLED and histogram is not None:
+            histogram.observe(elapsed, **(labels or {"stage": name}))
+        record_timing(name, elapsed)
+
+
+def count_cache_lookup(cache: str, hit: bool):
+    if METRICS_ENABLED:
+        CACHE_LOOKUPS.inc(cache=cache, result="hit" if hit else "miss")
+
+
+def record_source_call(source: str, outcome: str, seconds: Optional[float] = None, results: int = 0):
+    """
+    Records one source tool call.
+
+    Args:
+        source: Tool name (as used by @resilient)
+        outcome: "ok", "error", "timeout" or "skipped"
+        seconds: Call latency (None for calls that never went out)
+        results: Number of results returned
+    """
+    if seconds is not None:
+        record_timing(f"tool.{source}", seconds)
+    if not METRICS_ENABLED:
+        return
+    SOURCE_REQUESTS.inc(source=source, outcome=outcome)
+    if seconds is not None:
+        SOURCE_SECONDS.observe(seconds, source=source)
+    if results:
+        SOURCE_RESULTS.inc(results, source=source)
+
+
+def render_metrics() -> str:
+    """Every metric in the Prometheus text exposition format."""
+    return registry.render()
+
+
+__all__ = [
+    "Counter", "Histogram", "MetricsRegistry", "DEFAULT_BUCKETS", "registry", "METRICS_ENABLED",
+    "STAGE_SECONDS", "SOURCE_SECONDS", "SOURCE_REQUESTS", "SOURCE_RESULTS", "LLM_SECONDS", "CACHE_LOOKUPS", "HTTP_SECONDS",
+    "span", "collect_timings", "record_timing", "count_cache_lookup", "record_source_call", "render_metrics"
+]
@@ -1,4 +1,9 @@
-from .request_model import VerifyRequest
-from .response_model import VerifyResponse, VerdictType, Source, EvidencePoint
+from .request_model import VerifyRequest, BatchVerifyItem, BatchVerifyRequest, CLAIM_MIN_LENGTH, CLAIM_MAX_LENGTH
+from .response_model import VerifyResponse, VerdictType, Source, EvidencePoint, BatchItemResult, BatchVerifyResponse
+from .job_model import JobPriority, JobState, JobSubmitRequest, JobStatus
 
-__all__ = ["VerifyRequest", "VerifyResponse", "VerdictType", "Source", "EvidencePoint"]
+__all__ = [
+    "VerifyRequest", "BatchVerifyItem", "BatchVerifyRequest", "CLAIM_MIN_LENGTH", "CLAIM_MAX_LENGTH",
+    "VerifyResponse", "VerdictType", "Source", "EvidencePoint", "BatchItemResult", "BatchVerifyResponse",
+    "JobPriority", "JobState", "JobSubmitRequest", "JobStatus"
+]
@@ -0,0 +1,44 @@
+from pydantic import BaseModel, Field
+from typing import Optional
+from enum import Enum
+from .request_model import VerifyRequest
+from .response_model import VerifyResponse
+
+class JobPriority(str, Enum):
+    INTERACTIVE = "interactive"
+    BULK = "bulk"
+
+class JobState(str, Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+class JobSubmitRequest(VerifyRequest):
+    priority: JobPriority = JobPriority.INTERACTIVE
+    webhook_url: Optional[str] = Field(
+        None,
+        pattern=r"^https?://",
+        max_length=2000,
+        description="Called with the final job status (POST, JSON) when the job finishes; must resolve to a public address"
+    )
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "claim": "Scientists have discovered a cure for all types of cancer in 2025",
+                "priority": "interactive",
+                "webhook_url": "https://example.com/hooks/factcheck"
+            }
+        }
+
+class JobStatus(BaseModel):
+    job_id: str
+    status: JobState
+    priority: JobPriority
+    submitted_at: float
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    result: Optional[VerifyResponse] = None
+    error: Optional[str] = None
+    status_code: Optional[int] = None
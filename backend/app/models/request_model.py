@@ -1,7 +1,12 @@
 from pydantic import BaseModel, Field
+from typing import List
+
+CLAIM_MIN_LENGTH = 10
+CLAIM_MAX_LENGTH = 1000
 
 class VerifyRequest(BaseModel):
-    claim: str = Field(..., min_length=10, max_length=1000, description="The claim or news headline to verify")
+    claim: str = Field(..., min_length=CLAIM_MIN_LENGTH, max_length=CLAIM_MAX_LENGTH, description="The claim or news headline to verify")
+    include_timings: bool = Field(False, description="Return a per-stage timing breakdown (milliseconds) for debugging")
     
     class Config:
         json_schema_extra = {
@@ -9,3 +14,23 @@ class VerifyRequest(BaseModel):
                 "claim": "Scientists have discovered a cure for all types of cancer in 2025"
             }
         }
+
+
+class BatchVerifyItem(BaseModel):
+    # Length is checked per item by run_batch, so one bad item does not reject the batch
+    claim: str = Field(..., description="The claim or news headline to verify")
+
+
+class BatchVerifyRequest(BaseModel):
+    items: List[BatchVerifyItem] = Field(..., min_length=1, max_length=200, description="Claims to verify")
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "items": [
+                    {"claim": "Scientists have discovered a cure for all types of cancer in 2025"},
+                    {"claim": "Scientists discovered a cure for all cancer types in 2025!!"},
+                    {"claim": "The Great Wall of China is visible from space with the naked eye"}
+                ]
+            }
+        }
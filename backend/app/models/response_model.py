@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import List, Optional
+from typing import Dict, List, Optional
 from enum import Enum
 
 class VerdictType(str, Enum):
@@ -27,6 +27,7 @@ class VerifyResponse(BaseModel):
     evidence_points: List[EvidencePoint]
     sources: List[Source]
     agent_reasoning: Optional[str] = None
+    timings: Optional[Dict[str, float]] = None  # Only with include_timings
     
     class Config:
         json_schema_extra = {
@@ -48,3 +49,18 @@ class VerifyResponse(BaseModel):
                 "agent_reasoning": "Verified through Google Fact Check API, Google Search, and cross-referenced with medical databases."
             }
         }
+
+
+class BatchItemResult(BaseModel):
+    index: int
+    response: Optional[VerifyResponse] = None
+    error: Optional[str] = None
+    status_code: int = 200
+    cache_hit: bool = False
+    duplicate_of: Optional[int] = None
+
+class BatchVerifyResponse(BaseModel):
+    results: List[BatchItemResult]
+    total: int
+    unique_inputs: int
+    unique_claims: int
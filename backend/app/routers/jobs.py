@@ -0,0 +1,47 @@
+from fastapi import APIRouter, HTTPException, Request, Response
+from app.models import JobSubmitRequest, JobStatus
+from app.jobs import get_job_manager, BrokerFull
+from app.jobs.webhooks import check_webhook_url, WebhookRejected
+import logging
+
+router = APIRouter()
+logger = logging.getLogger(__name__)
+
+@router.post("/jobs", response_model=JobStatus, status_code=202)
+async def submit_job(body: JobSubmitRequest, request: Request, response: Response):
+    """
+    Queues a claim for verification and returns its job ID immediately.
+    
+    Poll GET /api/jobs/{job_id} until the status is "succeeded" or
+    "failed", or pass `webhook_url` to receive the final status as a JSON
+    POST. Webhook hosts must resolve to public addresses (and be listed in
+    WEBHOOK_ALLOWED_HOSTS when it is set); deliveries are signed when
+    WEBHOOK_SECRET is set. Interactive jobs are run before bulk jobs. With
+    include_timings, the result carries the per-stage timing breakdown.
+    """
+    if body.webhook_url:
+        try:
+            await check_webhook_url(body.webhook_url)
+        except WebhookRejected as e:
+            raise HTTPException(status_code=422, detail=str(e))
+    
+    try:
+        job = get_job_manager().submit(
+            body.claim, priority=body.priority, webhook_url=body.webhook_url, include_timings=body.include_timings
+        )
+    except BrokerFull as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "30"})
+    
+    logger.info(f"📥 Queued job {job.job_id} ({job.priority.value})")
+    response.headers["Location"] = str(request.url_for("get_job", job_id=job.job_id))
+    return job
+
+@router.get("/jobs/{job_id}", response_model=JobStatus)
+async def get_job(job_id: str):
+    """
+    Current status of a job; includes the VerifyResponse once it succeeded.
+    """
+    job = get_job_manager().get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found or expired")
+    return job
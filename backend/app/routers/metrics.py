@@ -0,0 +1,19 @@
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+from app.metrics import render_metrics
+
+router = APIRouter()
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def get_metrics():
+    """
+    Prometheus scrape endpoint (text exposition format).
+
+    - factcheck_stage_duration_seconds: extract, verdict cache, sources, analysis, verdict, explanation
+    - factcheck_source_duration_seconds / factcheck_source_requests_total / factcheck_source_results_total:
+      per source tool latency, outcomes (ok, error, timeout, skipped) and results returned
+    - factcheck_llm_duration_seconds: Gemini calls per call site
+    - factcheck_cache_lookups_total: tool, Gemini and verdict cache hits and misses
+    - factcheck_http_request_duration_seconds: API latency per route and status
+    """
+    return PlainTextResponse(render_metrics(), media_type="text/plain; version=0.0.4")
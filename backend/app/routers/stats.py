@@ -0,0 +1,56 @@
+from fastapi import APIRouter
+from app.cache import get_cache
+from app.jobs import get_job_manager
+from app.factcheck_index import factcheck_index_stats
+from app.agents.speculation import speculation_stats
+from app.agents.early_exit import early_exit_stats
+from app.agents.evidence import evidence_stats
+from app.tools.http_session import pool_stats
+from app.tools.http_cache import http_cache_stats
+from app.tools.parse_pool import parse_pool
+from app.tools.resilience import source_health_stats
+from app.utils.verdict_cache import verdict_cache
+from app.utils.llm_client import llm_usage_stats, get_llm_governor
+from app.utils.prompt_builder import prompt_stats
+from app.utils.singleflight import singleflight_stats
+
+router = APIRouter()
+
+@router.get("/stats")
+async def get_stats():
+    """
+    Runtime statistics for performance tuning.
+
+    - http_pool: shared aiohttp connection pool counters and reuse rate
+    - http_cache: per-source page cache hits, revalidations and downloads
+    - parse_pool: HTML parse worker queue wait, parse time and rejections
+    - factcheck_index: harvested articles per source, index hit rate and search time, last harvest
+    - sources: per-source latency, adaptive deadline, circuit breaker state and skips
+    - llm: Gemini calls, cache hits and prompt/output tokens per call site
+    - llm_governor: Gemini rate/token limits, in-flight calls and queue time per lane
+    - prompts: built prompt size (estimated tokens) per call site, snippets truncated and items dropped to fit the budget
+    - speculation: speculative source fetches reused vs re-queried and latency saved
+    - early_exit: verifications answered from an authoritative fact-check and sources skipped
+    - evidence: search results in vs sent to the LLM, duplicates and irrelevant hits dropped
+    - singleflight: concurrent identical pipeline runs, verifications, tool and Gemini calls that joined one in flight
+    - jobs: job queue depth, states and average queue time per priority
+    - verdict_cache: hit rate and latency saved by the verdict cache
+    - cache: shared backend counters (tool responses, Gemini outputs, verdicts)
+    """
+    return {
+        "http_pool": pool_stats(),
+        "http_cache": http_cache_stats(),
+        "parse_pool": parse_pool.stats(),
+        "sources": source_health_stats(),
+        "factcheck_index": await factcheck_index_stats(),
+        "cache": get_cache().stats(),
+        "verdict_cache": verdict_cache.stats(),
+        "llm": llm_usage_stats(),
+        "llm_governor": get_llm_governor().stats(),
+        "prompts": prompt_stats(),
+        "speculation": speculation_stats(),
+        "early_exit": early_exit_stats(),
+        "evidence": evidence_stats(),
+        "singleflight": singleflight_stats(),
+        "jobs": get_job_manager().stats()
+    }
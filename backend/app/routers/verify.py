@@ -1,13 +1,16 @@
 from fastapi import APIRouter, HTTPException
-from app.models import VerifyRequest, VerifyResponse
-from app.agents.extractor_agent import extract_claim
-from app.agents.verification_agent import verify_claim
-from app.agents.verdict_agent import determine_verdict
-from app.agents.explanation_agent import generate_explanation
+from fastapi.responses import StreamingResponse
+from app.models import VerifyRequest, VerifyResponse, BatchVerifyRequest, BatchVerifyResponse
+from app.agents.pipeline import run_pipeline, describe_error, NoClaimFoundError
+from app.agents.batch_pipeline import run_batch
+from app.cache.base import encode_value
+from app.utils.llm_governor import llm_lane
+from app.metrics import collect_timings, span
+from app.utils.traffic_capture import capture_request
+import asyncio
 import logging
 
 router = APIRouter()
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 @router.post("/verify", response_model=VerifyResponse)
@@ -20,7 +23,14 @@ async def verify_news_claim(request: VerifyRequest):
     2. Verify claim using multiple sources (Indian fact-checkers + AI)
     3. Determine verdict with confidence score
     4. Generate explanation with evidence and sources
+    
+    Repeated or near-duplicate claims are answered from the verdict cache
+    after step 1, and identical claims already being verified join that
+    run instead of starting their own. With include_timings, the response carries a per-stage
+    timing breakdown in milliseconds (stages, source tools, Gemini calls).
+    With TRAFFIC_CAPTURE_ENABLED, the anonymized request is recorded for replay.
     """
+    status_code, timings, result = 200, {}, None
     try:
         logger.info(f"📥 Received claim: {request.claim[:100]}...")
         
@@ -31,67 +41,134 @@ async def verify_news_claim(request: VerifyRequest):
                 detail="Claim must be at least 10 characters long"
             )
         
-        # Step 1: Extract clean factual claim
-        logger.info("🔍 Step 1: Extracting claim...")
-        extracted_claim = await extract_claim(request.claim)
-        logger.info(f"✅ Extracted: {extracted_claim}")
-        
-        # Step 2: Verify the claim using multiple tools
-        logger.info("🔍 Step 2: Verifying with Indian fact-checkers + AI...")
-        verification_results = await verify_claim(extracted_claim)
-        logger.info(f"✅ Verification complete (sources checked: {verification_results.get('verification_summary', {}).get('total_sources', 0)})")
-        
-        # Step 3: Determine verdict based on verification results
-        logger.info("🔍 Step 3: Determining verdict...")
-        verdict_data = determine_verdict(verification_results)
-        logger.info(f"✅ Verdict: {verdict_data['verdict']} (Confidence: {verdict_data['confidence_score']:.2%})")
-        
-        # Step 4: Generate human-friendly explanation
-        logger.info("🔍 Step 4: Generating explanation...")
-        explanation_data = await generate_explanation(
-            original_claim=request.claim,
-            extracted_claim=extracted_claim,
-            verification_results=verification_results,
-            verdict_data=verdict_data
-        )
-        logger.info(f"✅ Explanation generated")
-        
-        # Combine all results
-        response = VerifyResponse(
-            original_claim=request.claim,
-            extracted_claim=extracted_claim,
-            verdict=verdict_data["verdict"],
-            confidence_score=verdict_data["confidence_score"],
-            real_news_summary=explanation_data["real_news_summary"],
-            detailed_explanation=explanation_data["detailed_explanation"],
-            evidence_points=explanation_data["evidence_points"],
-            sources=explanation_data["sources"],
-            agent_reasoning=explanation_data.get("agent_reasoning")
-        )
+        with collect_timings() as timings:
+            with span("total", histogram=None):
+                result = await run_pipeline(request.claim)
         
         logger.info(f"🎉 Verification complete for claim")
-        return response
+        if request.include_timings:
+            return result["response"].model_copy(update={"timings": timings})
+        return result["response"]
         
-    except HTTPException:
+    except HTTPException as e:
         # Re-raise HTTP exceptions
+        status_code = e.status_code
         raise
+    except NoClaimFoundError as e:
+        status_code = 422
+        raise HTTPException(status_code=422, detail=str(e))
     except Exception as e:
         logger.error(f"❌ Error in verify endpoint: {str(e)}")
-        error_message = str(e)
-        
-        # Provide helpful error messages
-        if "GEMINI_API_KEY" in error_message or "API key" in error_message:
-            raise HTTPException(
-                status_code=500, 
-                detail="API key configuration error. Please check your GEMINI_API_KEY in .env file."
-            )
-        elif "timeout" in error_message.lower() or "timed out" in error_message.lower():
-            raise HTTPException(
-                status_code=504, 
-                detail="Request timed out. The verification took too long. Please try again."
-            )
-        else:
-            raise HTTPException(
-                status_code=500, 
-                detail=f"Verification failed: {error_message}"
-            )
+        status_code, detail = describe_error(e)
+        raise HTTPException(status_code=status_code, detail=detail)
+    finally:
+        capture_request("api", request.claim, status_code, timings, result)
+
+
+@router.post("/verify/batch", response_model=BatchVerifyResponse)
+async def verify_news_claims_batch(request: BatchVerifyRequest):
+    """
+    Verifies many claims in one call (bulk ingestion, e.g. forwarded messages).
+    
+    Identical and near-identical claims are verified once, extraction and
+    analysis are packed into multi-claim Gemini prompts, and source fetches
+    are shared across the batch. Gemini calls run in the batch lane, behind
+    interactive and Telegram traffic. Results come back in input order; an item
+    that fails carries its own error and status_code instead of failing
+    the whole batch.
+    """
+    logger.info(f"📥 Received batch of {len(request.items)} claims")
+    
+    try:
+        with llm_lane("batch"):
+            result = await run_batch([item.claim for item in request.items])
+    except Exception as e:
+        logger.error(f"❌ Error in batch endpoint: {str(e)}")
+        status_code, detail = describe_error(e)
+        raise HTTPException(status_code=status_code, detail=detail)
+    
+    logger.info(f"🎉 Batch complete ({result['unique_claims']} distinct claims verified)")
+    return result
+
+
+def _stream_payload(stage: str, payload: dict) -> dict:
+    # Sources were already streamed one by one; only send the aggregate here
+    if stage == "verification":
+        return {
+            "verification_summary": payload.get("verification_summary", {}),
+            "ai_analysis": payload.get("ai_analysis", {})
+        }
+    return payload
+
+
+@router.post("/verify/stream")
+async def verify_news_claim_stream(request: VerifyRequest):
+    """
+    Streaming variant of /verify (NDJSON, one JSON object per line).
+    
+    Events, in order:
+    - {"event": "extracted", "data": {"extracted_claim": ...}}
+    - {"event": "source", "data": {"source": ..., "result": ...}} as each tool finishes
+    - {"event": "verification", "data": {"verification_summary": ..., "ai_analysis": ...}}
+    - {"event": "verdict", "data": ...}
+    - {"event": "explanation", "data": ...}
+    - {"event": "result", "data": <VerifyResponse>, "cache_hit": bool} (plus
+      "timings" with include_timings)
+    
+    On a verdict cache hit the source and verification events are skipped;
+    source events are also skipped when verification is shared with a
+    concurrent request for the same claim.
+    Failures after the stream has started are sent as
+    {"event": "error", "status": ..., "detail": ...}.
+    """
+    logger.info(f"📥 Received streaming claim: {request.claim[:100]}...")
+    
+    if not request.claim or len(request.claim.strip()) < 10:
+        raise HTTPException(
+            status_code=422, 
+            detail="Claim must be at least 10 characters long"
+        )
+    
+    events = asyncio.Queue()
+    
+    async def on_stage(stage: str, payload: dict):
+        await events.put({"event": stage, "data": _stream_payload(stage, payload)})
+    
+    async def run():
+        status_code, timings, result = 200, {}, None
+        try:
+            with collect_timings() as timings:
+                with span("total", histogram=None):
+                    result = await run_pipeline(request.claim, on_stage=on_stage)
+            event = {"event": "result", "data": result["response"], "cache_hit": result["cache_hit"]}
+            if request.include_timings:
+                event["timings"] = timings
+            await events.put(event)
+        except NoClaimFoundError as e:
+            status_code = 422
+            await events.put({"event": "error", "status": 422, "detail": str(e)})
+        except asyncio.CancelledError:
+            status_code = 499  # client went away
+            raise
+        except Exception as e:
+            logger.error(f"❌ Error in verify stream: {str(e)}")
+            status_code, detail = describe_error(e)
+            await events.put({"event": "error", "status": status_code, "detail": detail})
+        finally:
+            capture_request("api_stream", request.claim, status_code, timings, result)
+            await events.put(None)
+    
+    async def stream():
+        task = asyncio.create_task(run())
+        try:
+            while (event := await events.get()) is not None:
+                yield encode_value(event) + "\n"
+        finally:
+            # Client went away: stop the pipeline instead of finishing it for nobody
+            task.cancel()
+    
+    return StreamingResponse(
+        stream(),
+        media_type="application/x-ndjson",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
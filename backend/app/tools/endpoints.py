@@ -0,0 +1,40 @@
+"""
+Base URLs of the external sources.
+
+Each can be overridden with <SOURCE>_BASE_URL (e.g. ALTNEWS_BASE_URL,
+GOOGLE_SEARCH_BASE_URL) to point a tool at a mirror or at the local
+stand-ins of the load-test harness (benchmarks/loadtest.py).
+"""
+
+import os
+
+DEFAULT_BASE_URLS = {
+    "pib_factcheck": "https://factcheck.pib.gov.in",
+    "altnews": "https://www.altnews.in",
+    "boom": "https://www.boomlive.in",
+    "factly": "https://factly.in",
+    "vishvas": "https://www.vishvasnews.com",
+    "duckduckgo": "https://html.duckduckgo.com",
+    "newsapi": "https://newsapi.org",
+    "google_factcheck": "https://factchecktools.googleapis.com",
+    "google_search": "https://www.googleapis.com",
+}
+
+BASE_URLS = {
+    source: os.getenv(f"{source.upper()}_BASE_URL", default).rstrip("/")
+    for source, default in DEFAULT_BASE_URLS.items()
+}
+
+
+def source_url(source: str, path: str = "/") -> str:
+    """
+    URL of a path on a source.
+
+    Args:
+        source: Tool name (as used by @resilient)
+        path: Path and query, starting with "/"
+
+    Returns:
+        The path joined to the source's (possibly overridden) base URL
+    """
+    return BASE_URLS[source] + path
@@ -1,10 +1,18 @@
-import aiohttp
+from app.cache import cached_tool
+from app.tools.resilience import resilient
+from app.tools.http_session import get_session
+from app.tools.endpoints import source_url
 import asyncio
 import os
 from dotenv import load_dotenv
+import logging
+
+logger = logging.getLogger(__name__)
 
 load_dotenv()
 
+@cached_tool("google_search")
+@resilient("google_search")
 async def search_google(claim: str) -> dict:
     """
     Searches Google Custom Search for fact-checking and verification information.
@@ -19,14 +27,14 @@ async def search_google(claim: str) -> dict:
     search_engine_id = os.getenv("GOOGLE_SEARCH_ENGINE_ID", "")
     
     if not api_key:
-        print("Warning: No Google Search API key found")
+        logger.warning("No Google Search API key found")
         return {"results": [], "error": "No API key configured"}
     
     try:
         # Add "fact check" to search query for better results
         search_query = f"{claim} fact check"
         
-        url = "https://www.googleapis.com/customsearch/v1"
+        url = source_url("google_search", "/customsearch/v1")
         params = {
             "key": api_key,
             "cx": search_engine_id if search_engine_id else "017576662512468239146:omuauf_lfve",  # Example search engine
@@ -34,37 +42,37 @@ async def search_google(claim: str) -> dict:
             "num": 5  # Top 5 results
         }
         
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, params=params, timeout=10) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    items = data.get("items", [])
-                    
-                    # Structure the results
-                    structured_results = []
-                    for item in items:
-                        structured_results.append({
-                            "title": item.get("title", ""),
-                            "snippet": item.get("snippet", ""),
-                            "url": item.get("link", ""),
-                            "displayLink": item.get("displayLink", "")
-                        })
-                    
-                    return {
-                        "results": structured_results,
-                        "total": len(structured_results),
-                        "query": search_query
-                    }
-                else:
-                    error_text = await response.text()
-                    print(f"Google Search API error: {response.status} - {error_text}")
-                    
-                    # Fallback: return empty results instead of failing
-                    return {"results": [], "error": f"API error: {response.status}"}
-                    
+        session = get_session()
+        async with session.get(url, params=params, timeout=10) as response:
+            if response.status == 200:
+                data = await response.json()
+                items = data.get("items", [])
+                
+                # Structure the results
+                structured_results = []
+                for item in items:
+                    structured_results.append({
+                        "title": item.get("title", ""),
+                        "snippet": item.get("snippet", ""),
+                        "url": item.get("link", ""),
+                        "displayLink": item.get("displayLink", "")
+                    })
+                
+                return {
+                    "results": structured_results,
+                    "total": len(structured_results),
+                    "query": search_query
+                }
+            else:
+                error_text = await response.text()
+                logger.warning(f"Google Search API error: {response.status} - {error_text}")
+                
+                # Fallback: return empty results instead of failing
+                return {"results": [], "error": f"API error: {response.status}"}
+                
     except asyncio.TimeoutError:
-        print("Google Search API timeout")
+        logger.warning("Google Search API timeout")
         return {"results": [], "error": "Request timeout"}
     except Exception as e:
-        print(f"Google Search exception: {str(e)}")
+        logger.error(f"Google Search exception: {str(e)}")
         return {"results": [], "error": str(e)}
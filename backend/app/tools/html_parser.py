@@ -0,0 +1,215 @@
+"""
+HTML extraction layer for the scrapers.
+
+Each source is described by CSS selectors in SOURCE_SELECTORS, and
+`parse_results` turns a page into compact records
+({"title", "url", "snippet"} plus "displayLink" where available).
+
+Two backends share the same selectors:
+- lxml: selectors are compiled to XPath once at import (needs cssselect)
+- bs4: BeautifulSoup with html.parser, used as the fallback when lxml or
+  cssselect is unavailable or a page fails to parse
+"""
+
+import logging
+import os
+from typing import List, Optional, Union
+
+from bs4 import BeautifulSoup
+
+logger = logging.getLogger(__name__)
+
+try:
+    import lxml.html
+    from lxml import etree
+    from lxml.cssselect import CSSSelector
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+HTML_PARSER_BACKEND = os.getenv("HTML_PARSER_BACKEND", "lxml" if LXML_AVAILABLE else "bs4")
+
+# Per-source extraction rules.
+#   item:          container selector (first `limit` matches are used)
+#   title:         title element inside the item
+#   link:          link element, searched inside `link_scope` ("title" or "item");
+#                  None means the title element carries the href itself
+#   snippet:       optional snippet element inside the item
+#   snippet_chars: truncate snippet text (None keeps it whole)
+#   display:       optional display-URL element inside the item
+#   date:          optional publication date element inside the item (its
+#                  datetime attribute is used when present, else its text)
+SOURCE_SELECTORS = {
+    "pib_factcheck": {
+        "item": "article.post", "limit": 3,
+        "title": "h2.entry-title", "link": "a", "link_scope": "title",
+        "snippet": "div.entry-content", "snippet_chars": 200,
+        "date": "time",
+    },
+    "altnews": {
+        "item": "article", "limit": 3,
+        "title": "h3.entry-title", "link": "a", "link_scope": "title",
+        "snippet": "div.entry-content", "snippet_chars": 200,
+        "date": "time",
+    },
+    "boom": {
+        "item": "div.story-card", "limit": 3,
+        "title": "h2.story-card__title", "link": "a.story-card__url", "link_scope": "item",
+        "snippet": "p.story-card__description", "snippet_chars": None,
+        "date": "time",
+    },
+    "factly": {
+        "item": "article", "limit": 3,
+        "title": "h2.entry-title", "link": "a", "link_scope": "title",
+        "snippet": "div.entry-summary", "snippet_chars": 200,
+        "date": "time",
+    },
+    "vishvas": {
+        "item": "article", "limit": 3,
+        "title": "h2", "link": "a", "link_scope": "title",
+        "snippet": "div.entry-content", "snippet_chars": 200,
+        "date": "time",
+    },
+    "duckduckgo": {
+        "item": "div.result", "limit": 5,
+        "title": "a.result__a", "link": None,
+        "snippet": "a.result__snippet", "snippet_chars": None,
+        "display": "a.result__url",
+    },
+}
+
+_SELECTOR_FIELDS = ("item", "title", "link", "snippet", "display", "date")
+
+if LXML_AVAILABLE:
+    _COMPILED = {
+        source: {
+            field: CSSSelector(spec[field])
+            for field in _SELECTOR_FIELDS
+            if spec.get(field)
+        }
+        for source, spec in SOURCE_SELECTORS.items()
+    }
+    # Matches BeautifulSoup's get_text(): skip script/style contents and comments
+    _TEXT_NODES = etree.XPath(
+        "descendant-or-self::text()[not(parent::script or parent::style or parent::template)]"
+    )
+    _LXML_PARSER = lxml.html.HTMLParser(encoding="utf-8")
+
+
+def _truncate(text: str, limit: Optional[int]) -> str:
+    return text[:limit] if limit else text
+
+
+def _lxml_text(element) -> str:
+    return "".join(part.strip() for part in _TEXT_NODES(element))
+
+
+def _first(selector, element):
+    matches = selector(element)
+    return matches[0] if matches else None
+
+
+def _parse_lxml(source: str, html: bytes, limit: int) -> List[dict]:
+    spec = SOURCE_SELECTORS[source]
+    selectors = _COMPILED[source]
+    document = lxml.html.document_fromstring(html, parser=_LXML_PARSER)
+
+    records = []
+    for item in selectors["item"](document)[:limit]:
+        title_el = _first(selectors["title"], item)
+        if title_el is None:
+            continue
+
+        if spec.get("link"):
+            scope = title_el if spec.get("link_scope") == "title" else item
+            link_el = _first(selectors["link"], scope)
+        else:
+            link_el = title_el
+        if link_el is None:
+            continue
+
+        snippet_el = _first(selectors["snippet"], item) if "snippet" in selectors else None
+        record = {
+            "title": _lxml_text(title_el),
+            "url": link_el.get("href", ""),
+            "snippet": _truncate(_lxml_text(snippet_el), spec.get("snippet_chars")) if snippet_el is not None else "",
+        }
+        if "display" in selectors:
+            display_el = _first(selectors["display"], item)
+            record["displayLink"] = _lxml_text(display_el) if display_el is not None else ""
+        if "date" in selectors:
+            date_el = _first(selectors["date"], item)
+            record["date"] = (date_el.get("datetime") or _lxml_text(date_el)) if date_el is not None else ""
+        records.append(record)
+
+    return records
+
+
+def _parse_bs4(source: str, html: Union[str, bytes], limit: int) -> List[dict]:
+    spec = SOURCE_SELECTORS[source]
+    soup = BeautifulSoup(html, "html.parser")
+
+    records = []
+    for item in soup.select(spec["item"], limit=limit):
+        title_el = item.select_one(spec["title"])
+        if title_el is None:
+            continue
+
+        if spec.get("link"):
+            scope = title_el if spec.get("link_scope") == "title" else item
+            link_el = scope.select_one(spec["link"])
+        else:
+            link_el = title_el
+        if link_el is None:
+            continue
+
+        snippet_el = item.select_one(spec["snippet"]) if spec.get("snippet") else None
+        record = {
+            "title": title_el.get_text(strip=True),
+            "url": link_el.get("href", ""),
+            "snippet": _truncate(snippet_el.get_text(strip=True), spec.get("snippet_chars")) if snippet_el else "",
+        }
+        if spec.get("display"):
+            display_el = item.select_one(spec["display"])
+            record["displayLink"] = display_el.get_text(strip=True) if display_el else ""
+        if spec.get("date"):
+            date_el = item.select_one(spec["date"])
+            record["date"] = (date_el.get("datetime") or date_el.get_text(strip=True)) if date_el else ""
+        records.append(record)
+
+    return records
+
+
+def parse_results(
+    source: str,
+    html: Union[str, bytes],
+    backend: Optional[str] = None,
+    limit: Optional[int] = None
+) -> List[dict]:
+    """
+    Extracts result records from a source's page.
+
+    Args:
+        source: Key in SOURCE_SELECTORS (e.g. "altnews", "duckduckgo")
+        html: Page body as text or UTF-8 bytes
+        backend: "lxml" or "bs4" (defaults to HTML_PARSER_BACKEND)
+        limit: Maximum records (defaults to the source's "limit"; the
+            harvester reads whole listing pages)
+
+    Returns:
+        List of {"title", "url", "snippet"} dicts (plus "displayLink" and
+        "date" when the source defines those selectors)
+    """
+    backend = backend or HTML_PARSER_BACKEND
+    limit = limit or SOURCE_SELECTORS[source]["limit"]
+
+    if backend == "lxml" and LXML_AVAILABLE:
+        data = html.encode("utf-8") if isinstance(html, str) else html
+        if not data.strip():
+            return []
+        try:
+            return _parse_lxml(source, data, limit)
+        except Exception as e:
+            logger.warning(f"lxml parse failed for {source}, falling back to BeautifulSoup: {e}")
+
+    return _parse_bs4(source, html, limit)
@@ -0,0 +1,174 @@
+"""
+Per-source HTTP response cache with conditional GET.
+
+Scrapers fetch pages through `fetch_page` instead of calling the session
+directly. Each source has a freshness TTL and a stale-while-revalidate
+window:
+
+- fresh: the cached page is returned without touching the network
+- stale (within the SWR window): the cached page is returned immediately
+  and a background revalidation is started
+- expired: the page is revalidated inline with If-None-Match /
+  If-Modified-Since, so an unchanged page costs a 304 instead of a download
+
+Concurrent fetches of the same URL share one request, so a page like PIB's
+homepage is fetched at most once per interval no matter how many claims
+arrive. Pages are stored in the shared cache backend (app.cache), so other
+workers reuse them too.
+"""
+
+import asyncio
+import logging
+import os
+import time
+from collections import defaultdict
+from typing import Optional, Tuple
+
+from app.cache import get_cache, make_key
+from app.tools.http_session import get_session
+from app.tools.resilience import note_fetch
+
+logger = logging.getLogger(__name__)
+
+HTTP_CACHE_ENABLED = os.getenv("HTTP_CACHE_ENABLED", "true").lower() == "true"
+
+# Seconds a page is fresh, and how long after that a stale copy may still be served
+SOURCE_CACHE_POLICIES = {
+    "pib_factcheck": {"ttl": 600, "stale_while_revalidate": 1800},
+    "altnews": {"ttl": 900, "stale_while_revalidate": 3600},
+    "boom": {"ttl": 900, "stale_while_revalidate": 3600},
+    "factly": {"ttl": 900, "stale_while_revalidate": 3600},
+    "vishvas": {"ttl": 900, "stale_while_revalidate": 3600},
+}
+DEFAULT_CACHE_POLICY = {"ttl": 300, "stale_while_revalidate": 900}
+
+# Entries are kept past their SWR window so expired pages can still be revalidated with a 304
+VALIDATOR_RETENTION = 24 * 3600
+
+_inflight = {}  # url -> asyncio.Task
+_background = set()
+_stats = defaultdict(lambda: defaultdict(int))
+
+
+def get_policy(source: str) -> dict:
+    return SOURCE_CACHE_POLICIES.get(source, DEFAULT_CACHE_POLICY)
+
+
+async def _fetch_and_store(source: str, url: str, headers: dict, timeout: float, entry: Optional[dict]) -> dict:
+    request_headers = dict(headers or {})
+    if entry:
+        if entry.get("etag"):
+            request_headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            request_headers["If-Modified-Since"] = entry["last_modified"]
+
+    session = get_session()
+    async with session.get(url, headers=request_headers, timeout=timeout) as response:
+        if response.status == 304 and entry:
+            _stats[source]["revalidated"] += 1
+            entry = dict(entry, fetched_at=time.time())
+        elif response.status == 200:
+            _stats[source]["downloads"] += 1
+            entry = {
+                "status": 200,
+                "text": await response.text(),
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+                "fetched_at": time.time()
+            }
+        else:
+            # Non-cacheable status: hand it back without storing
+            _stats[source]["bad_status"] += 1
+            return {"status": response.status, "text": await response.text(), "fetched_at": time.time()}
+
+    policy = get_policy(source)
+    await get_cache().set(
+        make_key(f"http:{source}", url),
+        entry,
+        policy["ttl"] + policy["stale_while_revalidate"] + VALIDATOR_RETENTION
+    )
+    return entry
+
+
+def _fetch_shared(source: str, url: str, headers: dict, timeout: float, entry: Optional[dict]) -> asyncio.Task:
+    """Starts a fetch for the URL, or joins the one already in flight."""
+    task = _inflight.get(url)
+    if task is None or task.done():
+        task = asyncio.create_task(_fetch_and_store(source, url, headers, timeout, entry))
+        _inflight[url] = task
+        task.add_done_callback(lambda t: _inflight.pop(url, None) if _inflight.get(url) is t else None)
+    else:
+        _stats[source]["coalesced"] += 1
+    return task
+
+
+def _revalidate_in_background(source: str, url: str, headers: dict, timeout: float, entry: dict):
+    if url in _inflight:
+        return
+
+    task = _fetch_shared(source, url, headers, timeout, entry)
+    _background.add(task)
+
+    def _done(t: asyncio.Task):
+        _background.discard(t)
+        if not t.cancelled() and t.exception() is not None:
+            logger.warning(f"Background revalidation failed for {source}: {t.exception()}")
+
+    task.add_done_callback(_done)
+
+
+async def fetch_page(source: str, url: str, headers: Optional[dict] = None, timeout: float = 10) -> Tuple[int, str]:
+    """
+    Fetches a page through the per-source cache.
+
+    Args:
+        source: Source name used for the cache policy (e.g. "pib_factcheck")
+        url: Page URL
+        headers: Request headers
+        timeout: Request timeout in seconds
+
+    Returns:
+        Tuple of (HTTP status, body text)
+    """
+    if not HTTP_CACHE_ENABLED:
+        note_fetch(from_cache=False)
+        session = get_session()
+        async with session.get(url, headers=headers, timeout=timeout) as response:
+            return response.status, await response.text()
+
+    policy = get_policy(source)
+    entry = await get_cache().get(make_key(f"http:{source}", url))
+
+    if entry:
+        age = time.time() - entry["fetched_at"]
+        if age < policy["ttl"]:
+            _stats[source]["fresh_hits"] += 1
+            note_fetch(from_cache=True)
+            return entry["status"], entry["text"]
+        if age < policy["ttl"] + policy["stale_while_revalidate"]:
+            _stats[source]["stale_hits"] += 1
+            _revalidate_in_background(source, url, headers, timeout, entry)
+            note_fetch(from_cache=True)
+            return entry["status"], entry["text"]
+
+    try:
+        result = await asyncio.shield(_fetch_shared(source, url, headers, timeout, entry))
+    except Exception:
+        if entry:
+            # Serve the old copy rather than nothing when the source is failing
+            _stats[source]["stale_on_error"] += 1
+            note_fetch(from_cache=True)
+            return entry["status"], entry["text"]
+        raise
+
+    note_fetch(from_cache=False)
+    return result["status"], result["text"]
+
+
+def http_cache_stats() -> dict:
+    return {
+        "enabled": HTTP_CACHE_ENABLED,
+        "inflight": len(_inflight),
+        "sources": {source: dict(counters) for source, counters in _stats.items()},
+        "policies": SOURCE_CACHE_POLICIES
+    }
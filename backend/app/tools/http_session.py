@@ -0,0 +1,133 @@
+"""
+Process-wide pooled HTTP session shared by every tool.
+
+Tools used to open a new aiohttp.ClientSession per call, paying for a fresh
+connection pool, DNS lookup and TLS handshake each time. All tools now call
+`get_session()`, which returns one keep-alive session per event loop.
+`close_session()` is wired into the FastAPI lifespan and the Telegram bot
+shutdown hook.
+"""
+
+import asyncio
+import os
+from collections import defaultdict
+from typing import Optional
+
+import aiohttp
+
+HTTP_POOL_LIMIT = int(os.getenv("HTTP_POOL_LIMIT", "100"))
+HTTP_POOL_LIMIT_PER_HOST = int(os.getenv("HTTP_POOL_LIMIT_PER_HOST", "10"))
+HTTP_DNS_CACHE_TTL = int(os.getenv("HTTP_DNS_CACHE_TTL", "300"))
+HTTP_KEEPALIVE_TIMEOUT = float(os.getenv("HTTP_KEEPALIVE_TIMEOUT", "30"))
+
+_session: Optional[aiohttp.ClientSession] = None
+_session_loop: Optional[asyncio.AbstractEventLoop] = None
+
+_stats = {
+    "sessions_created": 0,
+    "requests": 0,
+    "connections_created": 0,
+    "connections_reused": 0,
+    "dns_cache_hits": 0,
+    "dns_cache_misses": 0,
+}
+_requests_per_host = defaultdict(int)
+
+
+async def _on_request_start(session, ctx, params):
+    _stats["requests"] += 1
+    _requests_per_host[params.url.host] += 1
+
+
+async def _on_connection_create_end(session, ctx, params):
+    _stats["connections_created"] += 1
+
+
+async def _on_connection_reuseconn(session, ctx, params):
+    _stats["connections_reused"] += 1
+
+
+async def _on_dns_cache_hit(session, ctx, params):
+    _stats["dns_cache_hits"] += 1
+
+
+async def _on_dns_cache_miss(session, ctx, params):
+    _stats["dns_cache_misses"] += 1
+
+
+def _build_trace_config() -> aiohttp.TraceConfig:
+    trace_config = aiohttp.TraceConfig()
+    trace_config.on_request_start.append(_on_request_start)
+    trace_config.on_connection_create_end.append(_on_connection_create_end)
+    trace_config.on_connection_reuseconn.append(_on_connection_reuseconn)
+    trace_config.on_dns_cache_hit.append(_on_dns_cache_hit)
+    trace_config.on_dns_cache_miss.append(_on_dns_cache_miss)
+    return trace_config
+
+
+def get_session() -> aiohttp.ClientSession:
+    """
+    Returns the shared session for the running event loop, creating it if needed.
+
+    Must be called from inside a coroutine.
+    """
+    global _session, _session_loop
+
+    loop = asyncio.get_running_loop()
+    if _session is None or _session.closed or _session_loop is not loop:
+        connector = aiohttp.TCPConnector(
+            limit=HTTP_POOL_LIMIT,
+            limit_per_host=HTTP_POOL_LIMIT_PER_HOST,
+            ttl_dns_cache=HTTP_DNS_CACHE_TTL,
+            use_dns_cache=True,
+            keepalive_timeout=HTTP_KEEPALIVE_TIMEOUT,
+        )
+        _session = aiohttp.ClientSession(
+            connector=connector,
+            trace_configs=[_build_trace_config()],
+        )
+        _session_loop = loop
+        _stats["sessions_created"] += 1
+
+    return _session
+
+
+async def close_session() -> None:
+    """Closes the shared session and its connection pool."""
+    global _session, _session_loop
+
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
+    _session_loop = None
+
+
+def pool_stats() -> dict:
+    """
+    Returns connection pool counters for the shared session.
+
+    `reuse_rate` is the fraction of connection acquisitions served by an
+    existing keep-alive connection.
+    """
+    acquired = _stats["connections_created"] + _stats["connections_reused"]
+    stats = dict(_stats)
+    stats["reuse_rate"] = round(_stats["connections_reused"] / acquired, 3) if acquired else 0.0
+    stats["requests_per_host"] = dict(_requests_per_host)
+    stats["config"] = {
+        "limit": HTTP_POOL_LIMIT,
+        "limit_per_host": HTTP_POOL_LIMIT_PER_HOST,
+        "dns_cache_ttl": HTTP_DNS_CACHE_TTL,
+        "keepalive_timeout": HTTP_KEEPALIVE_TIMEOUT,
+    }
+
+    if _session is not None and not _session.closed:
+        connector = _session.connector
+        stats["open_session"] = True
+        stats["idle_connections"] = sum(len(conns) for conns in connector._conns.values())
+        stats["active_connections"] = sum(len(conns) for conns in connector._acquired_per_host.values())
+    else:
+        stats["open_session"] = False
+        stats["idle_connections"] = 0
+        stats["active_connections"] = 0
+
+    return stats
@@ -6,337 +6,368 @@ Scrapes verified fact-check sources from India:
 - BOOM Live (Independent)
 - Factly (Independent)
 - Vishvas News (PIB Initiative)
+
+Articles are also harvested in the background into a local full-text
+index (app.factcheck_index); search_all_indian_factcheckers queries it
+alongside the live search pages and merges its matches in.
 """
 
-import aiohttp
+from app.cache import cached_tool
+from app.factcheck_index import get_factcheck_index
+from app.tools.resilience import resilient
+from app.tools.http_cache import fetch_page
+from app.tools.endpoints import source_url
 import asyncio
-from bs4 import BeautifulSoup
+from typing import Callable, Optional
+from app.tools.parse_pool import parse_html, ParsePoolBusy
 from datetime import datetime
 import re
+import logging
+
+logger = logging.getLogger(__name__)
+
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+}
+
+
+def _pib_result(record: dict) -> dict:
+    title = record["title"]
+
+    # Determine verdict from title
+    title_lower = title.lower()
+    verdict = "UNVERIFIED"
+    if any(word in title_lower for word in ['fake', 'false', 'misleading', 'morphed']):
+        verdict = "FALSE"
+    elif any(word in title_lower for word in ['true', 'genuine', 'verified']):
+        verdict = "TRUE"
+
+    return {
+        "title": title,
+        "snippet": record["snippet"],
+        "url": record["url"],
+        "source": "PIB Fact Check (Govt. of India)",
+        "verdict": verdict,
+        "credibility": "high",
+        "date": record.get("date", "")
+    }
+
+
+def _altnews_result(record: dict) -> dict:
+    title = record["title"]
+
+    # Determine verdict
+    title_lower = title.lower()
+    verdict = "UNVERIFIED"
+    if any(word in title_lower for word in ['fake', 'false', 'misleading', 'doctored', 'morphed']):
+        verdict = "FALSE"
+    elif any(word in title_lower for word in ['fact check:', 'debunked']):
+        verdict = "MISLEADING"
+
+    return {
+        "title": title,
+        "snippet": record["snippet"],
+        "url": record["url"],
+        "source": "Alt News",
+        "verdict": verdict,
+        "credibility": "high",
+        "date": record.get("date", "")
+    }
+
+
+def _boom_result(record: dict) -> dict:
+    title = record["title"]
+    url_link = record["url"]
+    if not url_link.startswith('http'):
+        url_link = f"https://www.boomlive.in{url_link}"
+
+    # Determine verdict
+    title_lower = title.lower()
+    verdict = "UNVERIFIED"
+    if any(word in title_lower for word in ['fake', 'false', 'misleading', 'viral lie']):
+        verdict = "FALSE"
+    elif 'fact check' in title_lower:
+        verdict = "MISLEADING"
+
+    return {
+        "title": title,
+        "snippet": record["snippet"],
+        "url": url_link,
+        "source": "BOOM Live",
+        "verdict": verdict,
+        "credibility": "high",
+        "date": record.get("date", "")
+    }
 
+
+def _factly_result(record: dict) -> dict:
+    title = record["title"]
+
+    # Determine verdict
+    title_lower = title.lower()
+    verdict = "UNVERIFIED"
+    if any(word in title_lower for word in ['fake', 'false', 'misleading']):
+        verdict = "FALSE"
+    elif 'fact check' in title_lower:
+        verdict = "MISLEADING"
+
+    return {
+        "title": title,
+        "snippet": record["snippet"],
+        "url": record["url"],
+        "source": "Factly",
+        "verdict": verdict,
+        "credibility": "medium",
+        "date": record.get("date", "")
+    }
+
+
+def _vishvas_result(record: dict) -> dict:
+    title = record["title"]
+
+    # Determine verdict
+    title_lower = title.lower()
+    verdict = "UNVERIFIED"
+    if any(word in title_lower for word in ['fake', 'false', 'misleading', 'गलत', 'भ्रामक']):
+        verdict = "FALSE"
+    elif any(word in title_lower for word in ['true', 'सही', 'सत्य']):
+        verdict = "TRUE"
+
+    return {
+        "title": title,
+        "snippet": record["snippet"],
+        "url": record["url"],
+        "source": "Vishvas News (PIB)",
+        "verdict": verdict,
+        "credibility": "high",
+        "date": record.get("date", "")
+    }
+
+
+# Parser source -> function turning a parsed record into a result (shared with the harvester)
+RESULT_BUILDERS = {
+    "pib_factcheck": _pib_result,
+    "altnews": _altnews_result,
+    "boom": _boom_result,
+    "factly": _factly_result,
+    "vishvas": _vishvas_result,
+}
+
+
+@resilient("pib_factcheck")
 async def scrape_pib_factcheck(claim: str) -> dict:
     """
     Scrapes PIB Fact Check (Press Information Bureau - Government of India)
     Official government fact-checking portal
+
+    The homepage does not depend on the claim, so it is cached per page by
+    fetch_page rather than per claim.
     """
     try:
-        search_query = claim.replace(" ", "+")
-        url = f"https://factcheck.pib.gov.in/"
-        
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
-        
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, headers=headers, timeout=10) as response:
-                if response.status == 200:
-                    html = await response.text()
-                    soup = BeautifulSoup(html, 'html.parser')
-                    
-                    results = []
-                    articles = soup.find_all('article', class_='post', limit=3)
-                    
-                    for article in articles:
-                        title_tag = article.find('h2', class_='entry-title')
-                        link_tag = title_tag.find('a') if title_tag else None
-                        content_tag = article.find('div', class_='entry-content')
-                        
-                        if title_tag and link_tag:
-                            title = title_tag.get_text(strip=True)
-                            url_link = link_tag.get('href', '')
-                            snippet = content_tag.get_text(strip=True)[:200] if content_tag else ""
-                            
-                            # Determine verdict from title
-                            title_lower = title.lower()
-                            verdict = "UNVERIFIED"
-                            if any(word in title_lower for word in ['fake', 'false', 'misleading', 'morphed']):
-                                verdict = "FALSE"
-                            elif any(word in title_lower for word in ['true', 'genuine', 'verified']):
-                                verdict = "TRUE"
-                            
-                            results.append({
-                                "title": title,
-                                "snippet": snippet,
-                                "url": url_link,
-                                "source": "PIB Fact Check (Govt. of India)",
-                                "verdict": verdict,
-                                "credibility": "high"
-                            })
-                    
-                    print(f"PIB Fact Check found {len(results)} results")
-                    return {"results": results, "source": "pib_factcheck"}
-                else:
-                    return {"results": [], "error": f"Status {response.status}"}
-                    
+        url = source_url("pib_factcheck", "/")
+
+        status, html = await fetch_page("pib_factcheck", url, headers=HEADERS)
+        if status == 200:
+            results = [_pib_result(record) for record in await parse_html("pib_factcheck", html)]
+
+            logger.debug("PIB Fact Check found %d results", len(results), extra={"source": "pib_factcheck"})
+            return {"results": results, "source": "pib_factcheck"}
+        else:
+            return {"results": [], "error": f"Status {status}"}
+
+    except ParsePoolBusy:
+        # Local load-shedding, not a source failure: @resilient records it as neutral
+        raise
     except Exception as e:
-        print(f"PIB Fact Check error: {str(e)}")
+        logger.warning(f"PIB Fact Check error: {str(e)}", extra={"source": "pib_factcheck"})
         return {"results": [], "error": str(e)}
 
 
+@cached_tool("altnews")
+@resilient("altnews")
 async def scrape_altnews(claim: str) -> dict:
     """
     Scrapes Alt News - Award-winning independent fact-checking website
     """
     try:
         search_query = claim.replace(" ", "+")
-        url = f"https://www.altnews.in/?s={search_query}"
-        
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
-        
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, headers=headers, timeout=10) as response:
-                if response.status == 200:
-                    html = await response.text()
-                    soup = BeautifulSoup(html, 'html.parser')
-                    
-                    results = []
-                    articles = soup.find_all('article', limit=3)
-                    
-                    for article in articles:
-                        title_tag = article.find('h3', class_='entry-title')
-                        link_tag = title_tag.find('a') if title_tag else None
-                        excerpt_tag = article.find('div', class_='entry-content')
-                        
-                        if title_tag and link_tag:
-                            title = title_tag.get_text(strip=True)
-                            url_link = link_tag.get('href', '')
-                            snippet = excerpt_tag.get_text(strip=True)[:200] if excerpt_tag else ""
-                            
-                            # Determine verdict
-                            title_lower = title.lower()
-                            verdict = "UNVERIFIED"
-                            if any(word in title_lower for word in ['fake', 'false', 'misleading', 'doctored', 'morphed']):
-                                verdict = "FALSE"
-                            elif any(word in title_lower for word in ['fact check:', 'debunked']):
-                                verdict = "MISLEADING"
-                            
-                            results.append({
-                                "title": title,
-                                "snippet": snippet,
-                                "url": url_link,
-                                "source": "Alt News",
-                                "verdict": verdict,
-                                "credibility": "high"
-                            })
-                    
-                    print(f"Alt News found {len(results)} results")
-                    return {"results": results, "source": "altnews"}
-                else:
-                    return {"results": [], "error": f"Status {response.status}"}
-                    
+        url = source_url("altnews", f"/?s={search_query}")
+
+        status, html = await fetch_page("altnews", url, headers=HEADERS)
+        if status == 200:
+            results = [_altnews_result(record) for record in await parse_html("altnews", html)]
+
+            logger.debug("Alt News found %d results", len(results), extra={"source": "altnews"})
+            return {"results": results, "source": "altnews"}
+        else:
+            return {"results": [], "error": f"Status {status}"}
+
+    except ParsePoolBusy:
+        # Local load-shedding, not a source failure: @resilient records it as neutral
+        raise
     except Exception as e:
-        print(f"Alt News error: {str(e)}")
+        logger.warning(f"Alt News error: {str(e)}", extra={"source": "altnews"})
         return {"results": [], "error": str(e)}
 
 
+@cached_tool("boom")
+@resilient("boom")
 async def scrape_boom_live(claim: str) -> dict:
     """
     Scrapes BOOM Live - Leading Indian fact-checking organization
     """
     try:
         search_query = claim.replace(" ", "%20")
-        url = f"https://www.boomlive.in/?s={search_query}"
-        
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
-        
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, headers=headers, timeout=10) as response:
-                if response.status == 200:
-                    html = await response.text()
-                    soup = BeautifulSoup(html, 'html.parser')
-                    
-                    results = []
-                    articles = soup.find_all('div', class_='story-card', limit=3)
-                    
-                    for article in articles:
-                        title_tag = article.find('h2', class_='story-card__title')
-                        link_tag = article.find('a', class_='story-card__url')
-                        desc_tag = article.find('p', class_='story-card__description')
-                        
-                        if title_tag and link_tag:
-                            title = title_tag.get_text(strip=True)
-                            url_link = link_tag.get('href', '')
-                            if not url_link.startswith('http'):
-                                url_link = f"https://www.boomlive.in{url_link}"
-                            snippet = desc_tag.get_text(strip=True) if desc_tag else ""
-                            
-                            # Determine verdict
-                            title_lower = title.lower()
-                            verdict = "UNVERIFIED"
-                            if any(word in title_lower for word in ['fake', 'false', 'misleading', 'viral lie']):
-                                verdict = "FALSE"
-                            elif 'fact check' in title_lower:
-                                verdict = "MISLEADING"
-                            
-                            results.append({
-                                "title": title,
-                                "snippet": snippet,
-                                "url": url_link,
-                                "source": "BOOM Live",
-                                "verdict": verdict,
-                                "credibility": "high"
-                            })
-                    
-                    print(f"BOOM Live found {len(results)} results")
-                    return {"results": results, "source": "boom"}
-                else:
-                    return {"results": [], "error": f"Status {response.status}"}
-                    
+        url = source_url("boom", f"/?s={search_query}")
+
+        status, html = await fetch_page("boom", url, headers=HEADERS)
+        if status == 200:
+            results = [_boom_result(record) for record in await parse_html("boom", html)]
+
+            logger.debug("BOOM Live found %d results", len(results), extra={"source": "boom"})
+            return {"results": results, "source": "boom"}
+        else:
+            return {"results": [], "error": f"Status {status}"}
+
+    except ParsePoolBusy:
+        # Local load-shedding, not a source failure: @resilient records it as neutral
+        raise
     except Exception as e:
-        print(f"BOOM Live error: {str(e)}")
+        logger.warning(f"BOOM Live error: {str(e)}", extra={"source": "boom"})
         return {"results": [], "error": str(e)}
 
 
+@cached_tool("factly")
+@resilient("factly")
 async def scrape_factly(claim: str) -> dict:
     """
     Scrapes Factly - South Indian fact-checking organization
     """
     try:
         search_query = claim.replace(" ", "+")
-        url = f"https://factly.in/?s={search_query}"
-        
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
-        
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, headers=headers, timeout=10) as response:
-                if response.status == 200:
-                    html = await response.text()
-                    soup = BeautifulSoup(html, 'html.parser')
-                    
-                    results = []
-                    articles = soup.find_all('article', limit=3)
-                    
-                    for article in articles:
-                        title_tag = article.find('h2', class_='entry-title')
-                        link_tag = title_tag.find('a') if title_tag else None
-                        excerpt_tag = article.find('div', class_='entry-summary')
-                        
-                        if title_tag and link_tag:
-                            title = title_tag.get_text(strip=True)
-                            url_link = link_tag.get('href', '')
-                            snippet = excerpt_tag.get_text(strip=True)[:200] if excerpt_tag else ""
-                            
-                            # Determine verdict
-                            title_lower = title.lower()
-                            verdict = "UNVERIFIED"
-                            if any(word in title_lower for word in ['fake', 'false', 'misleading']):
-                                verdict = "FALSE"
-                            elif 'fact check' in title_lower:
-                                verdict = "MISLEADING"
-                            
-                            results.append({
-                                "title": title,
-                                "snippet": snippet,
-                                "url": url_link,
-                                "source": "Factly",
-                                "verdict": verdict,
-                                "credibility": "medium"
-                            })
-                    
-                    print(f"Factly found {len(results)} results")
-                    return {"results": results, "source": "factly"}
-                else:
-                    return {"results": [], "error": f"Status {response.status}"}
-                    
+        url = source_url("factly", f"/?s={search_query}")
+
+        status, html = await fetch_page("factly", url, headers=HEADERS)
+        if status == 200:
+            results = [_factly_result(record) for record in await parse_html("factly", html)]
+
+            logger.debug("Factly found %d results", len(results), extra={"source": "factly"})
+            return {"results": results, "source": "factly"}
+        else:
+            return {"results": [], "error": f"Status {status}"}
+
+    except ParsePoolBusy:
+        # Local load-shedding, not a source failure: @resilient records it as neutral
+        raise
     except Exception as e:
-        print(f"Factly error: {str(e)}")
+        logger.warning(f"Factly error: {str(e)}", extra={"source": "factly"})
         return {"results": [], "error": str(e)}
 
 
+@cached_tool("vishvas")
+@resilient("vishvas")
 async def scrape_vishvas_news(claim: str) -> dict:
     """
     Scrapes Vishvas News - PIB's multilingual fact-checking initiative
     """
     try:
         search_query = claim.replace(" ", "+")
-        url = f"https://www.vishvasnews.com/?s={search_query}"
-        
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
-        
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, headers=headers, timeout=10) as response:
-                if response.status == 200:
-                    html = await response.text()
-                    soup = BeautifulSoup(html, 'html.parser')
-                    
-                    results = []
-                    articles = soup.find_all('article', limit=3)
-                    
-                    for article in articles:
-                        title_tag = article.find('h2')
-                        link_tag = title_tag.find('a') if title_tag else None
-                        content_tag = article.find('div', class_='entry-content')
-                        
-                        if title_tag and link_tag:
-                            title = title_tag.get_text(strip=True)
-                            url_link = link_tag.get('href', '')
-                            snippet = content_tag.get_text(strip=True)[:200] if content_tag else ""
-                            
-                            # Determine verdict
-                            title_lower = title.lower()
-                            verdict = "UNVERIFIED"
-                            if any(word in title_lower for word in ['fake', 'false', 'misleading', 'गलत', 'भ्रामक']):
-                                verdict = "FALSE"
-                            elif any(word in title_lower for word in ['true', 'सही', 'सत्य']):
-                                verdict = "TRUE"
-                            
-                            results.append({
-                                "title": title,
-                                "snippet": snippet,
-                                "url": url_link,
-                                "source": "Vishvas News (PIB)",
-                                "verdict": verdict,
-                                "credibility": "high"
-                            })
-                    
-                    print(f"Vishvas News found {len(results)} results")
-                    return {"results": results, "source": "vishvas"}
-                else:
-                    return {"results": [], "error": f"Status {response.status}"}
-                    
+        url = source_url("vishvas", f"/?s={search_query}")
+
+        status, html = await fetch_page("vishvas", url, headers=HEADERS)
+        if status == 200:
+            results = [_vishvas_result(record) for record in await parse_html("vishvas", html)]
+
+            logger.debug("Vishvas News found %d results", len(results), extra={"source": "vishvas"})
+            return {"results": results, "source": "vishvas"}
+        else:
+            return {"results": [], "error": f"Status {status}"}
+
+    except ParsePoolBusy:
+        # Local load-shedding, not a source failure: @resilient records it as neutral
+        raise
     except Exception as e:
-        print(f"Vishvas News error: {str(e)}")
+        logger.warning(f"Vishvas News error: {str(e)}", extra={"source": "vishvas"})
         return {"results": [], "error": str(e)}
 
 
-async def search_all_indian_factcheckers(claim: str) -> dict:
+async def _search_index(index, claim: str) -> dict:
+    try:
+        indexed = await index.search(claim)
+    except Exception as e:
+        logger.warning(f"Fact-check index error: {str(e)}")
+        indexed = []
+    logger.debug("🇮🇳 Fact-check index found %d results", len(indexed))
+    return {"results": indexed, "from_index": True}
+
+
+async def search_all_indian_factcheckers(claim: str, stop_when: Optional[Callable[[list], bool]] = None) -> dict:
     """
     Search all Indian fact-checkers in parallel
     Returns combined results from all sources
+
+    The harvested article index is queried alongside the live search pages
+    and its matches are merged in ahead of the scraped results (duplicate
+    URLs dropped): it adds articles the sites' own search misses, but a
+    loose or stale index match never replaces a live search.
+
+    Args:
+        claim: The claim to search for
+        stop_when: Optional check run on each scraper's results (and the
+            index matches) as they finish; when it returns True the
+            remaining scrapers are cancelled (early exit on an
+            authoritative match)
     """
+    index = get_factcheck_index()
+    scrapers = [scrape_pib_factcheck, scrape_altnews, scrape_boom_live, scrape_factly, scrape_vishvas_news]
+    tasks = [asyncio.create_task(scraper(claim)) for scraper in scrapers]
+    if index is not None:
+        tasks.insert(0, asyncio.create_task(_search_index(index, claim)))
     try:
-        # Run all scrapers in parallel
-        results = await asyncio.gather(
-            scrape_pib_factcheck(claim),
-            scrape_altnews(claim),
-            scrape_boom_live(claim),
-            scrape_factly(claim),
-            scrape_vishvas_news(claim),
-            return_exceptions=True
-        )
-        
-        # Combine all results
+        # Run the index search and all scrapers in parallel
+        early_exit = False
+        for next_done in asyncio.as_completed(tasks):
+            try:
+                result = await next_done
+            except Exception:
+                continue
+            if stop_when is not None and isinstance(result, dict) and stop_when(result.get("results", [])):
+                early_exit = True
+                break
+
+        # Combine all results (index first, then scraper order, not completion order)
         all_results = []
-        for result in results:
-            if isinstance(result, dict) and not isinstance(result, Exception):
-                all_results.extend(result.get("results", []))
-        
-        print(f"🇮🇳 Total Indian fact-checker results: {len(all_results)}")
-        
-        return {
+        seen_urls = set()
+        indexed = 0
+        for task in tasks:
+            if not task.done() or task.cancelled() or task.exception() is not None:
+                continue
+            result = task.result()
+            if not isinstance(result, dict):
+                continue
+            for item in result.get("results", []):
+                if item.get("url") in seen_urls:
+                    continue
+                seen_urls.add(item.get("url"))
+                all_results.append(item)
+                indexed += bool(result.get("from_index"))
+
+        logger.debug("🇮🇳 Total Indian fact-checker results: %d (%d from the index)", len(all_results), indexed)
+
+        combined = {
             "results": all_results,
             "total": len(all_results),
             "sources": ["PIB", "Alt News", "BOOM", "Factly", "Vishvas News"]
         }
-        
+        if indexed:
+            combined["indexed_results"] = indexed
+        if early_exit:
+            combined["early_exit"] = True
+        return combined
+
     except Exception as e:
-        print(f"Indian fact-checkers error: {str(e)}")
+        logger.error(f"Indian fact-checkers error: {str(e)}")
         return {"results": [], "error": str(e)}
+    finally:
+        for task in tasks:
+            task.cancel()
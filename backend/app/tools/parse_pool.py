@@ -0,0 +1,171 @@
+"""
+Process pool for HTML extraction.
+
+Scrapers hand raw page bytes to `parse_html`, which runs
+html_parser.parse_results in a worker process and returns the compact
+result records. Parsing CPU work therefore no longer runs on the event
+loop thread, and a worker can use more than one core.
+
+Backpressure:
+- at most PARSE_POOL_WORKERS jobs run at once; further jobs wait for a slot
+- at most PARSE_POOL_MAX_PENDING jobs may be queued or running; beyond that
+  `parse_html` raises ParsePoolBusy, so a flood of heavy pages is shed
+  instead of piling up behind the network I/O of other requests
+
+Set PARSE_POOL_WORKERS=0 to parse inline on the event loop.
+"""
+
+import asyncio
+import multiprocessing
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Union
+
+from app.tools.html_parser import parse_results
+
+PARSE_POOL_WORKERS = int(os.getenv("PARSE_POOL_WORKERS", str(min(4, os.cpu_count() or 1))))
+PARSE_POOL_MAX_PENDING = int(os.getenv("PARSE_POOL_MAX_PENDING", "64"))
+PARSE_POOL_START_METHOD = os.getenv("PARSE_POOL_START_METHOD", "spawn")
+
+
+class ParsePoolBusy(Exception):
+    """Raised when the parse queue is full."""
+
+
+def _parse_job(source: str, html: bytes, limit: Optional[int] = None):
+    """Runs in the worker process; returns records and the parse time."""
+    started = time.perf_counter()
+    records = parse_results(source, html, limit=limit)
+    return records, time.perf_counter() - started
+
+
+def _percentile(samples, fraction: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+class ParsePool:
+    """
+    Bounded process pool for page parsing.
+
+    Args:
+        workers: Worker processes (also the number of jobs running at once)
+        max_pending: Maximum queued plus running jobs before rejecting
+    """
+
+    def __init__(self, workers: int = PARSE_POOL_WORKERS, max_pending: int = PARSE_POOL_MAX_PENDING):
+        self.workers = workers
+        self.max_pending = max_pending
+        self.pending = 0
+        self.completed = 0
+        self.rejected = 0
+
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._queue_waits = deque(maxlen=1000)
+        self._parse_times = deque(maxlen=1000)
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context(PARSE_POOL_START_METHOD)
+            )
+        return self._executor
+
+    def _get_slots(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        if self._slots is None or self._loop is not loop:
+            self._slots = asyncio.Semaphore(self.workers)
+            self._loop = loop
+        return self._slots
+
+    async def parse(self, source: str, html: bytes, limit: Optional[int] = None) -> List[dict]:
+        """
+        Parses a page in a worker process.
+
+        Args:
+            source: Key in html_parser.SOURCE_SELECTORS
+            html: Raw page bytes (UTF-8)
+            limit: Maximum records (defaults to the source's selector limit)
+
+        Returns:
+            Result records from parse_results
+
+        Raises:
+            ParsePoolBusy: When max_pending jobs are already queued
+        """
+        if self.pending >= self.max_pending:
+            self.rejected += 1
+            raise ParsePoolBusy(f"Parse queue full ({self.pending} pending)")
+
+        self.pending += 1
+        queued_at = time.perf_counter()
+        try:
+            async with self._get_slots():
+                self._queue_waits.append(time.perf_counter() - queued_at)
+                loop = asyncio.get_running_loop()
+                records, parse_seconds = await loop.run_in_executor(
+                    self._get_executor(), _parse_job, source, html, limit
+                )
+        finally:
+            self.pending -= 1
+
+        self._parse_times.append(parse_seconds)
+        self.completed += 1
+        return records
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def stats(self) -> dict:
+        return {
+            "enabled": self.workers > 0,
+            "workers": self.workers,
+            "max_pending": self.max_pending,
+            "pending": self.pending,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "queue_wait_ms": {
+                "p50": round(_percentile(self._queue_waits, 0.5) * 1000, 2),
+                "p95": round(_percentile(self._queue_waits, 0.95) * 1000, 2),
+                "max": round(max(self._queue_waits, default=0.0) * 1000, 2)
+            },
+            "parse_ms": {
+                "p50": round(_percentile(self._parse_times, 0.5) * 1000, 2),
+                "p95": round(_percentile(self._parse_times, 0.95) * 1000, 2),
+                "max": round(max(self._parse_times, default=0.0) * 1000, 2)
+            }
+        }
+
+
+parse_pool = ParsePool()
+
+
+async def parse_html(source: str, html: Union[str, bytes], limit: Optional[int] = None) -> List[dict]:
+    """
+    Extracts result records for a source, off the event loop when the pool is enabled.
+
+    Args:
+        source: Key in html_parser.SOURCE_SELECTORS
+        html: Page body as text or UTF-8 bytes
+        limit: Maximum records (defaults to the source's selector limit)
+
+    Returns:
+        List of result records
+    """
+    data = html.encode("utf-8") if isinstance(html, str) else html
+    if parse_pool.workers <= 0:
+        return parse_results(source, data, limit=limit)
+    return await parse_pool.parse(source, data, limit)
+
+
+def shutdown_parse_pool():
+    parse_pool.shutdown()
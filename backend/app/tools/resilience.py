@@ -0,0 +1,252 @@
+"""
+Resilience layer for the verification tools.
+
+Each tool is wrapped with `@resilient(source)` (inside `@cached_tool`, so
+cache hits skip it entirely):
+
+- adaptive deadline: once a source has RESILIENCE_MIN_SAMPLES successful
+  network calls, its deadline is RESILIENCE_TIMEOUT_MULTIPLIER x its p95 latency,
+  clamped to [RESILIENCE_MIN_TIMEOUT, RESILIENCE_MAX_TIMEOUT]; before that
+  it is RESILIENCE_MAX_TIMEOUT (the tools' old fixed 10 s)
+- circuit breaker: RESILIENCE_BREAKER_FAILURES consecutive failures open
+  the breaker and the source is skipped for RESILIENCE_BREAKER_COOLDOWN
+  seconds; then one trial call is let through (half-open) and its outcome
+  closes or re-opens the breaker
+- hedging (opt-in per source, RESILIENCE_HEDGE): if a call has not
+  answered by the source's p90 latency, a second identical call is started
+  and whichever answers first wins
+
+Tools report failures as {"error": ...} results rather than exceptions, so
+those count as failures too, except for missing API keys (a configuration
+state, not an outage). Scrapers let ParsePoolBusy through instead: a full
+parse queue is this process shedding load, not the source failing, so it
+is returned as a skipped result and recorded as neutral.
+
+Scrapers read pages through http_cache.fetch_page, which reports through
+note_fetch whether each page came from its cache. Calls answered entirely
+from that cache take near-zero time and say nothing about the source, so
+they are recorded as neutral: only calls that reached the network feed the
+latency window behind the deadline and the hedge delay.
+
+The overall evidence budget lives in verification_agent.gather_sources.
+"""
+
+import asyncio
+import functools
+import os
+import time
+from collections import defaultdict, deque
+from contextvars import ContextVar
+from typing import Dict, Optional
+
+from app.metrics import record_source_call
+from app.tools.parse_pool import ParsePoolBusy
+import logging
+
+logger = logging.getLogger(__name__)
+
+RESILIENCE_MIN_TIMEOUT = float(os.getenv("RESILIENCE_MIN_TIMEOUT", "2"))
+RESILIENCE_MAX_TIMEOUT = float(os.getenv("RESILIENCE_MAX_TIMEOUT", "10"))
+RESILIENCE_TIMEOUT_MULTIPLIER = float(os.getenv("RESILIENCE_TIMEOUT_MULTIPLIER", "1.5"))
+RESILIENCE_MIN_SAMPLES = int(os.getenv("RESILIENCE_MIN_SAMPLES", "20"))
+RESILIENCE_BREAKER_FAILURES = int(os.getenv("RESILIENCE_BREAKER_FAILURES", "5"))
+RESILIENCE_BREAKER_COOLDOWN = float(os.getenv("RESILIENCE_BREAKER_COOLDOWN", "60"))
+RESILIENCE_HEDGE = os.getenv("RESILIENCE_HEDGE", "false").lower() == "true"
+
+# Sources whose calls are cheap and idempotent enough to hedge. The
+# scrapers fetch shared pages through http_cache, where a second request
+# would just join the first, and NewsAPI has a small daily quota.
+HEDGED_SOURCES = {"google_factcheck", "google_search"}
+
+CLOSED, OPEN, HALF_OPEN = "closed", "open", "half_open"
+
+# Page fetches of the tool call in progress: "cache" and "network" counts
+_fetches: ContextVar[Optional[Dict[str, int]]] = ContextVar("source_fetches", default=None)
+
+
+def note_fetch(from_cache: bool):
+    """Records that the current tool call got a page from the HTTP cache or from the network."""
+    fetches = _fetches.get()
+    if fetches is not None:
+        fetches["cache" if from_cache else "network"] += 1
+
+
+def _percentile(samples, fraction: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+class SourceHealth:
+    """Latency window and circuit breaker for one source."""
+
+    def __init__(self, source: str):
+        self.source = source
+        self.latencies = deque(maxlen=200)
+        self.state = CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self.trial_in_flight = False
+        self.counters = defaultdict(int)
+
+    def deadline(self) -> float:
+        if len(self.latencies) < RESILIENCE_MIN_SAMPLES:
+            return RESILIENCE_MAX_TIMEOUT
+        adaptive = _percentile(self.latencies, 0.95) * RESILIENCE_TIMEOUT_MULTIPLIER
+        return min(RESILIENCE_MAX_TIMEOUT, max(RESILIENCE_MIN_TIMEOUT, adaptive))
+
+    def hedge_delay(self) -> Optional[float]:
+        if len(self.latencies) < RESILIENCE_MIN_SAMPLES:
+            return None
+        return _percentile(self.latencies, 0.9)
+
+    def allow(self) -> bool:
+        """Whether a call may go out now (moves open -> half-open after the cooldown)."""
+        if self.state == OPEN:
+            if time.monotonic() - self.opened_at < RESILIENCE_BREAKER_COOLDOWN:
+                return False
+            self.state = HALF_OPEN
+        if self.state == HALF_OPEN:
+            if self.trial_in_flight:
+                return False
+            self.trial_in_flight = True
+        return True
+
+    def record_success(self, latency: float):
+        """A call that went to the network and succeeded (latency joins the window)."""
+        self.latencies.append(latency)
+        self.consecutive_failures = 0
+        self.trial_in_flight = False
+        if self.state != CLOSED:
+            self.counters["breaker_closed"] += 1
+        self.state = CLOSED
+
+    def record_failure(self):
+        self.consecutive_failures += 1
+        self.trial_in_flight = False
+        if self.state == HALF_OPEN or self.consecutive_failures >= RESILIENCE_BREAKER_FAILURES:
+            if self.state != OPEN:
+                self.counters["breaker_opened"] += 1
+            self.state = OPEN
+            self.opened_at = time.monotonic()
+
+    def record_neutral(self):
+        """A call that says nothing about the source (cancelled, served from cache, missing key)."""
+        self.trial_in_flight = False
+
+    def stats(self) -> dict:
+        return {
+            "state": self.state,
+            "deadline_s": round(self.deadline(), 2),
+            "p50_ms": round(_percentile(self.latencies, 0.5) * 1000, 1) if self.latencies else None,
+            "p95_ms": round(_percentile(self.latencies, 0.95) * 1000, 1) if self.latencies else None,
+            "samples": len(self.latencies),
+            "consecutive_failures": self.consecutive_failures,
+            **self.counters
+        }
+
+
+_health = {}
+
+
+def get_health(source: str) -> SourceHealth:
+    if source not in _health:
+        _health[source] = SourceHealth(source)
+    return _health[source]
+
+
+def _is_failure(result) -> bool:
+    if not isinstance(result, dict):
+        return True
+    error = result.get("error")
+    return bool(error) and not str(error).startswith("No API key")
+
+
+async def _hedged(func, claim: str, delay: float, health: SourceHealth) -> dict:
+    primary = asyncio.create_task(func(claim))
+    done, _ = await asyncio.wait({primary}, timeout=delay)
+    if done:
+        return primary.result()
+
+    health.counters["hedged"] += 1
+    backup = asyncio.create_task(func(claim))
+    try:
+        done, _ = await asyncio.wait({primary, backup}, return_when=asyncio.FIRST_COMPLETED)
+        winner = done.pop()
+        if winner is backup:
+            health.counters["hedge_won"] += 1
+        return winner.result()
+    finally:
+        primary.cancel()
+        backup.cancel()
+
+
+def resilient(source: str, result_key: str = "results"):
+    """
+    Applies the adaptive deadline, circuit breaker and optional hedging to a tool.
+
+    Args:
+        source: Source name (same as the tool's cache namespace)
+        result_key: Key of the result list, used for skipped/timed-out results
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(claim: str) -> dict:
+            health = get_health(source)
+            if not health.allow():
+                health.counters["skipped"] += 1
+                record_source_call(source, "skipped")
+                return {result_key: [], "error": "Circuit open", "skipped": True}
+
+            deadline = health.deadline()
+            hedge_delay = health.hedge_delay() if RESILIENCE_HEDGE and source in HEDGED_SOURCES else None
+            started = time.perf_counter()
+            health.counters["calls"] += 1
+            fetches = defaultdict(int)
+            token = _fetches.set(fetches)
+
+            try:
+                call = _hedged(func, claim, hedge_delay, health) if hedge_delay else func(claim)
+                result = await asyncio.wait_for(call, timeout=deadline)
+            except asyncio.TimeoutError:
+                health.counters["timeouts"] += 1
+                health.record_failure()
+                record_source_call(source, "timeout", time.perf_counter() - started)
+                logger.warning(f"{source} exceeded its {deadline:.1f}s deadline", extra={"source": source})
+                return {result_key: [], "error": f"Timeout after {deadline:.1f}s"}
+            except asyncio.CancelledError:
+                health.record_neutral()
+                raise
+            except ParsePoolBusy as e:
+                health.counters["shed"] += 1
+                health.record_neutral()
+                record_source_call(source, "skipped")
+                return {result_key: [], "error": str(e), "skipped": True}
+            except Exception:
+                health.record_failure()
+                record_source_call(source, "error", time.perf_counter() - started)
+                raise
+            finally:
+                _fetches.reset(token)
+
+            elapsed = time.perf_counter() - started
+            results = len(result.get(result_key, [])) if isinstance(result, dict) else 0
+            record_source_call(source, "error" if isinstance(result, dict) and result.get("error") else "ok", elapsed, results)
+            if _is_failure(result):
+                health.counters["failures"] += 1
+                health.record_failure()
+            elif isinstance(result, dict) and result.get("error"):
+                health.record_neutral()
+            elif fetches["cache"] and not fetches["network"]:
+                health.counters["cache_served"] += 1
+                health.record_neutral()
+            else:
+                health.record_success(elapsed)
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+def source_health_stats() -> dict:
+    return {source: health.stats() for source, health in sorted(_health.items())}
@@ -0,0 +1,249 @@
+"""
+Approximate nearest-neighbour index over claim texts.
+
+Claims are embedded locally, without any model or network call, as hashed
+TF-IDF vectors:
+- features are words, word bigrams and character trigrams of the
+  normalized text, so rewording and typos still share most features
+- each feature is hashed (crc32) into one of `buckets` document-frequency
+  counters for its IDF weight, and into one of `dims` signed dimensions of
+  a dense float32 vector (the hashing trick), which is L2-normalized
+
+Cosine similarity is then a matrix-vector product. Up to `exact_max`
+vectors are scanned exhaustively; beyond that an inverted-file layout
+(spherical k-means centroids, `nprobe` nearest lists scanned) keeps a
+lookup over hundreds of thousands of claims in the low milliseconds.
+
+Scores are a cheap first pass: callers confirm candidates with
+hybrid_similarity (and number_tokens) before trusting a match.
+"""
+
+import math
+import os
+import threading
+import zlib
+from collections import Counter
+from typing import Any, List, Optional, Tuple
+
+import numpy as np
+
+from app.utils.similarity import normalize_for_similarity
+
+CLAIM_INDEX_DIMS = int(os.getenv("CLAIM_INDEX_DIMS", "256"))
+CLAIM_INDEX_EXACT_MAX = int(os.getenv("CLAIM_INDEX_EXACT_MAX", "250000"))
+CLAIM_INDEX_NPROBE = int(os.getenv("CLAIM_INDEX_NPROBE", "32"))
+
+# Document-frequency counters (power of two)
+_BUCKETS = 1 << 20
+_KMEANS_SAMPLE = 20000
+_KMEANS_ITERATIONS = 8
+
+
+def claim_features(text: str) -> List[str]:
+    """Word, word-bigram and character-trigram features of a text."""
+    words = normalize_for_similarity(text).split()
+    features = [f"w:{word}" for word in words]
+    features.extend(f"b:{first} {second}" for first, second in zip(words, words[1:]))
+    for word in words:
+        padded = f" {word} "
+        features.extend(f"c:{padded[i:i + 3]}" for i in range(len(padded) - 2))
+    return features
+
+
+class ClaimVectorIndex:
+    """
+    In-memory ANN index of claim texts with attached payloads.
+
+    Args:
+        dims: Embedding dimensions
+        exact_max: Up to this many vectors, searches scan everything
+        nprobe: Inverted lists scanned per search above exact_max
+    """
+
+    def __init__(self, dims: int = CLAIM_INDEX_DIMS, exact_max: int = CLAIM_INDEX_EXACT_MAX, nprobe: int = CLAIM_INDEX_NPROBE):
+        self.dims = dims
+        self.exact_max = exact_max
+        self.nprobe = nprobe
+        self._lock = threading.Lock()
+        self.searches = 0
+        self._reset()
+
+    def _reset(self):
+        self._df = np.zeros(_BUCKETS, dtype=np.int32)
+        self._documents = 0
+
+        self._matrix = np.zeros((1024, self.dims), dtype=np.float32)
+        self._size = 0  # rows used, including removed ones
+        self._keys: List[Optional[str]] = []
+        self._payloads: List[Any] = []
+        self._rows = {}  # key -> row
+
+        # Inverted file (trained lazily once the index outgrows exact_max)
+        self._centroids: Optional[np.ndarray] = None
+        self._labels = np.zeros(1024, dtype=np.int32)
+        self._trained_size = 0
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def _hash(self, text: str) -> Tuple[np.ndarray, np.ndarray]:
+        counts = Counter(zlib.crc32(feature.encode("utf-8")) for feature in claim_features(text))
+        hashes = np.fromiter(counts.keys(), dtype=np.int64, count=len(counts))
+        tf = np.fromiter(counts.values(), dtype=np.float32, count=len(counts))
+        return hashes, tf
+
+    def _embed(self, hashes: np.ndarray, tf: np.ndarray) -> np.ndarray:
+        buckets = hashes & (_BUCKETS - 1)
+        idf = np.log((1.0 + self._documents) / (1.0 + self._df[buckets])) + 1.0
+        weights = (1.0 + np.log(tf)) * idf
+        signs = np.where((hashes >> 31) & 1, -1.0, 1.0)
+
+        vector = np.zeros(self.dims, dtype=np.float32)
+        np.add.at(vector, hashes % self.dims, signs * weights)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def embed(self, text: str) -> np.ndarray:
+        """Unit-length embedding of a text with the current IDF weights."""
+        with self._lock:
+            return self._embed(*self._hash(text))
+
+    def _grow(self):
+        capacity = self._matrix.shape[0] * 2
+        matrix = np.zeros((capacity, self.dims), dtype=np.float32)
+        matrix[:self._size] = self._matrix[:self._size]
+        self._matrix = matrix
+        labels = np.zeros(capacity, dtype=np.int32)
+        labels[:self._size] = self._labels[:self._size]
+        self._labels = labels
+
+    def _remove_locked(self, key: str):
+        row = self._rows.pop(key, None)
+        if row is not None:
+            self._matrix[row] = 0.0
+            self._keys[row] = None
+            self._payloads[row] = None
+
+    def add(self, key: str, text: str, payload: Any = None):
+        """
+        Adds (or replaces) a claim.
+
+        Args:
+            key: Unique identifier (e.g. normalized claim or article URL)
+            text: Text to embed
+            payload: Returned with search hits
+        """
+        hashes, tf = self._hash(text)
+        with self._lock:
+            self._remove_locked(key)
+            self._documents += 1
+            np.add.at(self._df, np.unique(hashes & (_BUCKETS - 1)), 1)
+
+            if self._size == self._matrix.shape[0]:
+                self._grow()
+            row = self._size
+            self._size += 1
+            self._matrix[row] = self._embed(hashes, tf)
+            self._keys.append(key)
+            self._payloads.append(payload)
+            self._rows[key] = row
+
+            if self._centroids is not None:
+                self._labels[row] = int(np.argmax(self._centroids @ self._matrix[row]))
+            if len(self._rows) > self.exact_max and self._size >= 2 * max(self._trained_size, self.exact_max // 2):
+                self._train()
+
+            if self._size - len(self._rows) > max(1024, self._size // 2):
+                self._compact()
+
+    def remove(self, key: str):
+        with self._lock:
+            self._remove_locked(key)
+
+    def _compact(self):
+        """Drops removed rows (IDF counts keep them; they only decay the weights slightly)."""
+        live = np.array(sorted(self._rows.values()), dtype=np.int64)
+        self._matrix[:len(live)] = self._matrix[live]
+        self._matrix[len(live):self._size] = 0.0
+        self._labels[:len(live)] = self._labels[live]
+        self._keys = [self._keys[row] for row in live]
+        self._payloads = [self._payloads[row] for row in live]
+        self._rows = {key: row for row, key in enumerate(self._keys)}
+        self._size = len(live)
+
+    def _train(self):
+        """Spherical k-means over a sample; assigns every row to its nearest centroid."""
+        rows = np.array(sorted(self._rows.values()), dtype=np.int64)
+        lists = min(4096, max(16, int(math.sqrt(len(rows)))))
+        rng = np.random.default_rng(0)
+        sample = self._matrix[rng.choice(rows, size=min(len(rows), _KMEANS_SAMPLE), replace=False)]
+        centroids = sample[rng.choice(len(sample), size=lists, replace=False)].copy()
+
+        for _ in range(_KMEANS_ITERATIONS):
+            assignment = np.argmax(sample @ centroids.T, axis=1)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, assignment, sample)
+            norms = np.linalg.norm(sums, axis=1, keepdims=True)
+            # Empty clusters keep their previous centroid
+            centroids = np.where(norms > 0, sums / np.maximum(norms, 1e-12), centroids)
+
+        for start in range(0, self._size, 65536):
+            block = self._matrix[start:start + 65536]
+            self._labels[start:start + len(block)] = np.argmax(block @ centroids.T, axis=1)
+        self._centroids = centroids.astype(np.float32)
+        self._trained_size = self._size
+
+    def search(self, text: str, k: int = 5, min_score: float = 0.0) -> List[Tuple[float, str, Any]]:
+        """
+        Finds the claims most similar to a text.
+
+        Args:
+            text: Query text
+            k: Maximum hits
+            min_score: Minimum cosine similarity
+
+        Returns:
+            List of (score, key, payload), best first
+        """
+        hashes, tf = self._hash(text)
+        with self._lock:
+            self.searches += 1
+            if not self._rows:
+                return []
+            query = self._embed(hashes, tf)
+
+            if self._centroids is None or len(self._rows) <= self.exact_max:
+                candidates = None
+                scores = self._matrix[:self._size] @ query
+            else:
+                probe = np.argpartition(-(self._centroids @ query), min(self.nprobe, len(self._centroids) - 1))[:self.nprobe]
+                candidates = np.flatnonzero(np.isin(self._labels[:self._size], probe))
+                scores = self._matrix[candidates] @ query
+
+            top = min(k, len(scores))
+            if top == 0:
+                return []
+            best = np.argpartition(-scores, top - 1)[:top]
+            best = best[np.argsort(-scores[best])]
+
+            hits = []
+            for position in best:
+                score = float(scores[position])
+                row = int(candidates[position]) if candidates is not None else int(position)
+                if score < min_score or self._keys[row] is None:
+                    continue
+                hits.append((score, self._keys[row], self._payloads[row]))
+            return hits
+
+    def clear(self):
+        with self._lock:
+            self._reset()
+
+    def stats(self) -> dict:
+        return {
+            "entries": len(self._rows),
+            "dims": self.dims,
+            "ivf_lists": 0 if self._centroids is None else len(self._centroids),
+            "memory_mb": round(self._matrix.nbytes / 1e6, 1),
+            "searches": self.searches
+        }
@@ -0,0 +1,282 @@
+"""
+Shared async Gemini client used by all agents.
+
+The agents used to call the synchronous `generate_content` directly inside
+their coroutines, which blocked the whole event loop for the length of a
+Gemini round-trip. Every LLM call now goes through `generate_text`, which
+either awaits the SDK's native async API or runs the blocking call on a
+bounded thread pool. Responses are cached in the shared cache backend
+under the "llm:" namespace, keyed on model, prompt and response schema.
+
+Uncached calls go through the global LLMGovernor (app.utils.llm_governor)
+for rate, token and concurrency limits, and provider 429s are retried
+with backoff instead of surfacing as agent fallbacks.
+
+Token usage is counted per call site label (from the response's
+usage_metadata, or estimated at ~4 characters per token when the model
+does not report it) and exposed through `llm_usage_stats`.
+"""
+
+import asyncio
+import json
+import os
+import random
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+import google.generativeai as genai
+from dotenv import load_dotenv
+from google.api_core.exceptions import ResourceExhausted, TooManyRequests
+
+from app.cache import get_cache, make_key, CACHE_LLM_TTL
+from app.metrics import span, count_cache_lookup, LLM_SECONDS
+from app.utils.llm_governor import LLMGovernor
+from app.utils.singleflight import SingleFlight
+import logging
+
+logger = logging.getLogger(__name__)
+
+load_dotenv()
+
+# Configure Gemini
+genai.configure(api_key=os.getenv("GEMINI_API_KEY"))
+
+GEMINI_MODEL = os.getenv("GEMINI_MODEL", "gemini-3.1-flash-lite")
+
+# "async" uses generate_content_async, "executor" runs generate_content on a thread pool
+LLM_CLIENT_MODE = os.getenv("LLM_CLIENT_MODE", "async")
+LLM_EXECUTOR_WORKERS = int(os.getenv("LLM_EXECUTOR_WORKERS", "8"))
+LLM_CACHE_ENABLED = os.getenv("LLM_CACHE_ENABLED", "true").lower() == "true"
+
+# Global governor limits (see app.utils.llm_governor)
+LLM_GOVERNOR_ENABLED = os.getenv("LLM_GOVERNOR_ENABLED", "true").lower() == "true"
+LLM_RPM = float(os.getenv("LLM_RPM", "300"))
+LLM_TPM = float(os.getenv("LLM_TPM", "1000000"))
+LLM_MAX_CONCURRENCY = int(os.getenv("LLM_MAX_CONCURRENCY", "16"))
+LLM_QUEUE_TIMEOUT = float(os.getenv("LLM_QUEUE_TIMEOUT", "120"))
+LLM_RATE_LIMIT_RETRIES = int(os.getenv("LLM_RATE_LIMIT_RETRIES", "3"))
+# Output tokens charged up front before the real count is known
+LLM_EXPECTED_OUTPUT_TOKENS = int(os.getenv("LLM_EXPECTED_OUTPUT_TOKENS", "500"))
+
+
+class LLMClient:
+    """
+    Non-blocking wrapper around a Gemini `GenerativeModel`.
+
+    Args:
+        model: Object exposing `generate_content` / `generate_content_async`.
+            Defaults to a `genai.GenerativeModel` for GEMINI_MODEL.
+        mode: "async" or "executor"
+        max_workers: Thread pool size used in executor mode
+    """
+
+    def __init__(self, model=None, mode: str = LLM_CLIENT_MODE, max_workers: int = LLM_EXECUTOR_WORKERS):
+        if mode not in ("async", "executor"):
+            raise ValueError(f"Unknown LLM client mode: {mode}")
+
+        self._model = model
+        self.mode = mode
+        self.max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    @property
+    def model(self):
+        if self._model is None:
+            self._model = genai.GenerativeModel(GEMINI_MODEL)
+        return self._model
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix="llm"
+            )
+        return self._executor
+
+    async def generate(self, prompt: str, response_schema: Optional[dict] = None):
+        """
+        Sends a prompt to the model without blocking the event loop.
+
+        Args:
+            prompt: Full prompt text
+            response_schema: Optional JSON schema; the model is then asked
+                for application/json output matching it
+
+        Returns:
+            The SDK response (`.text`, and `.usage_metadata` when reported)
+        """
+        generation_config = None
+        if response_schema is not None:
+            generation_config = genai.GenerationConfig(
+                response_mime_type="application/json",
+                response_schema=response_schema
+            )
+
+        if self.mode == "executor":
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self._get_executor(),
+                lambda: self.model.generate_content(prompt, generation_config=generation_config)
+            )
+        return await self.model.generate_content_async(prompt, generation_config=generation_config)
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+
+_client: Optional[LLMClient] = None
+_governor: Optional[LLMGovernor] = None
+_usage = defaultdict(lambda: defaultdict(int))
+
+# Identical cacheable prompts in flight at the same time share one Gemini call
+_llm_flight = SingleFlight("llm")
+
+
+def get_llm_client() -> LLMClient:
+    """Returns the process-wide LLM client, creating it on first use."""
+    global _client
+    if _client is None:
+        _client = LLMClient()
+    return _client
+
+
+def set_llm_client(client: Optional[LLMClient]) -> None:
+    """
+    Replaces the process-wide LLM client (e.g. with a fake model for benchmarks).
+
+    Passing None resets to the default Gemini client on next use.
+    """
+    global _client
+    if _client is not None and _client is not client:
+        _client.close()
+    _client = client
+
+
+def get_llm_governor() -> LLMGovernor:
+    """Returns the process-wide LLM governor, creating it on first use."""
+    global _governor
+    if _governor is None:
+        _governor = LLMGovernor(
+            rpm=LLM_RPM,
+            tpm=LLM_TPM,
+            max_concurrency=LLM_MAX_CONCURRENCY,
+            max_wait=LLM_QUEUE_TIMEOUT
+        )
+    return _governor
+
+
+def _is_rate_limited(error: Exception) -> bool:
+    return isinstance(error, (ResourceExhausted, TooManyRequests)) or "429" in str(error)
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count for Gemini models (~4 characters per token)."""
+    return (len(text) + 3) // 4 if text else 0
+
+
+def _record_usage(label: str, prompt: str, response, text: str) -> int:
+    """Counts the call's tokens under `label` and returns the total used."""
+    counters = _usage[label]
+    counters["calls"] += 1
+
+    usage = getattr(response, "usage_metadata", None)
+    prompt_tokens = getattr(usage, "prompt_token_count", 0) if usage is not None else 0
+    if prompt_tokens:
+        output_tokens = getattr(usage, "candidates_token_count", 0) or 0
+    else:
+        prompt_tokens = estimate_tokens(prompt)
+        output_tokens = estimate_tokens(text)
+        counters["estimated_calls"] += 1
+
+    counters["prompt_tokens"] += prompt_tokens
+    counters["output_tokens"] += output_tokens
+    return prompt_tokens + output_tokens
+
+
+async def _generate_governed(prompt: str, response_schema: Optional[dict], label: str) -> str:
+    """Sends one call through the governor, retrying provider rate limits."""
+    estimate = estimate_tokens(prompt) + LLM_EXPECTED_OUTPUT_TOKENS
+    governor = get_llm_governor() if LLM_GOVERNOR_ENABLED else None
+
+    for attempt in range(LLM_RATE_LIMIT_RETRIES + 1):
+        if governor is not None:
+            await governor.acquire(estimate)
+        used = 0
+        try:
+            response = await get_llm_client().generate(prompt, response_schema=response_schema)
+            text = response.text.strip()
+            used = _record_usage(label, prompt, response, text)
+            return text
+        except Exception as e:
+            if not _is_rate_limited(e) or attempt == LLM_RATE_LIMIT_RETRIES:
+                raise
+            delay = min(30.0, 2.0 ** attempt) * (1 + random.random() * 0.25)
+            _usage[label]["rate_limited"] += 1
+            logger.warning(f"Gemini rate limited ({label}), retrying in {delay:.1f}s")
+            if governor is not None:
+                governor.backoff(delay)
+            else:
+                await asyncio.sleep(delay)
+        finally:
+            if governor is not None:
+                governor.release(estimate, used)
+
+
+def llm_usage_stats() -> dict:
+    """Gemini calls, cache hits and token counts per call site label, plus totals."""
+    labels = {label: dict(counters) for label, counters in _usage.items()}
+    totals = defaultdict(int)
+    for counters in labels.values():
+        for name, value in counters.items():
+            totals[name] += value
+    return {"labels": labels, "totals": dict(totals)}
+
+
+async def generate_text(
+    prompt: str,
+    use_cache: Optional[bool] = None,
+    response_schema: Optional[dict] = None,
+    label: str = "default"
+) -> str:
+    """
+    Generates a completion for the prompt using the shared client.
+
+    Args:
+        prompt: Full prompt text
+        use_cache: Reuse a cached response for an identical prompt, or
+            the call already in flight for it (defaults to LLM_CACHE_ENABLED)
+        response_schema: Optional JSON schema to constrain the output
+        label: Call site name used for token accounting
+
+    Returns:
+        Stripped response text
+    """
+    if use_cache is None:
+        use_cache = LLM_CACHE_ENABLED
+
+    if response_schema is not None:
+        key = make_key("llm", GEMINI_MODEL, prompt, json.dumps(response_schema, sort_keys=True))
+    else:
+        key = make_key("llm", GEMINI_MODEL, prompt)
+    if use_cache:
+        cached = await get_cache().get(key)
+        count_cache_lookup("llm", cached is not None)
+        if cached is not None:
+            _usage[label]["cache_hits"] += 1
+            return cached
+
+        return await _llm_flight.do(key, lambda: _generate_and_store(key, prompt, response_schema, label))
+
+    with span(f"llm.{label}", LLM_SECONDS, label=label):
+        return await _generate_governed(prompt, response_schema, label)
+
+
+async def _generate_and_store(key: str, prompt: str, response_schema: Optional[dict], label: str) -> str:
+    with span(f"llm.{label}", LLM_SECONDS, label=label):
+        text = await _generate_governed(prompt, response_schema, label)
+    if text:
+        await get_cache().set(key, text, CACHE_LLM_TTL)
+    return text
@@ -0,0 +1,224 @@
+"""
+Global governor for Gemini calls.
+
+Every uncached LLM call waits for the governor before it is sent:
+- a token bucket for requests per minute (LLM_RPM)
+- a token bucket for tokens per minute (LLM_TPM), charged with an estimate
+  up front and corrected with the real usage afterwards
+- at most LLM_MAX_CONCURRENCY calls in flight
+
+Waiting calls are served strictly by lane (interactive API, then Telegram,
+then batch/bulk work), first-come first-served within a lane, so bursts of
+bulk work queue behind user-facing requests instead of competing with
+them. The lane comes from a context variable set at the entry point
+(`llm_lane`), so agents do not need to pass it around.
+
+When the provider still answers 429, `backoff` pauses all dispatching for
+a while; callers retry rather than falling back to an UNVERIFIED verdict.
+"""
+
+import asyncio
+import contextvars
+import heapq
+import itertools
+import time
+from collections import defaultdict, deque
+from contextlib import contextmanager
+from typing import Optional
+
+LANES = ("interactive", "telegram", "batch")
+_LANE_ORDER = {lane: order for order, lane in enumerate(LANES)}
+
+_current_lane = contextvars.ContextVar("llm_lane", default="interactive")
+
+
+@contextmanager
+def llm_lane(lane: str):
+    """Runs the enclosed code (and tasks it creates) in the given priority lane."""
+    if lane not in _LANE_ORDER:
+        raise ValueError(f"Unknown LLM lane: {lane}")
+    token = _current_lane.set(lane)
+    try:
+        yield
+    finally:
+        _current_lane.reset(token)
+
+
+def current_lane() -> str:
+    return _current_lane.get()
+
+
+class GovernorTimeout(Exception):
+    """Raised when a call waited longer than the governor's max_wait."""
+
+
+class TokenBucket:
+    """
+    Continuous-refill token bucket.
+
+    Args:
+        per_minute: Refill rate, also the bucket capacity
+    """
+
+    def __init__(self, per_minute: float):
+        self.capacity = float(per_minute)
+        self.rate = per_minute / 60.0
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+
+    def _refill(self, now: float):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_time(self, amount: float, now: float) -> float:
+        """Seconds until `amount` tokens are available (0 if they are now)."""
+        self._refill(now)
+        # A single request larger than the bucket only needs a full bucket
+        amount = min(amount, self.capacity)
+        if self.tokens >= amount:
+            return 0.0
+        return (amount - self.tokens) / self.rate
+
+    def take(self, amount: float):
+        self.tokens -= amount
+
+    def adjust(self, delta: float):
+        """Corrects an earlier charge (positive delta returns tokens)."""
+        self.tokens = min(self.capacity, self.tokens + delta)
+
+    def drain(self):
+        self.tokens = min(self.tokens, 0.0)
+        self.updated = time.monotonic()
+
+
+class LLMGovernor:
+    """
+    Rate, token and concurrency limits shared by all Gemini calls.
+
+    Args:
+        rpm: Requests per minute
+        tpm: Tokens per minute (prompt + output)
+        max_concurrency: Calls in flight at once
+        max_wait: Seconds a call may wait before GovernorTimeout
+    """
+
+    def __init__(self, rpm: float, tpm: float, max_concurrency: int, max_wait: float = 120.0):
+        self.requests = TokenBucket(rpm)
+        self.tokens = TokenBucket(tpm)
+        self.max_concurrency = max_concurrency
+        self.max_wait = max_wait
+        self.in_flight = 0
+
+        self._waiters = []  # heap of (lane order, sequence, future, estimated tokens)
+        self._sequence = itertools.count()
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._paused_until = 0.0
+
+        self._counters = defaultdict(lambda: defaultdict(float))
+        self._waits = {lane: deque(maxlen=1000) for lane in LANES}
+
+    def _dispatch(self):
+        self._timer = None
+        while self._waiters:
+            _, _, future, estimate = self._waiters[0]
+            if future.done():
+                # Caller gave up (timeout or cancellation)
+                heapq.heappop(self._waiters)
+                continue
+            if self.in_flight >= self.max_concurrency:
+                return
+
+            now = time.monotonic()
+            delay = max(
+                self._paused_until - now,
+                self.requests.wait_time(1, now),
+                self.tokens.wait_time(estimate, now)
+            )
+            if delay > 0:
+                self._timer = asyncio.get_running_loop().call_later(delay, self._dispatch)
+                return
+
+            heapq.heappop(self._waiters)
+            self.requests.take(1)
+            self.tokens.take(estimate)
+            self.in_flight += 1
+            future.set_result(None)
+
+    async def acquire(self, estimated_tokens: int, lane: Optional[str] = None):
+        """
+        Waits for permission to send one call.
+
+        Args:
+            estimated_tokens: Expected prompt + output tokens
+            lane: Priority lane (defaults to the current llm_lane)
+
+        Raises:
+            GovernorTimeout: After max_wait seconds in the queue
+        """
+        lane = lane or current_lane()
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            # Waiters and timers belong to one event loop; start over on a new one
+            self._loop = loop
+            self._waiters = []
+            self._timer = None
+            self.in_flight = 0
+
+        queued_at = time.monotonic()
+        future = loop.create_future()
+        heapq.heappush(self._waiters, (_LANE_ORDER[lane], next(self._sequence), future, estimated_tokens))
+
+        if self._timer is None:
+            self._dispatch()
+        try:
+            await asyncio.wait_for(asyncio.shield(future), timeout=self.max_wait)
+        except (asyncio.TimeoutError, asyncio.CancelledError) as e:
+            if future.done() and not future.cancelled():
+                # Slot was granted just as we gave up: hand it back
+                self.release(estimated_tokens, 0)
+            else:
+                future.cancel()
+            if isinstance(e, asyncio.TimeoutError):
+                self._counters[lane]["timeouts"] += 1
+                raise GovernorTimeout(f"LLM call waited more than {self.max_wait:.0f}s for capacity ({lane})")
+            raise
+
+        waited = time.monotonic() - queued_at
+        self._waits[lane].append(waited)
+        self._counters[lane]["calls"] += 1
+        self._counters[lane]["queue_seconds"] += waited
+
+    def release(self, estimated_tokens: int, actual_tokens: int):
+        """Frees the concurrency slot and corrects the token charge."""
+        self.in_flight -= 1
+        self.tokens.adjust(estimated_tokens - actual_tokens)
+        if self._timer is None:
+            self._dispatch()
+
+    def backoff(self, seconds: float, lane: Optional[str] = None):
+        """Pauses all dispatching after the provider rate-limited us."""
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+        self.requests.drain()
+        self._counters[lane or current_lane()]["rate_limited"] += 1
+
+    def stats(self) -> dict:
+        lanes = {}
+        for lane in LANES:
+            waits = sorted(self._waits[lane])
+            counters = self._counters[lane]
+            lanes[lane] = {
+                "calls": int(counters["calls"]),
+                "rate_limited": int(counters["rate_limited"]),
+                "timeouts": int(counters["timeouts"]),
+                "avg_queue_ms": round(counters["queue_seconds"] / counters["calls"] * 1000, 1) if counters["calls"] else 0.0,
+                "p95_queue_ms": round(waits[min(len(waits) - 1, int(0.95 * len(waits)))] * 1000, 1) if waits else 0.0
+            }
+        return {
+            "in_flight": self.in_flight,
+            "waiting": sum(1 for _, _, future, _ in self._waiters if not future.done()),
+            "max_concurrency": self.max_concurrency,
+            "rpm": self.requests.capacity,
+            "tpm": self.tokens.capacity,
+            "lanes": lanes
+        }
@@ -0,0 +1,189 @@
+"""
+Structured, non-blocking logging for the API, the job workers and the bot.
+
+Tools and agents used to print() straight to stdout, so every "found N
+results" line was a synchronous write on the event loop. Now every module
+logs through `logging.getLogger(__name__)` and `configure_logging()`
+installs, on the root logger:
+
+- a QueueHandler: the calling coroutine only puts the record on a queue,
+  and a QueueListener thread formats and writes it
+- one JSON object per line (LOG_FORMAT=json, the default) with timestamp,
+  level, logger, message, the request ID and any `extra={...}` fields;
+  LOG_FORMAT=text keeps a human-readable line for local runs
+- request-ID correlation: the API middleware (`request_context`), the bot
+  (per update) and the job workers (per job) call `set_request_id`, and the ID rides a ContextVar into every task
+  spawned for that request, so source fetches and Gemini calls log it too
+- sampling of DEBUG records (LOG_DEBUG_SAMPLE_RATE): whether a request's
+  debug records are kept is decided once from its request ID, so a sampled
+  request logs its full trace and the rest log none
+"""
+
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import random
+import sys
+import time
+import uuid
+import zlib
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+LOG_FORMAT = os.getenv("LOG_FORMAT", "json").lower()
+LOG_DEBUG_SAMPLE_RATE = float(os.getenv("LOG_DEBUG_SAMPLE_RATE", "0.1"))
+
+_request_id: ContextVar[Optional[str]] = ContextVar("request_id", default=None)
+
+# LogRecord attributes that are not user-supplied `extra` fields
+_RESERVED = set(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime", "request_id"}
+
+_listener: Optional[logging.handlers.QueueListener] = None
+_handler: Optional[logging.Handler] = None
+
+
+def new_request_id() -> str:
+    return uuid.uuid4().hex[:16]
+
+
+def set_request_id(request_id: Optional[str] = None) -> str:
+    """
+    Sets the request ID for the current context (and tasks created from it).
+
+    Args:
+        request_id: ID to use (e.g. an incoming X-Request-ID); a new one is
+            generated when empty
+
+    Returns:
+        The request ID in effect
+    """
+    request_id = (request_id or "").strip()[:64] or new_request_id()
+    _request_id.set(request_id)
+    return request_id
+
+
+def get_request_id() -> Optional[str]:
+    return _request_id.get()
+
+
+@contextmanager
+def request_context(request_id: Optional[str] = None) -> Iterator[str]:
+    """Like set_request_id, restoring the previous ID when the block exits."""
+    token = _request_id.set(None)
+    try:
+        yield set_request_id(request_id)
+    finally:
+        _request_id.reset(token)
+
+
+class RequestContextFilter(logging.Filter):
+    """Stamps records with the request ID and samples DEBUG records per request."""
+
+    def __init__(self, debug_sample_rate: float = LOG_DEBUG_SAMPLE_RATE):
+        super().__init__()
+        self.debug_sample_rate = debug_sample_rate
+
+    def _keep_debug(self, request_id: Optional[str]) -> bool:
+        if self.debug_sample_rate >= 1:
+            return True
+        if request_id is None:
+            return random.random() < self.debug_sample_rate
+        # Same decision for every record of a request
+        return (zlib.crc32(request_id.encode()) % 10000) < self.debug_sample_rate * 10000
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.request_id = _request_id.get()
+        if record.levelno <= logging.DEBUG:
+            return self._keep_debug(record.request_id)
+        return True
+
+
+class _ContextQueueHandler(logging.handlers.QueueHandler):
+    """
+    Resolves the message on the caller's side (args may not be thread-safe
+    to format later) but keeps the traceback separate for the formatter.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record.message = record.getMessage()
+        if record.exc_info and not record.exc_text:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+        record.msg, record.args, record.exc_info = record.message, None, None
+        return record
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per record, `extra` fields included."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(record.created)) + f".{int(record.msecs):03d}Z",
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        request_id = getattr(record, "request_id", None)
+        if request_id:
+            entry["request_id"] = request_id
+        for key, value in vars(record).items():
+            if key not in _RESERVED and not key.startswith("_"):
+                entry[key] = value
+        if record.exc_text:
+            entry["exception"] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class TextFormatter(logging.Formatter):
+    def __init__(self):
+        super().__init__("%(asctime)s %(levelname)s %(name)s [%(request_id)s] %(message)s")
+
+    def format(self, record: logging.LogRecord) -> str:
+        if getattr(record, "request_id", None) is None:
+            record.request_id = "-"
+        return super().format(record)
+
+
+def configure_logging(level: str = LOG_LEVEL, fmt: str = LOG_FORMAT, stream=None) -> None:
+    """
+    Routes the root logger through a queue to a background writer thread.
+
+    Safe to call more than once (later calls are ignored until
+    shutdown_logging).
+
+    Args:
+        level: Root log level name
+        fmt: "json" or "text"
+        stream: Output stream (stderr by default)
+    """
+    global _listener, _handler
+    if _listener is not None:
+        return
+
+    output = logging.StreamHandler(stream or sys.stderr)
+    output.setFormatter(JsonFormatter() if fmt == "json" else TextFormatter())
+
+    log_queue = queue.SimpleQueue()
+    _handler = _ContextQueueHandler(log_queue)
+    _handler.addFilter(RequestContextFilter())
+
+    root = logging.getLogger()
+    for existing in list(root.handlers):
+        root.removeHandler(existing)
+    root.addHandler(_handler)
+    root.setLevel(level)
+
+    _listener = logging.handlers.QueueListener(log_queue, output, respect_handler_level=True)
+    _listener.start()
+
+
+def shutdown_logging() -> None:
+    """Flushes queued records and stops the writer thread."""
+    global _listener, _handler
+    if _listener is not None:
+        logging.getLogger().removeHandler(_handler)
+        _listener.stop()
+        _listener = _handler = None
@@ -0,0 +1,250 @@
+"""
+Token-budgeted prompt assembly for the Gemini agents.
+
+The analysis and explanation prompts used to be f-strings with every title,
+snippet and finding pasted in whole, so prompt size (and with it Gemini
+latency and cost) depended on how verbose the search results happened to
+be. PromptBuilder assembles a prompt as:
+
+1. a static instruction prefix: a module-level constant whose token count
+   is computed once, placed first so consecutive calls share an identical
+   prefix (which Gemini's implicit context caching can reuse)
+2. required sections (claim, verdict, analysis), never truncated
+3. item sections (search results, fact-checks, findings) that share what
+   is left of the budget: items are kept in relevance order while the
+   budget allows, and the remaining tokens are split between their
+   snippets in proportion to relevance ("evidence_score" from
+   rank_evidence when present), trimmed at word boundaries
+
+Token counts use the same ~4 characters per token estimate as the LLM
+client. Built prompt sizes are recorded per call site label and exposed
+through `prompt_stats`.
+"""
+
+import os
+from collections import defaultdict, deque
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import List, Optional
+
+from app.utils.llm_client import estimate_tokens
+
+PROMPT_TOKEN_BUDGET = int(os.getenv("PROMPT_TOKEN_BUDGET", "1500"))
+PROMPT_SNIPPET_TOKENS = int(os.getenv("PROMPT_SNIPPET_TOKENS", "100"))
+
+# Items are only added while each can keep at least this many snippet tokens
+_MIN_SNIPPET_TOKENS = 15
+
+_sizes = defaultdict(lambda: deque(maxlen=500))
+_stats = defaultdict(lambda: defaultdict(int))
+
+
+@lru_cache(maxsize=128)
+def static_tokens(text: str) -> int:
+    """Token estimate of a static instruction block (computed once per text)."""
+    return estimate_tokens(text)
+
+
+def truncate_to_tokens(text: str, tokens: int) -> str:
+    """
+    Shortens text to about `tokens` tokens, cutting at a word boundary.
+
+    Args:
+        text: Text to shorten
+        tokens: Token allowance
+
+    Returns:
+        The text unchanged if it fits, otherwise its longest word-aligned
+        prefix that fits followed by "..."
+    """
+    if estimate_tokens(text) <= tokens:
+        return text
+    limit = max(0, tokens * 4 - 3)
+    cut = text[:limit]
+    if " " in cut and limit < len(text) and not text[limit].isspace():
+        cut = cut.rsplit(" ", 1)[0]
+    return cut.rstrip(" ,.;:") + "..."
+
+
+@dataclass
+class PromptItem:
+    """
+    One entry of an item section.
+
+    Args:
+        text: Fixed part (title, URL, rating); kept whole
+        snippet: Part trimmed to the item's share of the budget
+        weight: Relevance weight for the snippet share
+    """
+
+    text: str
+    snippet: str = ""
+    weight: float = 1.0
+
+
+def _percentile(samples, fraction: float) -> int:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+class PromptBuilder:
+    """
+    Builds one prompt within a token budget.
+
+    Args:
+        label: Call site name (matches the generate_text label)
+        instructions: Static instruction prefix
+        budget: Hard token budget for the whole prompt (PROMPT_TOKEN_BUDGET
+            by default); the instructions and required sections always go
+            in, item sections get what is left
+        snippet_tokens: Cap on any single snippet
+    """
+
+    def __init__(
+        self,
+        label: str,
+        instructions: str,
+        budget: Optional[int] = None,
+        snippet_tokens: int = PROMPT_SNIPPET_TOKENS
+    ):
+        self.label = label
+        self.instructions = instructions
+        self.budget = PROMPT_TOKEN_BUDGET if budget is None else budget
+        self.snippet_tokens = snippet_tokens
+        self._parts = []  # ("text", text) or ("items", header, items, separator, max_tokens)
+
+    def add(self, text: str) -> "PromptBuilder":
+        """Appends a required section."""
+        self._parts.append(("text", text))
+        return self
+
+    def add_items(
+        self,
+        header: str,
+        items: List[PromptItem],
+        max_items: int = 5,
+        separator: str = "\n",
+        max_tokens: Optional[int] = None
+    ) -> "PromptBuilder":
+        """
+        Appends a section of items that is trimmed to fit the budget.
+
+        Args:
+            header: Line introducing the section (omitted when no item fits)
+            items: Items, most relevant first
+            max_items: Most items ever included
+            separator: Joins the rendered items
+            max_tokens: Cap on this section, so one section cannot take the
+                whole remaining budget (e.g. one claim of a batch prompt)
+        """
+        self._parts.append(("items", header, items[:max_items], separator, max_tokens))
+        return self
+
+    def _fit_items(self, items: List[PromptItem], available: int, separator: str) -> List[str]:
+        """Keeps items while they fit, then splits the remaining tokens between their snippets."""
+        kept, used = [], 0
+        for item in items:
+            cost = estimate_tokens(item.text + separator) + (_MIN_SNIPPET_TOKENS if item.snippet else 0)
+            if used + cost > available:
+                break
+            kept.append(item)
+            used += cost
+
+        # Water-filling: snippets that need less than their share give the rest back
+        spare = available - used
+        allowance = {id(item): (_MIN_SNIPPET_TOKENS if item.snippet else 0) for item in kept}
+        wanting = [item for item in kept if item.snippet]
+        while wanting and spare > 0:
+            total_weight = sum(max(item.weight, 0.01) for item in wanting) or 1.0
+            still_wanting = []
+            handed_out = 0
+            for item in wanting:
+                need = min(self.snippet_tokens, estimate_tokens(item.snippet)) - allowance[id(item)]
+                share = int(spare * max(item.weight, 0.01) / total_weight)
+                give = min(need, share)
+                allowance[id(item)] += give
+                handed_out += give
+                if give < need:
+                    still_wanting.append(item)
+            spare -= handed_out
+            if handed_out == 0:
+                break
+            wanting = still_wanting
+
+        rendered = []
+        for item in kept:
+            if not item.snippet:
+                rendered.append(item.text.replace("{snippet}", ""))
+                continue
+            snippet = truncate_to_tokens(item.snippet, allowance[id(item)])
+            if snippet != item.snippet:
+                _stats[self.label]["snippets_truncated"] += 1
+            rendered.append(item.text.replace("{snippet}", snippet))
+        _stats[self.label]["items_dropped"] += len(items) - len(kept)
+        return rendered
+
+    def build(self) -> str:
+        """Assembles the prompt and records its size under the label."""
+        required = static_tokens(self.instructions) + sum(
+            estimate_tokens(part[1]) for part in self._parts if part[0] == "text"
+        )
+        available = self.budget - required
+
+        sections = [self.instructions]
+        for part in self._parts:
+            if part[0] == "text":
+                sections.append(part[1])
+                continue
+            _, header, items, separator, max_tokens = part
+            allowance = available if max_tokens is None else min(available, max_tokens)
+            rendered = self._fit_items(items, max(0, allowance - estimate_tokens(header)), separator)
+            if rendered:
+                section = f"{header}\n{separator.join(rendered)}"
+                available -= estimate_tokens(section)
+                sections.append(section)
+
+        prompt = "\n\n".join(section for section in sections if section)
+        tokens = estimate_tokens(prompt)
+        counters = _stats[self.label]
+        counters["builds"] += 1
+        counters["tokens"] += tokens
+        if tokens > self.budget:
+            counters["over_budget"] += 1
+        _sizes[self.label].append(tokens)
+        return prompt
+
+
+def source_items(search_results: list) -> List[PromptItem]:
+    """Search results as prompt items ("Source N" blocks, snippet trimmed by relevance)."""
+    return [
+        PromptItem(
+            text=(
+                f"Source {idx}:\n"
+                f"Title: {result.get('title', 'N/A')}\n"
+                f"Snippet: {{snippet}}\n"
+                f"URL: {result.get('url', 'N/A')}\n"
+            ),
+            snippet=result.get('snippet') or 'N/A',
+            weight=float(result.get("evidence_score", 1.0))
+        )
+        for idx, result in enumerate(search_results, 1)
+    ]
+
+
+def prompt_stats() -> dict:
+    """Prompt sizes per call site label (estimated tokens)."""
+    labels = {}
+    for label, counters in _stats.items():
+        sizes = _sizes[label]
+        builds = counters["builds"]
+        labels[label] = {
+            "builds": builds,
+            "avg_tokens": round(counters["tokens"] / builds) if builds else 0,
+            "p50_tokens": _percentile(sizes, 0.5) if sizes else None,
+            "p95_tokens": _percentile(sizes, 0.95) if sizes else None,
+            "max_tokens": max(sizes) if sizes else None,
+            "snippets_truncated": counters["snippets_truncated"],
+            "items_dropped": counters["items_dropped"],
+            "over_budget": counters["over_budget"]
+        }
+    return {"budget": PROMPT_TOKEN_BUDGET, "snippet_tokens": PROMPT_SNIPPET_TOKENS, "labels": labels}
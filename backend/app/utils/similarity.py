@@ -1,6 +1,10 @@
+from collections import Counter
 from difflib import SequenceMatcher
+from typing import List, Optional, Sequence, Tuple, Union
 import re
 
+import numpy as np
+
 def calculate_similarity(text1: str, text2: str) -> float:
     """
     Calculates similarity between two texts using SequenceMatcher.
@@ -91,3 +95,260 @@ def hybrid_similarity(text1: str, text2: str) -> float:
     
     # Weighted average (70% sequence, 30% Jaccard)
     return (seq_sim * 0.7) + (jaccard_sim * 0.3)
+
+def number_tokens(text: str) -> frozenset:
+    """
+    Digit sequences in a text.
+    
+    Claims that differ only in a number ("5 lakh" vs "50 lakh") score as
+    near-duplicates on text similarity, so matchers also compare these.
+    
+    Args:
+        text: Text to scan
+    
+    Returns:
+        Set of digit strings
+    """
+    return frozenset(re.findall(r"\d+", text))
+
+
+# Batch scoring.
+#
+# The functions below score one text against many (or many against many)
+# without a Python-level comparison per pair. Every text is tokenized once
+# into the same word sets jaccard_similarity uses (or character n-gram
+# counts for cosine); intersections and dot products then come from a
+# matrix product or an inverted index, and the union / norm terms from
+# per-text sizes, so the scores are exact rather than approximations.
+
+def word_sets(texts: Sequence[str]) -> List[frozenset]:
+    """Word sets as used by jaccard_similarity, one per text."""
+    return [frozenset(normalize_for_similarity(text).split()) if text else frozenset() for text in texts]
+
+
+def shingle_counts(texts: Sequence[str], n: int = 3) -> List[Counter]:
+    """Character n-gram counts of each normalized text."""
+    counts = []
+    for text in texts:
+        normalized = normalize_for_similarity(text) if text else ""
+        counts.append(Counter([normalized[i:i + n] for i in range(len(normalized) - n + 1)]))
+    return counts
+
+
+def _vocabulary(rows: Sequence) -> dict:
+    vocabulary = {}
+    for tokens in rows:
+        for token in tokens:
+            vocabulary.setdefault(token, len(vocabulary))
+    return vocabulary
+
+
+def _incidence(rows: Sequence, vocabulary: dict, weighted: bool) -> np.ndarray:
+    """Rows x vocabulary matrix (1/0, or counts when weighted); tokens outside the vocabulary are dropped."""
+    matrix = np.zeros((len(rows), len(vocabulary)), dtype=np.float32)
+    for row, tokens in enumerate(rows):
+        for token in tokens:
+            column = vocabulary.get(token)
+            if column is not None:
+                matrix[row, column] = tokens[token] if weighted else 1.0
+    return matrix
+
+
+def _jaccard_scores(intersection: np.ndarray, query_sizes: np.ndarray, candidate_sizes: np.ndarray) -> np.ndarray:
+    union = query_sizes[:, None] + candidate_sizes[None, :] - intersection
+    scores = np.divide(intersection, union, out=np.zeros_like(intersection), where=union > 0)
+    # jaccard_similarity scores an empty side as 0
+    scores[query_sizes == 0, :] = 0.0
+    scores[:, candidate_sizes == 0] = 0.0
+    return scores
+
+
+def _norms(rows: List[Counter]) -> np.ndarray:
+    return np.sqrt(np.array([sum(c * c for c in counts.values()) for counts in rows], dtype=np.float32))
+
+
+def jaccard_matrix(queries: Sequence[str], candidates: Sequence[str]) -> np.ndarray:
+    """
+    Word-level Jaccard similarity of every query against every candidate.
+
+    Args:
+        queries: m texts
+        candidates: n texts
+
+    Returns:
+        m x n float32 array (same values as jaccard_similarity per pair)
+    """
+    query_sets, candidate_sets = word_sets(queries), word_sets(candidates)
+    # Only words some query contains can intersect
+    vocabulary = _vocabulary(query_sets)
+    intersection = _incidence(query_sets, vocabulary, False) @ _incidence(candidate_sets, vocabulary, False).T
+    query_sizes = np.array([len(words) for words in query_sets], dtype=np.float32)
+    candidate_sizes = np.array([len(words) for words in candidate_sets], dtype=np.float32)
+    return _jaccard_scores(intersection, query_sizes, candidate_sizes)
+
+
+def cosine_matrix(queries: Sequence[str], candidates: Sequence[str], n: int = 3) -> np.ndarray:
+    """
+    Cosine similarity of character n-gram counts, every query against every candidate.
+
+    Tolerates typos and word-form changes that word Jaccard misses.
+
+    Args:
+        queries: m texts
+        candidates: n texts
+        n: Shingle length
+
+    Returns:
+        m x n float32 array in [0, 1]
+    """
+    query_counts, candidate_counts = shingle_counts(queries, n), shingle_counts(candidates, n)
+    vocabulary = _vocabulary(query_counts)
+    dot = _incidence(query_counts, vocabulary, True) @ _incidence(candidate_counts, vocabulary, True).T
+    norms = _norms(query_counts)[:, None] * _norms(candidate_counts)[None, :]
+    return np.divide(dot, norms, out=np.zeros_like(dot), where=norms > 0)
+
+
+class SimilarityCorpus:
+    """
+    Candidate texts tokenized once for repeated one-vs-many scoring.
+
+    Word sets and n-gram counts are kept as inverted lists (token ->
+    candidate ids, counts), so scoring a query costs one bincount over the
+    lists of the query's own tokens instead of a pass over every candidate.
+
+    Args:
+        texts: Candidate texts
+        n: Shingle length for cosine scores
+    """
+
+    def __init__(self, texts: Sequence[str], n: int = 3):
+        self.texts = list(texts)
+        self.n = n
+        sets = word_sets(self.texts)
+        counts = shingle_counts(self.texts, n)
+        self._word_sizes = np.array([len(words) for words in sets], dtype=np.float32)
+        self._shingle_norms = _norms(counts)
+        self._words = self._postings(sets, False)
+        self._shingles = self._postings(counts, True)
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+    @staticmethod
+    def _postings(rows: Sequence, weighted: bool) -> dict:
+        lists = {}
+        for row, tokens in enumerate(rows):
+            for token in tokens:
+                lists.setdefault(token, []).append((row, tokens[token] if weighted else 1))
+        return {
+            token: (np.array([row for row, _ in entries], dtype=np.int64), np.array([value for _, value in entries], dtype=np.float32))
+            for token, entries in lists.items()
+        }
+
+    def _accumulate(self, postings: dict, tokens: dict) -> np.ndarray:
+        rows, weights = [], []
+        for token, weight in tokens.items():
+            entry = postings.get(token)
+            if entry is not None:
+                rows.append(entry[0])
+                weights.append(entry[1] * weight)
+        if not rows:
+            return np.zeros(len(self.texts), dtype=np.float32)
+        return np.bincount(np.concatenate(rows), weights=np.concatenate(weights), minlength=len(self.texts)).astype(np.float32)
+
+    def jaccard(self, query: str) -> np.ndarray:
+        """Word-level Jaccard similarity of a query against every candidate."""
+        words = word_sets([query])[0]
+        intersection = self._accumulate(self._words, dict.fromkeys(words, 1))
+        return _jaccard_scores(intersection[None, :], np.array([len(words)], dtype=np.float32), self._word_sizes)[0]
+
+    def coverage(self, query: str) -> np.ndarray:
+        """Fraction of the query's words found in each candidate (unlike Jaccard, not diluted by long candidates)."""
+        words = word_sets([query])[0]
+        if not words:
+            return np.zeros(len(self.texts), dtype=np.float32)
+        return self._accumulate(self._words, dict.fromkeys(words, 1)) / len(words)
+
+    def cosine(self, query: str) -> np.ndarray:
+        """Character n-gram cosine similarity of a query against every candidate."""
+        counts = shingle_counts([query], self.n)[0]
+        dot = self._accumulate(self._shingles, counts)
+        norms = _norms([counts])[0] * self._shingle_norms
+        return np.divide(dot, norms, out=np.zeros_like(dot), where=norms > 0)
+
+
+def jaccard_one_to_many(query: str, candidates: Union[Sequence[str], SimilarityCorpus]) -> np.ndarray:
+    """Word-level Jaccard similarity of one text against each candidate."""
+    if isinstance(candidates, SimilarityCorpus):
+        return candidates.jaccard(query)
+    return jaccard_matrix([query], candidates)[0]
+
+
+def cosine_one_to_many(query: str, candidates: Union[Sequence[str], SimilarityCorpus], n: int = 3) -> np.ndarray:
+    """Character n-gram cosine similarity of one text against each candidate."""
+    if isinstance(candidates, SimilarityCorpus):
+        return candidates.cosine(query)
+    return cosine_matrix([query], candidates, n)[0]
+
+
+def top_k(scores: np.ndarray, k: int, min_score: float = 0.0) -> List[Tuple[int, float]]:
+    """
+    Best k entries of a score vector.
+
+    Returns:
+        List of (index, score), best first, scores >= min_score only
+    """
+    k = min(k, len(scores))
+    if k <= 0:
+        return []
+    best = np.argpartition(-scores, k - 1)[:k]
+    best = best[np.argsort(-scores[best], kind="stable")]
+    return [(int(i), float(scores[i])) for i in best if scores[i] >= min_score]
+
+
+def most_similar(
+    query: str,
+    candidates: Union[Sequence[str], SimilarityCorpus],
+    k: int = 5,
+    metric: str = "hybrid",
+    min_score: float = 0.0,
+    shortlist: Optional[int] = None
+) -> List[Tuple[int, float]]:
+    """
+    Top-k candidates for a query.
+
+    Args:
+        query: Text to match
+        candidates: Texts to search, or a SimilarityCorpus built from them
+            when the same candidates are searched repeatedly
+        k: Maximum results
+        metric: "jaccard", "cosine" (character trigrams) or "hybrid"
+        min_score: Minimum score to return
+        shortlist: For "hybrid", how many candidates to score with
+            hybrid_similarity (None: max(4k, 20); 0: every eligible one)
+
+    Returns:
+        List of (candidate index, score), best first. For "hybrid", only
+        candidates with word Jaccard >= (min_score - 0.7) / 0.3 are
+        eligible, which any candidate scoring min_score must reach (a
+        lossless cut). By default only a shortlist of them, the best by
+        n-gram cosine, is then scored with hybrid_similarity
+        (SequenceMatcher). That is an approximation: a candidate that
+        ranks low on cosine but high on hybrid can be missed. Pass
+        shortlist=0 for the exact top k.
+    """
+    if metric == "jaccard":
+        return top_k(jaccard_one_to_many(query, candidates), k, min_score)
+    if metric == "cosine":
+        return top_k(cosine_one_to_many(query, candidates), k, min_score)
+    if metric != "hybrid":
+        raise ValueError(f"Unknown similarity metric: {metric}")
+
+    corpus = candidates if isinstance(candidates, SimilarityCorpus) else SimilarityCorpus(candidates)
+    eligible = corpus.jaccard(query) >= (min_score - 0.7) / 0.3 - 1e-6
+    # Rank the eligible candidates by shingle cosine, then score a shortlist with hybrid_similarity
+    cosine = np.where(eligible, corpus.cosine(query), -1.0)
+    size = len(cosine) if shortlist == 0 else (shortlist or max(4 * k, 20))
+    candidates_scored = [i for i, score in top_k(cosine, size) if score >= 0]
+    scored = sorted(((hybrid_similarity(query, corpus.texts[i]), i) for i in candidates_scored), key=lambda pair: (-pair[0], pair[1]))
+    return [(i, score) for score, i in scored[:k] if score >= min_score]
@@ -0,0 +1,121 @@
+"""
+In-flight coalescing of identical concurrent calls ("singleflight").
+
+The first caller for a key starts the work in a task; callers arriving
+while it runs await the same task instead of repeating the work, and all
+of them get its result or its exception. The caches only help once a
+result is stored, so a burst of the same viral claim would otherwise run
+every source and Gemini call once per request until the first finished.
+
+Cancellation is per waiter: a caller that goes away (client disconnect,
+speculative fetch discarded) stops waiting, and the shared task is
+cancelled only when no caller is left waiting for it. The key is released
+as soon as the task finishes, so nothing is cached here; the shared result
+is handed to every waiter as is and must be treated as read-only.
+
+Spans finished inside the shared task are recorded in the first caller's
+request breakdown; the others record how long they waited as
+"coalesced.<name>".
+"""
+
+import asyncio
+import os
+import time
+from collections import defaultdict
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+from app.metrics import record_timing
+
+SINGLEFLIGHT_ENABLED = os.getenv("SINGLEFLIGHT_ENABLED", "true").lower() == "true"
+
+_flights: Dict[str, "SingleFlight"] = {}
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls that share a key.
+
+    Args:
+        name: Name used in the timing breakdown and in /api/stats
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._tasks: Dict[Hashable, asyncio.Task] = {}
+        self._waiters: Dict[Hashable, int] = {}
+        self._stats = defaultdict(int)
+        _flights[name] = self
+
+    def running(self, key: Hashable) -> bool:
+        """Whether a call for the key is in flight (a call now would join it)."""
+        task = self._tasks.get(key)
+        return task is not None and not task.done()
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Runs fn() once for all concurrent callers with the same key.
+
+        Args:
+            key: Identity of the call (e.g. a normalized claim or a cache key)
+            fn: Coroutine function started when no call for the key is in flight
+
+        Returns:
+            fn()'s result, shared with every caller that joined
+
+        Raises:
+            Whatever fn() raised, in every waiting caller
+        """
+        if not SINGLEFLIGHT_ENABLED:
+            return await fn()
+
+        task = self._tasks.get(key)
+        leader = task is None or task.done()
+        if leader:
+            task = asyncio.create_task(fn())
+            self._tasks[key] = task
+            self._waiters[key] = 0
+            task.add_done_callback(lambda t: self._release(key, t))
+            self._stats["leaders"] += 1
+        else:
+            self._stats["joined"] += 1
+
+        self._waiters[key] += 1
+        started = time.perf_counter()
+        try:
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            if not task.done():
+                self._stats["cancelled"] += 1
+                if self._tasks.get(key) is task:
+                    self._waiters[key] -= 1
+                    if self._waiters[key] == 0:
+                        # Nobody is left waiting: release the key first so a
+                        # new caller starts afresh rather than joining a dying task
+                        self._release(key, task)
+                        task.cancel()
+                        self._stats["abandoned"] += 1
+            raise
+        finally:
+            if not leader:
+                record_timing(f"coalesced.{self.name}", time.perf_counter() - started)
+
+    def _release(self, key: Hashable, task: asyncio.Task):
+        if self._tasks.get(key) is task:
+            del self._tasks[key]
+            del self._waiters[key]
+
+    def stats(self) -> dict:
+        """Calls started, calls that joined one in flight, waiters cancelled and calls abandoned."""
+        started, joined = self._stats["leaders"], self._stats["joined"]
+        return {
+            "started": started,
+            "joined": joined,
+            "cancelled_waiters": self._stats["cancelled"],
+            "abandoned": self._stats["abandoned"],
+            "inflight": len(self._tasks),
+            "coalesced_rate": round(joined / (started + joined), 3) if started + joined else 0.0
+        }
+
+
+def singleflight_stats() -> dict:
+    return {"enabled": SINGLEFLIGHT_ENABLED, "flights": {name: flight.stats() for name, flight in _flights.items()}}
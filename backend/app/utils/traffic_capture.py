@@ -0,0 +1,190 @@
+"""
+Opt-in capture of live verification traffic for replay.
+
+With TRAFFIC_CAPTURE_ENABLED, /api/verify, /api/verify/stream and the
+Telegram handler append one JSON line per request to TRAFFIC_CAPTURE_PATH:
+
+    {"ts": "...Z", "t": 1718000000.123, "channel": "api", "claim": "...",
+     "claim_key": "9f2c...", "status": 200, "cache_hit": false,
+     "verdict": "FALSE", "latency_ms": 5321.4, "timings": {...}}
+
+Claims are anonymized before they are stored: e-mail addresses, phone and
+ID numbers (10+ digits), @handles and URL paths are masked, so what is kept
+is the claim's shape and wording rather than who sent it. No user, chat or
+request identifiers are written. claim_key is a hash of the normalized
+anonymized claim, so bursts of duplicate claims can be counted without
+comparing texts.
+
+Lines are written by a background thread, so capture never blocks a
+request on disk I/O. benchmarks/replay.py re-drives a captured file against
+a running instance.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import queue
+import random
+import re
+import threading
+import time
+from typing import Optional
+
+from app.utils.similarity import normalize_for_similarity
+
+logger = logging.getLogger(__name__)
+
+TRAFFIC_CAPTURE_ENABLED = os.getenv("TRAFFIC_CAPTURE_ENABLED", "false").lower() == "true"
+TRAFFIC_CAPTURE_PATH = os.getenv("TRAFFIC_CAPTURE_PATH", "traffic_capture.jsonl")
+TRAFFIC_CAPTURE_SAMPLE_RATE = float(os.getenv("TRAFFIC_CAPTURE_SAMPLE_RATE", "1.0"))
+
+# Order matters: URLs and e-mails before the bare number and handle rules
+_ANONYMIZERS = (
+    (re.compile(r"https?://([^/\s]+)\S*", re.IGNORECASE), lambda m: f"<URL:{m.group(1).lower()}>"),
+    (re.compile(r"\b[\w.+-]+@[\w-]+\.[\w.-]+\b"), lambda m: "<EMAIL>"),
+    (re.compile(r"(?<!\w)\+?\d(?:[\s-]?\d){9,}(?!\w)"), lambda m: "<NUMBER>"),
+    (re.compile(r"(?<!\w)@\w{2,}"), lambda m: "<HANDLE>"),
+)
+
+
+def anonymize(text: str) -> str:
+    """
+    Masks personal data in a claim.
+
+    Args:
+        text: Raw user input
+
+    Returns:
+        The text with URLs reduced to their host, and e-mail addresses,
+        numbers of 10 or more digits (phones, Aadhaar, accounts) and
+        @handles replaced with placeholders; shorter numbers ("2000 rupee
+        notes", "5 lakh") are kept since they change what a claim says
+    """
+    for pattern, replacement in _ANONYMIZERS:
+        text = pattern.sub(replacement, text)
+    return text
+
+
+def claim_key(text: str) -> str:
+    return hashlib.sha256(normalize_for_similarity(text).encode()).hexdigest()[:16]
+
+
+class TrafficRecorder:
+    """
+    Appends captured requests to a JSONL file from a writer thread.
+
+    Args:
+        path: File to append to
+        sample_rate: Share of requests recorded
+    """
+
+    def __init__(self, path: str = TRAFFIC_CAPTURE_PATH, sample_rate: float = TRAFFIC_CAPTURE_SAMPLE_RATE):
+        self.path = path
+        self.sample_rate = sample_rate
+        self.recorded = 0
+        self.dropped = 0
+        self._queue = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._write, name="traffic-capture", daemon=True)
+        self._thread.start()
+
+    def record(
+        self,
+        channel: str,
+        claim: str,
+        status: int,
+        timings: Optional[dict] = None,
+        result: Optional[dict] = None
+    ):
+        """
+        Queues one request for writing.
+
+        Args:
+            channel: "api", "api_stream" or "telegram"
+            claim: Raw user input (anonymized here)
+            status: HTTP-style status of the outcome
+            timings: Stage timings in milliseconds (collect_timings, with
+                "total" spanning the whole request)
+            result: run_pipeline result, when the request succeeded
+        """
+        if self.sample_rate < 1 and random.random() >= self.sample_rate:
+            return
+        timings = timings or {}
+        # Arrival time: replay schedules requests by when they came in, not when they finished
+        arrived = time.time() - timings.get("total", 0.0) / 1000
+        anonymized = anonymize(claim or "")
+        entry = {
+            "ts": time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(arrived)) + f".{int(arrived % 1 * 1000):03d}Z",
+            "t": round(arrived, 3),
+            "channel": channel,
+            "claim": anonymized,
+            "claim_key": claim_key(anonymized),
+            "status": status,
+            "cache_hit": result.get("cache_hit") if result else None,
+            "verdict": result["response"].verdict.value if result else None,
+            "latency_ms": timings.get("total"),
+            "timings": timings
+        }
+        self._queue.put(json.dumps(entry, ensure_ascii=False))
+
+    def _write(self):
+        while True:
+            line = self._queue.get()
+            if line is None:
+                return
+            lines = [line]
+            # Drain what queued up meanwhile into one write
+            while True:
+                try:
+                    line = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if line is None:
+                    self._append(lines)
+                    return
+                lines.append(line)
+            self._append(lines)
+
+    def _append(self, lines: list):
+        try:
+            with open(self.path, "a", encoding="utf-8") as handle:
+                handle.write("\n".join(lines) + "\n")
+            self.recorded += len(lines)
+        except OSError as e:
+            self.dropped += len(lines)
+            logger.warning(f"Traffic capture write failed ({self.path}): {e}")
+
+    def close(self):
+        """Writes what is queued and stops the writer thread."""
+        self._queue.put(None)
+        self._thread.join(10)
+
+
+_recorder: Optional[TrafficRecorder] = None
+
+
+def get_traffic_recorder() -> Optional[TrafficRecorder]:
+    """Returns the process-wide recorder (None unless TRAFFIC_CAPTURE_ENABLED)."""
+    global _recorder
+    if _recorder is None and TRAFFIC_CAPTURE_ENABLED:
+        _recorder = TrafficRecorder()
+    return _recorder
+
+
+def set_traffic_recorder(recorder: Optional[TrafficRecorder]) -> None:
+    """Replaces the process-wide recorder (e.g. to capture to another file)."""
+    global _recorder
+    if _recorder is not None and _recorder is not recorder:
+        _recorder.close()
+    _recorder = recorder
+
+
+def close_traffic_recorder() -> None:
+    set_traffic_recorder(None)
+
+
+def capture_request(channel: str, claim: str, status: int, timings: Optional[dict] = None, result: Optional[dict] = None):
+    """Records a request when capture is enabled (see TrafficRecorder.record)."""
+    recorder = get_traffic_recorder()
+    if recorder is not None:
+        recorder.record(channel, claim, status, timings, result)
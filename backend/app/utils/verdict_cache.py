@@ -0,0 +1,206 @@
+"""
+Verdict cache for repeated and lightly reworded claims.
+
+Entries are keyed on the normalized extracted claim. A lookup that misses the
+exact key falls back to a near-duplicate search: the claim vector index
+(app.utils.claim_index) proposes the closest cached claims, and the best
+one is accepted if hybrid_similarity clears the threshold and both claims
+mention the same numbers. Viral claims that are reworded slightly still
+reuse the earlier verdict, without a pairwise scan of every entry.
+
+The in-process LRU is the first level. Entries are also written to the
+shared cache backend (app.cache) under "verdict:", so other workers and the
+Telegram bot get exact-key hits after a restart or scale-out. Shared entries
+carry their wall-clock expiry, so a copy pulled into another worker expires
+when the original does instead of getting a fresh TTL.
+"""
+
+import heapq
+import os
+import time
+from collections import OrderedDict
+from typing import Optional
+
+from app.cache import get_cache, make_key, CACHE_VERDICT_TTL
+from app.utils.preprocess import normalize_text
+from app.utils.claim_index import ClaimVectorIndex
+from app.utils.similarity import hybrid_similarity, number_tokens
+
+VERDICT_CACHE_ENABLED = os.getenv("VERDICT_CACHE_ENABLED", "true").lower() == "true"
+VERDICT_CACHE_TTL = float(os.getenv("VERDICT_CACHE_TTL", "3600"))
+VERDICT_CACHE_MAX_ENTRIES = int(os.getenv("VERDICT_CACHE_MAX_ENTRIES", "5000"))
+VERDICT_CACHE_SIMILARITY = float(os.getenv("VERDICT_CACHE_SIMILARITY", "0.9"))
+
+# Nearest cached claims re-scored with hybrid_similarity on a near-duplicate lookup
+_NEAR_DUPLICATE_CANDIDATES = 5
+
+
+class VerdictCache:
+    """
+    In-process LRU cache with TTL and near-duplicate matching.
+
+    Args:
+        max_entries: Maximum number of claims kept (least recently used evicted first)
+        ttl_seconds: How long an entry stays valid
+        similarity_threshold: Minimum hybrid_similarity for a near-duplicate hit
+    """
+
+    def __init__(
+        self,
+        max_entries: int = VERDICT_CACHE_MAX_ENTRIES,
+        ttl_seconds: float = VERDICT_CACHE_TTL,
+        similarity_threshold: float = VERDICT_CACHE_SIMILARITY
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.similarity_threshold = similarity_threshold
+        self._entries = OrderedDict()  # key -> (expires_at, value, compute_seconds)
+        # (expires_at, key) min-heap; the dict is in LRU order, not expiry order
+        self._expiries = []
+        self._vectors = ClaimVectorIndex()
+
+        self.exact_hits = 0
+        self.near_hits = 0
+        self.shared_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.latency_saved_seconds = 0.0
+
+    @staticmethod
+    def make_key(claim: str) -> str:
+        return normalize_text(claim)
+
+    def _purge_expired(self, now: float):
+        # Only the entries that have expired are looked at, not every entry
+        while self._expiries and self._expiries[0][0] <= now:
+            expires_at, key = heapq.heappop(self._expiries)
+            entry = self._entries.get(key)
+            # Skip heap items left behind by a later store or an eviction
+            if entry is not None and entry[0] == expires_at:
+                del self._entries[key]
+                self._vectors.remove(key)
+
+    def _find_near_duplicate(self, key: str) -> Optional[str]:
+        numbers = number_tokens(key)
+        best_key, best_score = None, 0.0
+        for _, candidate, _ in self._vectors.search(key, k=_NEAR_DUPLICATE_CANDIDATES):
+            if candidate not in self._entries or number_tokens(candidate) != numbers:
+                continue
+            score = hybrid_similarity(key, candidate)
+            if score > best_score:
+                best_key, best_score = candidate, score
+
+        if best_score >= self.similarity_threshold:
+            return best_key
+        return None
+
+    def _store_local(self, key: str, value: dict, compute_seconds: float, ttl: Optional[float] = None):
+        if key not in self._entries:
+            self._vectors.add(key, key)
+        expires_at = time.monotonic() + (self.ttl_seconds if ttl is None else ttl)
+        self._entries[key] = (expires_at, value, compute_seconds)
+        self._entries.move_to_end(key)
+        heapq.heappush(self._expiries, (expires_at, key))
+        if len(self._expiries) > 2 * self.max_entries:
+            # Re-stored and evicted keys leave stale heap items behind; rebuild from the live entries
+            self._expiries = [(entry[0], entry_key) for entry_key, entry in self._entries.items()]
+            heapq.heapify(self._expiries)
+
+        while len(self._entries) > self.max_entries:
+            evicted, _ = self._entries.popitem(last=False)
+            self._vectors.remove(evicted)
+            self.evictions += 1
+
+    async def get(self, claim: str) -> Optional[dict]:
+        """
+        Looks up a claim: exact local key, then the shared backend, then a
+        near-duplicate scan of local entries.
+
+        Args:
+            claim: Extracted claim text
+
+        Returns:
+            Cached value, or None on a miss
+        """
+        key = self.make_key(claim)
+        if not key:
+            return None
+
+        now = time.monotonic()
+        self._purge_expired(now)
+
+        matched_key = key if key in self._entries else None
+
+        if matched_key is None:
+            shared = await get_cache().get(make_key("verdict", key))
+            # Entries written before expires_at was stored get at most one local TTL
+            remaining = shared.get("expires_at", time.time() + self.ttl_seconds) - time.time() if shared else 0.0
+            if shared is not None and remaining > 0:
+                self.shared_hits += 1
+                self._store_local(key, shared["value"], shared["compute_seconds"], min(remaining, self.ttl_seconds))
+                self.latency_saved_seconds += shared["compute_seconds"]
+                return shared["value"]
+
+            matched_key = self._find_near_duplicate(key)
+
+        if matched_key is None:
+            self.misses += 1
+            return None
+
+        if matched_key == key:
+            self.exact_hits += 1
+        else:
+            self.near_hits += 1
+
+        self._entries.move_to_end(matched_key)
+        _, value, compute_seconds = self._entries[matched_key]
+        self.latency_saved_seconds += compute_seconds
+        return value
+
+    async def set(self, claim: str, value: dict, compute_seconds: float = 0.0):
+        """
+        Stores a value for a claim.
+
+        Args:
+            claim: Extracted claim text
+            value: Pipeline output to reuse
+            compute_seconds: How long producing the value took (for latency-saved metrics)
+        """
+        key = self.make_key(claim)
+        if not key:
+            return
+
+        self._store_local(key, value, compute_seconds)
+        ttl = min(self.ttl_seconds, CACHE_VERDICT_TTL)
+        await get_cache().set(
+            make_key("verdict", key),
+            {"value": value, "compute_seconds": compute_seconds, "expires_at": time.time() + ttl},
+            ttl
+        )
+
+    def clear(self):
+        self._entries.clear()
+        self._expiries = []
+        self._vectors.clear()
+
+    def stats(self) -> dict:
+        hits = self.exact_hits + self.near_hits + self.shared_hits
+        lookups = hits + self.misses
+        return {
+            "enabled": VERDICT_CACHE_ENABLED,
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            "similarity_threshold": self.similarity_threshold,
+            "vector_index": self._vectors.stats(),
+            "exact_hits": self.exact_hits,
+            "near_duplicate_hits": self.near_hits,
+            "shared_backend_hits": self.shared_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(hits / lookups, 3) if lookups else 0.0,
+            "latency_saved_seconds": round(self.latency_saved_seconds, 3)
+        }
+
+
+verdict_cache = VerdictCache()
@@ -0,0 +1,120 @@
+"""
+Claim matching benchmark: pairwise hybrid_similarity scan vs ClaimVectorIndex.
+
+Builds N synthetic claims from a topical vocabulary (subjects, events,
+places, numbers) and queries reworded copies of random entries: a word
+dropped, a word replaced, a typo. Reports per-query latency and recall@5
+(the reworded claim's original is among the top 5) for:
+
+- pairwise: hybrid_similarity against every entry (what the verdict cache
+  used to do), measured on --pairwise-size entries and extrapolated to N
+- exact: the vector index scanning all N embeddings
+- ivf: the vector index with its inverted file (exact_max below N)
+
+Usage (from backend/):
+    python -m benchmarks.bench_claim_index --claims 200000 --queries 200
+"""
+
+import argparse
+import random
+import time
+
+from app.utils.claim_index import ClaimVectorIndex
+from app.utils.similarity import hybrid_similarity
+
+SUBJECTS = [
+    "government", "RBI", "WHO", "Election Commission", "Supreme Court", "railways", "army", "ISRO",
+    "chief minister", "prime minister", "police", "hospital", "university", "bank", "airline", "court"
+]
+EVENTS = [
+    "will ban", "has approved", "announced free", "cancelled", "is distributing", "arrested", "shut down",
+    "will deposit", "has privatised", "is recalling", "will scrap", "launched", "exposed", "denied"
+]
+OBJECTS = [
+    "2000 rupee notes", "cash withdrawals", "mobile recharge", "petrol subsidy", "exam results", "train tickets",
+    "covid vaccines", "ration cards", "voter ids", "pension payments", "gas cylinders", "internet access",
+    "school fees", "farm loans", "bank accounts", "WhatsApp messages", "bridge", "temple", "stadium"
+]
+PLACES = [
+    "Delhi", "Mumbai", "Bihar", "Kerala", "Assam", "Punjab", "Gujarat", "Chennai", "Kolkata", "Lucknow",
+    "Hyderabad", "Odisha", "Rajasthan", "Goa", "Manipur", "Bengaluru"
+]
+FILLERS = ["from next month", "for all citizens", "starting today", "after midnight", "this week", "in a viral video"]
+
+
+def make_claim(rng: random.Random) -> str:
+    return (
+        f"{rng.choice(SUBJECTS)} {rng.choice(EVENTS)} {rng.choice(OBJECTS)} in {rng.choice(PLACES)} "
+        f"{rng.choice(FILLERS)} for {rng.randint(1, 5000)} people"
+    )
+
+
+def reword(claim: str, rng: random.Random) -> str:
+    # Numbers are kept: many synthetic claims differ only in their number
+    words = claim.split()
+    editable = lambda: rng.choice([i for i, word in enumerate(words) if not word.isdigit()])
+    del words[editable()]
+    words[editable()] = rng.choice(["reportedly", "officially", "secretly", "now"])
+    position = editable()
+    if len(words[position]) > 3:
+        words[position] = words[position][:-1]
+    return " ".join(words)
+
+
+def percentile(samples: list, fraction: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def run_pairwise(claims: list, queries: list) -> tuple:
+    latencies, hits = [], 0
+    for target, query in queries:
+        started = time.perf_counter()
+        scores = sorted(((hybrid_similarity(query, claim), i) for i, claim in enumerate(claims)), reverse=True)[:5]
+        latencies.append(time.perf_counter() - started)
+        hits += any(i == target for _, i in scores)
+    return latencies, hits / len(queries)
+
+
+def run_index(index: ClaimVectorIndex, queries: list) -> tuple:
+    latencies, hits = [], 0
+    for target, query in queries:
+        started = time.perf_counter()
+        results = index.search(query, k=5)
+        latencies.append(time.perf_counter() - started)
+        hits += any(key == str(target) for _, key, _ in results)
+    return latencies, hits / len(queries)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--claims", type=int, default=200000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--pairwise-size", type=int, default=2000)
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    claims = [make_claim(rng) for _ in range(args.claims)]
+
+    print(f"{'method':<10}{'entries':>10}{'build s':>10}{'p50 ms':>10}{'p95 ms':>10}{'recall@5':>10}")
+
+    pairwise_claims = claims[:args.pairwise_size]
+    queries = [(i, reword(pairwise_claims[i], rng)) for i in rng.sample(range(len(pairwise_claims)), min(args.queries, 50))]
+    latencies, recall = run_pairwise(pairwise_claims, queries)
+    scale = args.claims / len(pairwise_claims)
+    print(f"{'pairwise':<10}{len(pairwise_claims):>10}{0:>10.1f}{percentile(latencies, 0.5) * 1000:>10.1f}{percentile(latencies, 0.95) * 1000:>10.1f}{recall:>10.2f}")
+    print(f"{'  (x' + format(scale, '.0f') + ')':<10}{args.claims:>10}{'':>10}{percentile(latencies, 0.5) * scale * 1000:>10.0f}{'':>10}{'':>10}")
+
+    queries = [(i, reword(claims[i], rng)) for i in rng.sample(range(args.claims), args.queries)]
+    for name, exact_max in (("exact", args.claims + 1), ("ivf", args.claims // 4)):
+        index = ClaimVectorIndex(exact_max=exact_max)
+        started = time.perf_counter()
+        for i, claim in enumerate(claims):
+            index.add(str(i), claim)
+        build = time.perf_counter() - started
+        latencies, recall = run_index(index, queries)
+        print(f"{name:<10}{args.claims:>10}{build:>10.1f}{percentile(latencies, 0.5) * 1000:>10.2f}{percentile(latencies, 0.95) * 1000:>10.2f}{recall:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
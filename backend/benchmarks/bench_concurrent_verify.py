@@ -0,0 +1,89 @@
+"""
+Concurrent /api/verify throughput against a fake Gemini model.
+
+Compares the old behaviour (blocking `generate_content` called inside the
+coroutine) with the shared LLM client in native-async and executor modes.
+All source tools are replaced with canned async fakes.
+
+Usage (from backend/):
+    python -m benchmarks.bench_concurrent_verify --requests 40 --concurrency 20 --latency 0.2
+"""
+
+import argparse
+import asyncio
+import time
+
+import httpx
+
+from app.agents import pipeline, verification_agent
+from app.main import app
+from app.utils import llm_client
+from app.utils.llm_client import LLMClient, set_llm_client
+from benchmarks.fakes import FakeGeminiModel, fake_source
+
+
+class BlockingLLMClient(LLMClient):
+    """Reproduces the pre-client behaviour: sync SDK call on the event loop."""
+
+    async def generate(self, prompt: str, response_schema=None):
+        return self.model.generate_content(prompt)
+
+
+def install_fake_sources():
+    verification_agent.search_fact_check_api = fake_source("factcheck", key="claims")
+    verification_agent.search_google = fake_source("google")
+    verification_agent.search_all_indian_factcheckers = fake_source("indian")
+    verification_agent.scrape_news_search = fake_source("duckduckgo")
+    verification_agent.scrape_news_api = fake_source("newsapi")
+
+
+async def run_load(total: int, concurrency: int) -> float:
+    transport = httpx.ASGITransport(app=app)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+        async def one(i: int):
+            async with semaphore:
+                response = await client.post(
+                    "/api/verify",
+                    json={"claim": f"Benchmark claim number {i} about free internet"}
+                )
+                response.raise_for_status()
+
+        start = time.perf_counter()
+        await asyncio.gather(*(one(i) for i in range(total)))
+        return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=40)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--latency", type=float, default=0.2, help="Fake Gemini latency in seconds")
+    parser.add_argument("--workers", type=int, default=8, help="Executor-mode thread pool size")
+    args = parser.parse_args()
+
+    install_fake_sources()
+    # Benchmark claims are near-duplicates and every mode replays the same
+    # prompts; measure the uncached pipeline
+    pipeline.VERDICT_CACHE_ENABLED = False
+    llm_client.LLM_CACHE_ENABLED = False
+    llm_client.LLM_GOVERNOR_ENABLED = False
+
+    clients = {
+        "blocking (old)": BlockingLLMClient(FakeGeminiModel(args.latency)),
+        "native async": LLMClient(FakeGeminiModel(args.latency), mode="async"),
+        "executor": LLMClient(FakeGeminiModel(args.latency), mode="executor", max_workers=args.workers),
+    }
+
+    print(f"{args.requests} requests, concurrency {args.concurrency}, fake Gemini latency {args.latency}s")
+    print(f"{'mode':<16}{'elapsed (s)':>14}{'req/s':>10}")
+    for name, client in clients.items():
+        set_llm_client(client)
+        elapsed = asyncio.run(run_load(args.requests, args.concurrency))
+        print(f"{name:<16}{elapsed:>14.2f}{args.requests / elapsed:>10.2f}")
+    set_llm_client(None)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Three-call vs fused analysis benchmark.
+
+Runs the pipeline against a fake Gemini model (fixed latency per call plus
+a per-output-token cost) and canned sources, once with the default
+extract -> analyze -> explain path and once with FUSED_ANALYSIS. Reports
+p50/p95 end-to-end latency, Gemini calls and prompt/output tokens per
+request. Token counts come from the real prompts the agents build.
+
+Usage (from backend/):
+    python -m benchmarks.bench_fused --requests 40 --latency 0.4 --token-latency 0.004
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from app.agents import pipeline
+from app.utils import llm_client
+from app.utils.llm_client import LLMClient, set_llm_client, llm_usage_stats
+from benchmarks.bench_concurrent_verify import install_fake_sources
+from benchmarks.fakes import FakeGeminiModel
+
+
+def percentile(samples: list, fraction: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+async def run_mode(fused: bool, requests: int) -> dict:
+    pipeline.FUSED_ANALYSIS = fused
+    before = llm_usage_stats()["totals"]
+
+    latencies = []
+    for i in range(requests):
+        started = time.perf_counter()
+        await pipeline.run_pipeline(f"Viral message number {i} says the government will ban all cash by next month")
+        latencies.append(time.perf_counter() - started)
+
+    after = llm_usage_stats()["totals"]
+    used = {name: after.get(name, 0) - before.get(name, 0) for name in ("calls", "prompt_tokens", "output_tokens")}
+    return {
+        "p50": percentile(latencies, 0.5),
+        "p95": percentile(latencies, 0.95),
+        "mean": statistics.mean(latencies),
+        **{name: value / requests for name, value in used.items()}
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=40)
+    parser.add_argument("--latency", type=float, default=0.4, help="Fake Gemini seconds per call")
+    parser.add_argument("--token-latency", type=float, default=0.004, help="Fake Gemini seconds per output token")
+    args = parser.parse_args()
+
+    pipeline.VERDICT_CACHE_ENABLED = False
+    llm_client.LLM_CACHE_ENABLED = False
+    install_fake_sources()
+    set_llm_client(LLMClient(FakeGeminiModel(args.latency, args.token_latency), mode="async"))
+
+    print(f"{'mode':<12}{'p50 s':>8}{'p95 s':>8}{'calls':>8}{'prompt tok':>12}{'output tok':>12}")
+    for name, fused in (("three-call", False), ("fused", True)):
+        result = asyncio.run(run_mode(fused, args.requests))
+        print(
+            f"{name:<12}{result['p50']:>8.2f}{result['p95']:>8.2f}{result['calls']:>8.1f}"
+            f"{result['prompt_tokens']:>12.0f}{result['output_tokens']:>12.0f}"
+        )
+
+    set_llm_client(None)
+
+
+if __name__ == "__main__":
+    main()
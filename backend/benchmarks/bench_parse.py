@@ -0,0 +1,135 @@
+"""
+HTML parse benchmark over saved fixtures for every scraped source.
+
+Compares the original path (BeautifulSoup + html.parser + find_all) with
+the parsing layer in app.tools.html_parser (lxml with compiled CSS
+selectors, and its BeautifulSoup fallback). Reports median parse time per
+page, peak and retained Python-heap memory per parse (tracemalloc), and
+checks that every backend extracts the same records.
+
+tracemalloc only sees Python allocations: libxml2's own buffers are not
+counted for the lxml backend, and BeautifulSoup trees stay "retained" until
+the cyclic garbage collector frees them.
+
+Usage (from backend/):
+    python -m benchmarks.bench_parse --iterations 50
+"""
+
+import argparse
+import statistics
+import time
+import tracemalloc
+from pathlib import Path
+
+from bs4 import BeautifulSoup
+
+from app.tools.html_parser import parse_results, LXML_AVAILABLE
+
+FIXTURES = Path(__file__).parent / "fixtures" / "html"
+
+# Source key -> fixture file
+PAGES = {
+    "pib_factcheck": "pib.html",
+    "altnews": "altnews.html",
+    "boom": "boom.html",
+    "factly": "factly.html",
+    "vishvas": "vishvas.html",
+    "duckduckgo": "duckduckgo.html",
+}
+
+# The find_all calls the scrapers used before the parsing layer
+LEGACY_RULES = {
+    "pib_factcheck": (("article", {"class_": "post"}, 3), ("h2", {"class_": "entry-title"}), ("div", {"class_": "entry-content"}), 200),
+    "altnews": (("article", {}, 3), ("h3", {"class_": "entry-title"}), ("div", {"class_": "entry-content"}), 200),
+    "boom": (("div", {"class_": "story-card"}, 3), ("h2", {"class_": "story-card__title"}), ("p", {"class_": "story-card__description"}), None),
+    "factly": (("article", {}, 3), ("h2", {"class_": "entry-title"}), ("div", {"class_": "entry-summary"}), 200),
+    "vishvas": (("article", {}, 3), ("h2", {}), ("div", {"class_": "entry-content"}), 200),
+    "duckduckgo": (("div", {"class_": "result"}, 5), ("a", {"class_": "result__a"}), ("a", {"class_": "result__snippet"}), None),
+}
+
+
+def legacy_parse(source: str, html: str) -> list:
+    (item_tag, item_attrs, limit), (title_tag, title_attrs), (snippet_tag, snippet_attrs), chars = LEGACY_RULES[source]
+    soup = BeautifulSoup(html, "html.parser")
+
+    records = []
+    for item in soup.find_all(item_tag, limit=limit, **item_attrs):
+        title_el = item.find(title_tag, **title_attrs)
+        if source == "boom":
+            link_el = item.find("a", class_="story-card__url")
+        elif source == "duckduckgo":
+            link_el = title_el
+        else:
+            link_el = title_el.find("a") if title_el else None
+        if not (title_el and link_el):
+            continue
+
+        snippet_el = item.find(snippet_tag, **snippet_attrs)
+        snippet = snippet_el.get_text(strip=True) if snippet_el else ""
+        record = {
+            "title": title_el.get_text(strip=True),
+            "url": link_el.get("href", ""),
+            "snippet": snippet[:chars] if chars else snippet,
+        }
+        if source == "duckduckgo":
+            url_el = item.find("a", class_="result__url")
+            record["displayLink"] = url_el.get_text(strip=True) if url_el else ""
+        records.append(record)
+    return records
+
+
+def measure(parse, iterations: int):
+    timings = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        records = parse()
+        timings.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    parse()
+    current, peak = tracemalloc.get_traced_memory()
+    snapshot = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    allocated = sum(stat.size for stat in snapshot.statistics("filename"))
+
+    return records, statistics.median(timings), peak, allocated
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=50)
+    args = parser.parse_args()
+
+    backends = {"legacy bs4": None, "bs4 fallback": "bs4"}
+    if LXML_AVAILABLE:
+        backends["lxml"] = "lxml"
+
+    print(f"{'source':<15}{'backend':<14}{'size KB':>9}{'median ms':>11}{'peak KB':>10}{'retained KB':>13}{'records':>9}")
+    for source, filename in PAGES.items():
+        html = (FIXTURES / filename).read_text(encoding="utf-8")
+        html_bytes = html.encode("utf-8")
+        reference = None
+
+        for name, backend in backends.items():
+            if backend is None:
+                parse = lambda: legacy_parse(source, html)
+            elif backend == "lxml":
+                parse = lambda: parse_results(source, html_bytes, backend="lxml")
+            else:
+                parse = lambda: parse_results(source, html, backend="bs4")
+
+            records, median, peak, allocated = measure(parse, args.iterations)
+            if reference is None:
+                reference = records
+            # The legacy scrapers did not read publication dates
+            elif [{k: v for k, v in record.items() if k != "date"} for record in records] != reference:
+                print(f"  !! {name} output differs from legacy parser for {source}")
+
+            print(
+                f"{source:<15}{name:<14}{len(html_bytes) / 1024:>9.1f}{median * 1000:>11.2f}"
+                f"{peak / 1024:>10.1f}{allocated / 1024:>13.1f}{len(records):>9}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Event-loop stall benchmark for HTML parsing.
+
+Parses the saved fixtures concurrently, either inline on the event loop or
+through app.tools.parse_pool, while a heartbeat task ticks every
+millisecond. Reports throughput and the worst heartbeat delay, i.e. how
+long network I/O for other requests would have been stalled, plus the
+pool's queue-wait and parse-time percentiles.
+
+Usage (from backend/):
+    python -m benchmarks.bench_parse_pool --pages 400 --workers 4
+"""
+
+import argparse
+import asyncio
+import itertools
+import time
+
+from app.tools.html_parser import parse_results
+from app.tools.parse_pool import ParsePool
+from benchmarks.bench_parse import FIXTURES, PAGES
+
+
+async def heartbeat(stop: asyncio.Event, delays: list):
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(0.001)
+        delays.append(time.perf_counter() - started - 0.001)
+
+
+async def run(pages, pool):
+    async def parse(source, html):
+        if pool is None:
+            return parse_results(source, html)
+        return await pool.parse(source, html)
+
+    stop = asyncio.Event()
+    delays = []
+    ticker = asyncio.create_task(heartbeat(stop, delays))
+    await asyncio.sleep(0.01)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(parse(source, html) for source, html in pages))
+    elapsed = time.perf_counter() - started
+
+    stop.set()
+    await ticker
+    return elapsed, max(delays, default=0.0)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--pages", type=int, default=400)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    fixtures = [(source, (FIXTURES / name).read_bytes()) for source, name in PAGES.items()]
+    pages = list(itertools.islice(itertools.cycle(fixtures), args.pages))
+
+    elapsed, stall = asyncio.run(run(pages, None))
+    print(f"inline        {len(pages) / elapsed:>8.0f} pages/s   max loop stall {stall * 1000:>8.1f} ms")
+
+    pool = ParsePool(workers=args.workers, max_pending=len(pages))
+    try:
+        # Warm the worker processes so start-up is not counted
+        asyncio.run(run(fixtures * args.workers, pool))
+        elapsed, stall = asyncio.run(run(pages, pool))
+    finally:
+        pool.shutdown()
+    print(f"pool ({args.workers} procs){len(pages) / elapsed:>8.0f} pages/s   max loop stall {stall * 1000:>8.1f} ms")
+
+    stats = pool.stats()
+    print(f"queue wait ms {stats['queue_wait_ms']}   parse ms {stats['parse_ms']}")
+
+
+if __name__ == "__main__":
+    main()
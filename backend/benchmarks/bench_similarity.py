@@ -0,0 +1,116 @@
+"""
+Similarity benchmark: per-pair functions vs the batch scoring APIs.
+
+Scores synthetic claims (bench_claim_index's generator) three ways:
+
+- one-vs-many: one query against N candidates, jaccard_similarity /
+  hybrid_similarity per pair vs jaccard_one_to_many, cosine_one_to_many
+  and most_similar(metric="hybrid"), on raw texts and on a prebuilt
+  SimilarityCorpus (candidates tokenized once, reused across queries)
+- many-vs-many: M queries against N candidates, jaccard_similarity per
+  pair vs jaccard_matrix
+- group_duplicates over M texts (the batch pipeline's dedupe)
+
+Also reports the largest difference between the per-pair and batch Jaccard
+scores, and whether most_similar returns the same top-5 as a full
+hybrid_similarity scan (the default shortlist is approximate; shortlist=0 is exact).
+
+Usage (from backend/):
+    python -m benchmarks.bench_similarity --candidates 1000 10000 --queries 200
+"""
+
+import argparse
+import random
+import time
+
+import numpy as np
+
+from app.agents.batch_pipeline import group_duplicates
+from app.utils.similarity import (
+    cosine_one_to_many,
+    hybrid_similarity,
+    jaccard_matrix,
+    jaccard_one_to_many,
+    jaccard_similarity,
+    most_similar,
+    SimilarityCorpus,
+)
+from benchmarks.bench_claim_index import make_claim, reword
+
+
+def timed(function, repeat: int = 3):
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = function()
+        best = min(best, time.perf_counter() - started)
+    return best, result
+
+
+def row(name: str, size: str, seconds: float, baseline: float = None, note: str = ""):
+    speedup = f"{baseline / seconds:.0f}x" if baseline else ""
+    print(f"{name:<28}{size:>14}{seconds * 1000:>12.1f}{speedup:>10}  {note}")
+
+
+def one_vs_many(claims: list, query: str):
+    size = str(len(claims))
+    pair_jaccard, expected = timed(lambda: [jaccard_similarity(query, claim) for claim in claims], 1)
+    batch_jaccard, scores = timed(lambda: jaccard_one_to_many(query, claims))
+    row("jaccard per pair", size, pair_jaccard)
+    row("jaccard_one_to_many", size, batch_jaccard, pair_jaccard, f"max diff {np.max(np.abs(scores - expected)):.1e}")
+
+    batch_cosine, _ = timed(lambda: cosine_one_to_many(query, claims))
+    row("cosine_one_to_many", size, batch_cosine, pair_jaccard)
+
+    build, corpus = timed(lambda: SimilarityCorpus(claims), 1)
+    row("SimilarityCorpus build", size, build)
+    corpus_jaccard, scores = timed(lambda: corpus.jaccard(query))
+    row("  corpus.jaccard", size, corpus_jaccard, pair_jaccard, f"max diff {np.max(np.abs(scores - expected)):.1e}")
+    corpus_cosine, _ = timed(lambda: corpus.cosine(query))
+    row("  corpus.cosine", size, corpus_cosine, pair_jaccard)
+
+    pair_hybrid, ranked = timed(lambda: sorted(((hybrid_similarity(query, claim), i) for i, claim in enumerate(claims)), key=lambda pair: (-pair[0], pair[1]))[:5], 1)
+    batch_hybrid, top = timed(lambda: most_similar(query, claims, k=5, metric="hybrid"))
+    corpus_hybrid, corpus_top = timed(lambda: most_similar(query, corpus, k=5, metric="hybrid"))
+    expected_top = [i for _, i in ranked]
+    row("hybrid per pair (top 5)", size, pair_hybrid)
+    row("most_similar hybrid", size, batch_hybrid, pair_hybrid, f"same top 5: {[i for i, _ in top] == expected_top}")
+    row("  on corpus", size, corpus_hybrid, pair_hybrid, f"same top 5: {[i for i, _ in corpus_top] == expected_top}")
+    exact_hybrid, exact_top = timed(lambda: most_similar(query, corpus, k=5, metric="hybrid", shortlist=0), 1)
+    row("  exact (shortlist=0)", size, exact_hybrid, pair_hybrid, f"same top 5: {[i for i, _ in exact_top] == expected_top}")
+
+
+def many_vs_many(queries: list, claims: list):
+    size = f"{len(queries)}x{len(claims)}"
+    pair, expected = timed(lambda: [[jaccard_similarity(query, claim) for claim in claims] for query in queries], 1)
+    batch, scores = timed(lambda: jaccard_matrix(queries, claims))
+    row("jaccard per pair", size, pair)
+    row("jaccard_matrix", size, batch, pair, f"max diff {np.max(np.abs(scores - np.array(expected))):.1e}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--candidates", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--queries", type=int, default=200)
+    args = parser.parse_args()
+
+    rng = random.Random(11)
+    print(f"{'method':<28}{'size':>14}{'ms':>12}{'speedup':>10}")
+
+    for count in args.candidates:
+        claims = [make_claim(rng) for _ in range(count)]
+        one_vs_many(claims, reword(rng.choice(claims), rng))
+
+    claims = [make_claim(rng) for _ in range(min(args.candidates))]
+    many_vs_many([reword(rng.choice(claims), rng) for _ in range(args.queries)], claims)
+
+    # Batch of messages where a third are reworded repeats
+    texts = [make_claim(rng) for _ in range(args.queries)]
+    texts += [reword(rng.choice(texts), rng) for _ in range(args.queries // 2)]
+    started = time.perf_counter()
+    owners = group_duplicates(texts)
+    row("group_duplicates", str(len(texts)), time.perf_counter() - started, note=f"{len(set(owners))} groups")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,259 @@
+"""
+Offline load test of /api/verify against local stand-ins for every external service.
+
+Starts a FakeSourceServer that serves the saved HTML/JSON fixtures for PIB,
+Alt News, BOOM, Factly, Vishvas News, DuckDuckGo, NewsAPI and both Google
+APIs with configurable latency and error rates, and points the tools at it
+through the <SOURCE>_BASE_URL overrides. Gemini is replaced with
+FakeGeminiModel (configurable latency and 429 rate). The app runs under
+uvicorn on a real socket in a background thread, so requests go through the
+full HTTP stack, and the load generator drives it at fixed concurrency from
+the main thread.
+
+Reports throughput, p50/p95/p99 end-to-end latency, status codes, the
+per-stage breakdown each response returns with include_timings, and the
+requests each fake source received. Nothing leaves the machine.
+
+Environment variables set before running (e.g. FUSED_ANALYSIS=true,
+CACHE_BACKEND=sqlite) are honoured; the harness only forces the source
+URLs and API keys, and by default disables the fact-check harvester and
+index so every claim reaches the scrapers. The Gemini governor limits
+(LLM_RPM, LLM_MAX_CONCURRENCY, ...) apply to the fake model as configured,
+so raise them to measure the rest of the pipeline.
+
+Usage (from backend/):
+    python -m benchmarks.loadtest --requests 200 --concurrency 20
+    python -m benchmarks.loadtest --source-latency 0.3 --source-error-rate 0.05 --slow boom=2 --gemini-latency 0.5
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import statistics
+import threading
+import time
+from collections import Counter, defaultdict
+
+import httpx
+
+from benchmarks.fakes import FakeGeminiModel, FakeSourceServer, SourceBehaviour, SOURCE_FIXTURES
+
+STATES = ["Kerala", "Bihar", "Punjab", "Assam", "Gujarat", "Odisha", "Goa", "Sikkim", "Tripura", "Haryana"]
+ITEMS = ["laptops", "bicycles", "smartphones", "gas cylinders", "solar panels", "scooters", "ration kits"]
+GROUPS = ["students", "farmers", "pensioners", "voters", "women", "families"]
+
+
+def make_claim(rng: random.Random, number: int) -> str:
+    """A distinct claim; the number keeps near-identical wordings apart in the verdict cache."""
+    return (
+        f"Viral message says the {rng.choice(STATES)} government will give {number} free "
+        f"{rng.choice(ITEMS)} to {rng.choice(GROUPS)} from next month"
+    )
+
+
+def percentile(samples: list, fraction: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))] if ordered else 0.0
+
+
+class LoopThread:
+    """Runs an event loop in a daemon thread."""
+
+    def __init__(self, name: str):
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self.loop.run_forever, name=name, daemon=True)
+        self._thread.start()
+
+    def run(self, coro, timeout: float = 30):
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result(timeout)
+
+    def stop(self):
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join(5)
+
+
+class AppServer:
+    """uvicorn serving app.main:app on an ephemeral port in a background thread."""
+
+    def __init__(self, app):
+        import uvicorn
+
+        self._socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._socket.bind(("127.0.0.1", 0))
+        self.url = f"http://127.0.0.1:{self._socket.getsockname()[1]}"
+        self.server = uvicorn.Server(uvicorn.Config(app, log_level="warning", lifespan="on", access_log=False))
+        self._thread = threading.Thread(
+            target=lambda: asyncio.run(self.server.serve(sockets=[self._socket])), name="uvicorn", daemon=True
+        )
+
+    def start(self, timeout: float = 30):
+        self._thread.start()
+        deadline = time.monotonic() + timeout
+        while not self.server.started:
+            if time.monotonic() > deadline or not self._thread.is_alive():
+                raise RuntimeError("uvicorn did not start")
+            time.sleep(0.05)
+
+    def stop(self):
+        self.server.should_exit = True
+        self._thread.join(30)
+
+
+def configure_environment(sources: FakeSourceServer):
+    """Points every tool at the fake server; must run before app modules are imported."""
+    os.environ.update(sources.environment())
+    for key in ("GEMINI_API_KEY", "GOOGLE_SEARCH_API_KEY", "GOOGLE_FACT_CHECK_API_KEY", "NEWS_API_KEY"):
+        os.environ[key] = "loadtest"
+    os.environ.setdefault("GOOGLE_SEARCH_ENGINE_ID", "loadtest")
+    os.environ.setdefault("FACTCHECK_HARVEST_ENABLED", "false")
+    os.environ.setdefault("FACTCHECK_INDEX_ENABLED", "false")
+    os.environ.setdefault("CACHE_BACKEND", "memory")
+    os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+
+async def drive(url: str, claims: list, concurrency: int) -> list:
+    """Sends every claim to /api/verify with at most `concurrency` in flight; returns (seconds, status, timings)."""
+    semaphore = asyncio.Semaphore(concurrency)
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=url, timeout=300, limits=limits) as client:
+        async def one(claim: str):
+            async with semaphore:
+                started = time.perf_counter()
+                try:
+                    response = await client.post("/api/verify", json={"claim": claim, "include_timings": True})
+                    timings = response.json().get("timings") if response.status_code == 200 else None
+                    return time.perf_counter() - started, response.status_code, timings or {}
+                except httpx.HTTPError as e:
+                    return time.perf_counter() - started, type(e).__name__, {}
+
+        return await asyncio.gather(*(one(claim) for claim in claims))
+
+
+def summarize(samples: list, elapsed: float, sources: FakeSourceServer, model: FakeGeminiModel) -> dict:
+    latencies = [seconds for seconds, _, _ in samples]
+    stages = defaultdict(list)
+    for _, _, timings in samples:
+        for name, milliseconds in timings.items():
+            stages[name].append(milliseconds)
+    return {
+        "requests": len(samples),
+        "elapsed_s": round(elapsed, 2),
+        "throughput_rps": round(len(samples) / elapsed, 2) if elapsed else 0.0,
+        "latency_ms": {
+            "p50": round(percentile(latencies, 0.5) * 1000, 1),
+            "p95": round(percentile(latencies, 0.95) * 1000, 1),
+            "p99": round(percentile(latencies, 0.99) * 1000, 1),
+            "mean": round(statistics.fmean(latencies) * 1000, 1) if latencies else 0.0,
+        },
+        "status": dict(Counter(str(status) for _, status, _ in samples)),
+        "stages_ms": {
+            name: {
+                "count": len(values),
+                "p50": round(percentile(values, 0.5), 1),
+                "p95": round(percentile(values, 0.95), 1),
+                "p99": round(percentile(values, 0.99), 1),
+            }
+            for name, values in sorted(stages.items())
+        },
+        "source_requests": dict(sources.requests),
+        "source_errors": {source: count for source, count in sources.errors.items() if count},
+        "gemini_calls": model.calls,
+        "gemini_errors": model.errors,
+    }
+
+
+def print_report(report: dict):
+    latency = report["latency_ms"]
+    print(f"{report['requests']} requests in {report['elapsed_s']}s: {report['throughput_rps']} req/s")
+    print(f"latency ms  p50 {latency['p50']}  p95 {latency['p95']}  p99 {latency['p99']}  mean {latency['mean']}")
+    print(f"status      {report['status']}")
+    print(f"\n{'stage':<36}{'count':>7}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+    for name, stage in report["stages_ms"].items():
+        print(f"{name:<36}{stage['count']:>7}{stage['p50']:>10}{stage['p95']:>10}{stage['p99']:>10}")
+    print(f"\nsource requests  {report['source_requests']}")
+    if report["source_errors"]:
+        print(f"injected errors  {report['source_errors']}")
+    print(f"gemini calls     {report['gemini_calls']} ({report['gemini_errors']} injected 429s)")
+
+
+def parse_slow(values: list) -> dict:
+    slow = {}
+    for value in values:
+        source, _, seconds = value.partition("=")
+        if source not in SOURCE_FIXTURES or not seconds:
+            raise SystemExit(f"--slow expects SOURCE=SECONDS with SOURCE one of {', '.join(SOURCE_FIXTURES)}")
+        slow[source] = float(seconds)
+    return slow
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=100)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--warmup", type=int, default=5, help="Requests sent before measuring")
+    parser.add_argument("--distinct", type=int, default=0, help="Distinct claims cycled through (0: every request distinct)")
+    parser.add_argument("--source-latency", type=float, default=0.2, help="Fake source latency in seconds")
+    parser.add_argument("--source-jitter", type=float, default=0.5, help="Random extra latency, fraction of --source-latency")
+    parser.add_argument("--source-error-rate", type=float, default=0.0, help="Probability of a 503 from a source")
+    parser.add_argument("--slow", action="append", default=[], metavar="SOURCE=SECONDS", help="Latency override for one source")
+    parser.add_argument("--gemini-latency", type=float, default=0.4, help="Fake Gemini latency per call in seconds")
+    parser.add_argument("--gemini-token-latency", type=float, default=0.0, help="Extra fake Gemini seconds per output token")
+    parser.add_argument("--gemini-error-rate", type=float, default=0.0, help="Probability of a 429 from Gemini")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args()
+
+    default = SourceBehaviour(args.source_latency, args.source_jitter, args.source_error_rate)
+    behaviours = {
+        source: SourceBehaviour(latency, args.source_jitter, args.source_error_rate)
+        for source, latency in parse_slow(args.slow).items()
+    }
+    sources = FakeSourceServer(behaviours, default, seed=args.seed)
+    source_loop = LoopThread("fake-sources")
+    source_loop.run(sources.start())
+    configure_environment(sources)
+
+    # Imported only now: the app reads its configuration at import time
+    from app.main import app
+    from app.utils.llm_client import LLMClient, set_llm_client
+
+    model = FakeGeminiModel(args.gemini_latency, args.gemini_token_latency, args.gemini_error_rate, seed=args.seed)
+    set_llm_client(LLMClient(model=model))
+    server = AppServer(app)
+    server.start()
+
+    rng = random.Random(args.seed)
+    pool = [make_claim(rng, number) for number in range(args.distinct or args.warmup + args.requests)]
+    claims = [pool[i % len(pool)] for i in range(args.warmup + args.requests)]
+    try:
+        if args.warmup:
+            asyncio.run(drive(server.url, claims[:args.warmup], args.concurrency))
+        for counts in (sources.requests, sources.errors):
+            for source in counts:
+                counts[source] = 0
+        model.calls = model.errors = 0
+
+        started = time.perf_counter()
+        samples = asyncio.run(drive(server.url, claims[args.warmup:], args.concurrency))
+        elapsed = time.perf_counter() - started
+    finally:
+        server.stop()
+        set_llm_client(None)
+        source_loop.run(sources.stop())
+        source_loop.stop()
+
+    report = summarize(samples, elapsed, sources, model)
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print(f"concurrency {args.concurrency}, sources {args.source_latency}s (+{args.source_jitter:.0%} jitter, "
+              f"{args.source_error_rate:.0%} errors), Gemini {args.gemini_latency}s ({args.gemini_error_rate:.0%} 429s)\n")
+        print_report(report)
+
+
+if __name__ == "__main__":
+    main()
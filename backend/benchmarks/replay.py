@@ -0,0 +1,184 @@
+"""
+Replays captured traffic (TRAFFIC_CAPTURE_ENABLED) against a running instance.
+
+Reads the JSONL written by app.utils.traffic_capture and re-sends each
+claim to /api/verify at its original offset from the first request,
+divided by --speed (2 replays twice as fast; 0 sends everything at once,
+limited only by --max-in-flight). Arrival times are kept, so the bursts of
+duplicate claims a crisis produces hit the caches and the source pools the
+same way they did live.
+
+Reports throughput, p50/p95/p99 latency next to the captured latency,
+status codes, how late requests went out (client-side lag, which should
+stay near zero), duplicate share and peak arrival rate of the trace, and
+the per-stage breakdown from include_timings. Requests whose breakdown has
+no "verification" stage were answered from the verdict cache.
+
+Usage (from backend/, against e.g. `uvicorn app.main:app` or the offline
+stand-ins of benchmarks/loadtest.py):
+    python -m benchmarks.replay traffic_capture.jsonl --url http://localhost:8000 --speed 4
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from collections import Counter, defaultdict
+from typing import Optional
+
+import httpx
+
+
+def percentile(samples: list, fraction: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))] if ordered else 0.0
+
+
+def load_trace(path: str, channels: Optional[set] = None, limit: int = 0) -> list:
+    """Captured records in arrival order (optionally only some channels)."""
+    records = []
+    with open(path, encoding="utf-8") as handle:
+        for line in handle:
+            line = line.strip()
+            if not line:
+                continue
+            record = json.loads(line)
+            if record.get("claim") and (not channels or record.get("channel") in channels):
+                records.append(record)
+    records.sort(key=lambda record: record["t"])
+    return records[:limit] if limit else records
+
+
+def trace_shape(records: list) -> dict:
+    """Duplicate share and peak arrivals per second of a trace."""
+    seen, duplicates = set(), 0
+    for record in records:
+        key = record.get("claim_key") or record["claim"]
+        duplicates += key in seen
+        seen.add(key)
+    per_second = Counter(int(record["t"]) for record in records)
+    span = records[-1]["t"] - records[0]["t"] if records else 0.0
+    return {
+        "requests": len(records),
+        "distinct_claims": len(seen),
+        "duplicate_share": round(duplicates / len(records), 3) if records else 0.0,
+        "captured_span_s": round(span, 1),
+        "peak_per_second": max(per_second.values()) if per_second else 0,
+    }
+
+
+async def replay(url: str, records: list, speed: float, max_in_flight: int, timeout: float) -> list:
+    """Sends every record at its scaled offset; returns (record, seconds, status, timings, lag)."""
+    semaphore = asyncio.Semaphore(max_in_flight) if max_in_flight else None
+    limits = httpx.Limits(max_connections=max_in_flight or None, max_keepalive_connections=max_in_flight or 100)
+    first = records[0]["t"]
+
+    async with httpx.AsyncClient(base_url=url, timeout=timeout, limits=limits) as client:
+        started = time.perf_counter()
+
+        async def send(record: dict):
+            due = (record["t"] - first) / speed if speed > 0 else 0.0
+            await asyncio.sleep(max(0.0, due - (time.perf_counter() - started)))
+            if semaphore is not None:
+                await semaphore.acquire()
+            try:
+                sent = time.perf_counter()
+                lag = sent - started - due
+                try:
+                    response = await client.post("/api/verify", json={"claim": record["claim"], "include_timings": True})
+                    timings = response.json().get("timings") if response.status_code == 200 else None
+                    return record, time.perf_counter() - sent, response.status_code, timings or {}, lag
+                except httpx.HTTPError as e:
+                    return record, time.perf_counter() - sent, type(e).__name__, {}, lag
+            finally:
+                if semaphore is not None:
+                    semaphore.release()
+
+        return await asyncio.gather(*(send(record) for record in records))
+
+
+def summarize(samples: list, elapsed: float) -> dict:
+    latencies = [seconds * 1000 for _, seconds, _, _, _ in samples]
+    captured = [record["latency_ms"] for record, _, _, _, _ in samples if record.get("latency_ms") is not None]
+    lags = [lag * 1000 for _, _, _, _, lag in samples]
+    stages = defaultdict(list)
+    cache_hits = 0
+    for _, _, _, timings, _ in samples:
+        if timings and "verification" not in timings:
+            cache_hits += 1
+        for name, milliseconds in timings.items():
+            stages[name].append(milliseconds)
+    return {
+        "requests": len(samples),
+        "elapsed_s": round(elapsed, 2),
+        "throughput_rps": round(len(samples) / elapsed, 2) if elapsed else 0.0,
+        "latency_ms": {
+            "p50": round(percentile(latencies, 0.5), 1),
+            "p95": round(percentile(latencies, 0.95), 1),
+            "p99": round(percentile(latencies, 0.99), 1),
+            "mean": round(statistics.fmean(latencies), 1) if latencies else 0.0,
+        },
+        "captured_latency_ms": {
+            "p50": round(percentile(captured, 0.5), 1),
+            "p95": round(percentile(captured, 0.95), 1),
+            "p99": round(percentile(captured, 0.99), 1),
+        } if captured else None,
+        "send_lag_ms": {"p50": round(percentile(lags, 0.5), 1), "max": round(max(lags), 1) if lags else 0.0},
+        "status": dict(Counter(str(status) for _, _, status, _, _ in samples)),
+        "verdict_cache_hits": cache_hits,
+        "stages_ms": {
+            name: {"count": len(values), "p50": round(percentile(values, 0.5), 1), "p95": round(percentile(values, 0.95), 1)}
+            for name, values in sorted(stages.items())
+        },
+    }
+
+
+def print_report(shape: dict, report: dict):
+    print(
+        f"trace: {shape['requests']} requests over {shape['captured_span_s']}s, {shape['distinct_claims']} distinct claims "
+        f"({shape['duplicate_share']:.0%} duplicates), peak {shape['peak_per_second']}/s"
+    )
+    latency = report["latency_ms"]
+    print(f"\n{report['requests']} requests in {report['elapsed_s']}s: {report['throughput_rps']} req/s")
+    print(f"latency ms   p50 {latency['p50']}  p95 {latency['p95']}  p99 {latency['p99']}  mean {latency['mean']}")
+    if report["captured_latency_ms"]:
+        captured = report["captured_latency_ms"]
+        print(f"captured ms  p50 {captured['p50']}  p95 {captured['p95']}  p99 {captured['p99']}")
+    print(f"send lag ms  p50 {report['send_lag_ms']['p50']}  max {report['send_lag_ms']['max']}")
+    print(f"status       {report['status']}")
+    print(f"cache hits   {report['verdict_cache_hits']}")
+    print(f"\n{'stage':<36}{'count':>7}{'p50 ms':>10}{'p95 ms':>10}")
+    for name, stage in report["stages_ms"].items():
+        print(f"{name:<36}{stage['count']:>7}{stage['p50']:>10}{stage['p95']:>10}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("trace", nargs="?", default="traffic_capture.jsonl", help="Captured JSONL file")
+    parser.add_argument("--url", default="http://localhost:8000", help="Instance to replay against")
+    parser.add_argument("--speed", type=float, default=1.0, help="Time scale (2 = twice as fast, 0 = no delays)")
+    parser.add_argument("--max-in-flight", type=int, default=0, help="Cap on concurrent requests (0: none)")
+    parser.add_argument("--channel", action="append", help="Only replay these channels (api, api_stream, telegram)")
+    parser.add_argument("--limit", type=int, default=0, help="Replay only the first N requests")
+    parser.add_argument("--timeout", type=float, default=300)
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args()
+
+    records = load_trace(args.trace, set(args.channel or ()), args.limit)
+    if not records:
+        raise SystemExit(f"No captured requests in {args.trace}")
+
+    started = time.perf_counter()
+    samples = asyncio.run(replay(args.url, records, args.speed, args.max_in_flight, args.timeout))
+    elapsed = time.perf_counter() - started
+
+    shape, report = trace_shape(records), summarize(samples, elapsed)
+    if args.json:
+        print(json.dumps({"trace": shape, "replay": report}, indent=2))
+    else:
+        print_report(shape, report)
+
+
+if __name__ == "__main__":
+    main()